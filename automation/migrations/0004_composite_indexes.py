@@ -0,0 +1,26 @@
+# Generated by Django 5.2.18 on 2026-10-19 15:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('automation', '0003_actiontype_triggertype'),
+        ('webapp', '0016_composite_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='automationlog',
+            index=models.Index(fields=['rule', '-executed_at'], name='log_rule_executed_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='automationlog',
+            index=models.Index(fields=['-executed_at'], name='log_executed_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='automationrule',
+            index=models.Index(fields=['board', 'trigger_type', 'is_active'], name='rule_board_trigger_idx'),
+        ),
+    ]
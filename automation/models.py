@@ -60,6 +60,12 @@ class AutomationRule(models.Model):
     action_config = models.JSONField(default=dict)
     
     created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            # AutomationEngine rule lookup on every item event
+            models.Index(fields=['board', 'trigger_type', 'is_active'], name='rule_board_trigger_idx'),
+        ]
     
     def __str__(self):
         return self.name
@@ -69,3 +75,11 @@ class AutomationLog(models.Model):
     executed_at = models.DateTimeField(auto_now_add=True)
     status = models.CharField(max_length=20, choices=[('success', 'Success'), ('failed', 'Failed')])
     meta = models.JSONField(default=dict)
+
+    class Meta:
+        indexes = [
+            # Latest runs per rule (board automation history)
+            models.Index(fields=['rule', '-executed_at'], name='log_rule_executed_idx'),
+            # Latest runs overall (admin dashboard)
+            models.Index(fields=['-executed_at'], name='log_executed_idx'),
+        ]
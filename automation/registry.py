@@ -219,13 +219,13 @@ class MoveItemAction(ActionHandler):
         group_id = config.get('group_id')
         
         if group_id:
-            from webapp.models import Group
-            target_group = Group.objects.filter(id=group_id, board=rule.board).first()
-            if target_group:
+            from webapp import loaders
+            target_group = loaders.groups().load(int(group_id))
+            if target_group and target_group.board_id == rule.board_id:
                 item.group = target_group
                 item._is_automation_update = True
                 item.save()
-                print(f"[[AUTOMATION]] Moved item '{item.name}' to group '{target_group.title}'")
+                logger.info("Moved item '%s' to group '%s'", item.name, target_group.title)
 
 @AutomationRegistry.register_action
 class ChangeStatusAction(ActionHandler):
@@ -246,10 +246,9 @@ class ChangeStatusAction(ActionHandler):
         new_val = config.get('new_value')
 
         if col_id and new_val:
-            item.values[str(col_id)] = new_val
-            item._is_automation_update = True
-            item.save()
-            print(f"[[AUTOMATION]] Changed status of '{item.name}' to '{new_val}'")
+            from webapp.patching import patch_item_values
+            patch_item_values(item, {str(col_id): new_val}, automation_update=True)
+            logger.info("Changed status of '%s' to '%s'", item.name, new_val)
 
 @AutomationRegistry.register_action
 class CreateUpdateAction(ActionHandler):
@@ -274,10 +273,10 @@ class CreateUpdateAction(ActionHandler):
             
             ItemUpdate.objects.create(
                 item=item,
-                user=rule.board.created_by, # Or a system bot 
+                user_id=rule.board.created_by_id, # Or a system bot 
                 body=f"⚡ Automation: {body}"
             )
-            print(f"[[AUTOMATION]] Added update to '{item.name}'")
+            logger.info("Added update to '%s'", item.name)
 
 @AutomationRegistry.register_action
 class NotifyAction(ActionHandler):
@@ -294,7 +293,7 @@ class NotifyAction(ActionHandler):
 
         # Implementation for notification (assuming Notification model exists or just log)
         # from webapp.models import Notification
-        print(f"[[AUTOMATION]] Would notify user about {item.name}")
+        logger.info("Would notify user about %s", item.name)
 
 @AutomationRegistry.register_action
 class AssignPersonAction(ActionHandler):
@@ -313,13 +312,12 @@ class AssignPersonAction(ActionHandler):
         user_id = config.get('user_id')
         
         if user_id:
-             from core.models import User
-             user = User.objects.filter(id=user_id).first()
+             from webapp import loaders
+             user = loaders.users().load(int(user_id))
              # Find first person column
-             person_col = item.group.board.columns.filter(type='person').first()
+             person_col = next((c for c in loaders.item_columns(item) if c.type == 'person'), None)
              
              if user and person_col:
-                 item.values[str(person_col.id)] = user.username
-                 item._is_automation_update = True
-                 item.save()
-                 print(f"[[AUTOMATION]] Assigned {user.username} to {item.name}")
+                 from webapp.patching import patch_item_values
+                 patch_item_values(item, {str(person_col.id): user.username}, automation_update=True)
+                 logger.info("Assigned %s to %s", user.username, item.name)
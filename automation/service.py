@@ -1,4 +1,5 @@
 from .models import AutomationRule, AutomationLog
+from core import metrics, tracing, usage
 import logging
 
 logger = logging.getLogger(__name__)
@@ -15,34 +16,186 @@ class AutomationEngine:
         """
         from .registry import AutomationRegistry
         
-        # print(f"Checking automations for board {board.id}, trigger {trigger_code}")
-        
         # 1. Find active rules for this board and trigger
-        rules = AutomationRule.objects.filter(
+        rules = AutomationEngine._with_board(AutomationRule.objects.filter(
             board=board,
             trigger_type=trigger_code,
             is_active=True
-        )
+        ), board)
         
         # Get Handler
         trigger_handler = AutomationRegistry.get_trigger(trigger_code)
         if not trigger_handler:
-            print(f"No handler found for trigger: {trigger_code}")
+            logger.warning("No handler found for trigger: %s", trigger_code)
             return
 
+        metrics.AUTOMATION_EVENTS.inc(trigger=trigger_code)
+        allowance = usage.RunAllowance(AutomationEngine._organization_id(board, context.get('item')))
+        with tracing.span('automation.run', trigger=trigger_code, board=board.id) as span:
+            matched = 0
+            for rule in rules:
+                try:
+                    # 2. Check Condition via Handler
+                    if trigger_handler.check_condition(rule, context):
+                        if not allowance.take():
+                            logger.warning("Automation run limit reached, rule %s skipped", rule.id)
+                            continue
+                        logger.info("Rule '%s' matched, executing %s", rule.name, rule.action_type)
+                        matched += 1
+                        metrics.AUTOMATION_MATCHES.inc(trigger=trigger_code, action=rule.action_type)
+                        AutomationEngine._execute_action(rule, context)
+                        AutomationLog.objects.create(rule=rule, status='success', meta={'context': str(context)})
+                except Exception as e:
+                    logger.exception("Error running rule %s", rule.id)
+                    metrics.AUTOMATION_FAILURES.inc(trigger=trigger_code, action=rule.action_type)
+                    AutomationLog.objects.create(rule=rule, status='failed', meta={'error': str(e)})
+            allowance.commit()
+            if span is not None:
+                span.set(matched=matched)
+
+    @staticmethod
+    def run_automations_bulk(board, trigger_code, contexts, rules=None):
+        """
+        Batched variant of run_automations for bulk writes (imports, multi-select edits).
+        Rules and the trigger handler are looked up once for the whole batch and the
+        run logs are written with a single bulk insert.
+        `contexts` may be any iterable (e.g. a generator over chunked querysets).
+        `rules`, if given, are the board's active rules for the trigger, already loaded.
+        Returns the number of actions executed. Runs in a loader scope (core.loaders) so
+        per-item lookups in the actions are batched outside requests too (import tasks).
+        """
+        from core.loaders import scope
+        from .registry import AutomationRegistry
+
+        if rules is None:
+            rules = AutomationEngine._with_board(AutomationRule.objects.filter(
+                board=board,
+                trigger_type=trigger_code,
+                is_active=True
+            ), board)
+        if not rules:
+            return 0
+
+        trigger_handler = AutomationRegistry.get_trigger(trigger_code)
+        if not trigger_handler:
+            logger.warning("No handler found for trigger: %s", trigger_code)
+            return 0
+
+        executed = 0
+        logs = []
+        allowance = usage.RunAllowance(AutomationEngine._organization_id(board))
+        with scope(), tracing.span('automation.run_bulk', trigger=trigger_code, board=board.id) as span:
+            for context in contexts:
+                metrics.AUTOMATION_EVENTS.inc(trigger=trigger_code)
+                for rule in rules:
+                    try:
+                        if trigger_handler.check_condition(rule, context):
+                            if not allowance.take():
+                                logger.warning("Automation run limit reached, rule %s skipped", rule.id)
+                                continue
+                            metrics.AUTOMATION_MATCHES.inc(trigger=trigger_code, action=rule.action_type)
+                            AutomationEngine._execute_action(rule, context)
+                            logs.append(AutomationLog(rule=rule, status='success', meta={'context': str(context)}))
+                            executed += 1
+                    except Exception as e:
+                        logger.exception("Error running rule %s", rule.id)
+                        metrics.AUTOMATION_FAILURES.inc(trigger=trigger_code, action=rule.action_type)
+                        logs.append(AutomationLog(rule=rule, status='failed', meta={'error': str(e)}))
+                if len(logs) >= 500:
+                    AutomationEngine._save_logs(logs)
+                    logs = []
+            if logs:
+                AutomationEngine._save_logs(logs)
+            allowance.commit()
+            if span is not None:
+                span.set(matched=executed)
+        return executed
+
+    @staticmethod
+    def _with_board(rules, board):
+        # Actions read rule.board (created_by, groups); hand them the board we already have
+        rules = list(rules)
         for rule in rules:
-            try:
-                # 2. Check Condition via Handler
-                if trigger_handler.check_condition(rule, context):
-                    print(f" -> Rule '{rule.name}' matched! Executing action...")
-                    AutomationEngine._execute_action(rule, context)
-                    AutomationLog.objects.create(rule=rule, status='success', meta={'context': str(context)})
-                else:
-                    # print(f" -> Rule '{rule.name}' skipped (condition failed).")
-                    pass
-            except Exception as e:
-                print(f"Error running rule {rule.id}: {e}")
-                AutomationLog.objects.create(rule=rule, status='failed', meta={'error': str(e)})
+            rule.board = board
+        return rules
+
+    @staticmethod
+    def _organization_id(board, item=None):
+        # Items carry the organization id; otherwise go through the board's workspace
+        organization_id = getattr(item, 'organization_id', None)
+        if organization_id is None:
+            organization_id = board.workspace.organization_id
+        return organization_id
+
+    @staticmethod
+    def _save_logs(logs):
+        # bulk_create skips post_save, so the dashboard's daily run count is buffered here
+        from core import stats
+        AutomationLog.objects.bulk_create(logs)
+        stats.buffer_daily('automation_runs', len(logs))
+
+    @staticmethod
+    def run_change_automations_bulk(board, changes, columns):
+        """
+        Fires the value-change triggers (status_change, priority_changed, item_assigned,
+        column_changed) for a batch of edited items, one batched pass per trigger type.
+        `changes` is a list of (item, old_values) pairs; `columns` is the board's column list.
+        Mirrors what automation.signals does for a single saved item.
+        """
+        from webapp import loaders
+
+        status_ids = {str(c.id) for c in columns if c.type == 'status'}
+        priority_ids = {str(c.id) for c in columns if c.type == 'priority'}
+        person_ids = [str(c.id) for c in columns if c.type == 'person']
+
+        status_contexts, priority_contexts, assigned, column_contexts = [], [], [], []
+        for item, old_values in changes:
+            new_values = item.values
+            if new_values == old_values:
+                continue
+            column_contexts.append({'item': item, 'old_values': old_values, 'new_values': new_values})
+            for col_id in status_ids:
+                if new_values.get(col_id) != old_values.get(col_id):
+                    status_contexts.append({'item': item, 'column_id': col_id, 'new_value': new_values.get(col_id)})
+            for col_id in priority_ids:
+                if new_values.get(col_id) != old_values.get(col_id):
+                    priority_contexts.append({'item': item, 'new_priority': new_values.get(col_id)})
+                    break
+            for col_id in person_ids:
+                if new_values.get(col_id) != old_values.get(col_id):
+                    assigned.append((item, new_values.get(col_id)))
+                    break
+
+        # One query loads the board's active rules for all change triggers
+        active = {}
+        for rule in AutomationEngine._with_board(AutomationRule.objects.filter(
+            board=board, is_active=True,
+            trigger_type__in=['status_change', 'priority_changed', 'item_assigned', 'column_changed'],
+        ).order_by('id'), board):
+            active.setdefault(rule.trigger_type, []).append(rule)
+
+        executed = 0
+        if status_contexts and 'status_change' in active:
+            executed += AutomationEngine.run_automations_bulk(
+                board, 'status_change', status_contexts, rules=active['status_change'])
+        if priority_contexts and 'priority_changed' in active:
+            executed += AutomationEngine.run_automations_bulk(
+                board, 'priority_changed', priority_contexts, rules=active['priority_changed'])
+        if assigned and 'item_assigned' in active:
+            users = loaders.users_by_username().prime(username for _, username in assigned if username)
+            contexts = []
+            for item, username in assigned:
+                user = users.load(username) if username else None
+                contexts.append({
+                    'item': item, 'new_assigned_username': username,
+                    'new_assigned_user_id': user.id if user else None,
+                })
+            executed += AutomationEngine.run_automations_bulk(
+                board, 'item_assigned', contexts, rules=active['item_assigned'])
+        if column_contexts and 'column_changed' in active:
+            executed += AutomationEngine.run_automations_bulk(
+                board, 'column_changed', column_contexts, rules=active['column_changed'])
+        return executed
 
     @staticmethod
     def _execute_action(rule, context):
@@ -55,13 +208,11 @@ class AutomationEngine:
         action_handler = AutomationRegistry.get_action(action_code)
         
         if not action_handler:
-            print(f"No handler found for action: {action_code}")
+            logger.warning("No handler found for action: %s", action_code)
             return
             
         # Execute Action
-        try:
+        with tracing.span('automation.action', action=action_code, rule=rule.id), \
+                metrics.ACTION_LATENCY.time(action=action_code):
             action_handler.execute(rule, context)
-        except Exception as e:
-            print(f"Error executing action {action_code}: {e}")
-            raise e
 
@@ -1,8 +1,13 @@
-from django.db.models.signals import pre_save, post_save
+from django.db.models.signals import pre_save, post_save, post_delete
 from django.dispatch import receiver
-from webapp.models import Item
+from webapp import gantt, loaders
+from webapp.models import Board, Item
+from webapp.signals import item_values_patched, _board_going_away, _change_action
+from .models import AutomationRule
+from core.tracing import traced
 
 @receiver(pre_save, sender=Item)
+@traced('signal.pre_save.automation')
 def check_automation_triggers(sender, instance, **kwargs):
     """
     Check for changes before saving to detect triggers like 'Status Changed'.
@@ -43,7 +48,7 @@ def check_automation_triggers(sender, instance, **kwargs):
     
     # Check if assigned_to changed (person column values)
     # Find person columns and check if any changed
-    person_cols = instance.group.board.columns.filter(type='person')
+    person_cols = [c for c in loaders.item_columns(instance) if c.type == 'person']
     for col in person_cols:
         col_id_str = str(col.id)
         old_assigned = old_instance.values.get(col_id_str)
@@ -57,10 +62,11 @@ def check_automation_triggers(sender, instance, **kwargs):
     # Check if group changed
     if instance.group_id != old_instance.group_id:
         instance._group_changed = True
-        instance._old_group = old_instance.group
+        instance._old_group = loaders.groups().load(old_instance.group_id)
         instance._new_group = instance.group
 
 @receiver(post_save, sender=Item)
+@traced('signal.post_save.automation')
 def execute_automation_actions(sender, instance, created, **kwargs):
     """
     Execute actions after save.
@@ -71,10 +77,12 @@ def execute_automation_actions(sender, instance, created, **kwargs):
     if getattr(instance, '_is_automation_update', False):
         return
 
+    board = loaders.item_board(instance)
+
     # 1. Trigger: Item Created
     if created or getattr(instance, '_is_new_item', False):
         AutomationEngine.run_automations(
-            instance.group.board,
+            board,
             'item_created',
             {'item': instance}
         )
@@ -86,7 +94,7 @@ def execute_automation_actions(sender, instance, created, **kwargs):
         new_vals = instance.values
         
         # Find all status columns for this board
-        board_status_cols = {str(c.id): c for c in instance.group.board.columns.filter(type='status')}
+        board_status_cols = {str(c.id): c for c in loaders.board_columns().load(board.id) if c.type == 'status'}
         
         for col_id, new_val in new_vals.items():
             # If this is a status column and it changed
@@ -96,11 +104,11 @@ def execute_automation_actions(sender, instance, created, **kwargs):
                     'column_id': col_id,
                     'new_value': new_val
                 }
-                AutomationEngine.run_automations(instance.group.board, 'status_change', context)
+                AutomationEngine.run_automations(board, 'status_change', context)
 
         # Fire generic "any column changed" trigger
         AutomationEngine.run_automations(
-            instance.group.board,
+            board,
             'column_changed',
             {
                 'item': instance,
@@ -115,15 +123,14 @@ def execute_automation_actions(sender, instance, created, **kwargs):
             'item': instance,
             'new_priority': getattr(instance, '_new_priority', None)
         }
-        AutomationEngine.run_automations(instance.group.board, 'priority_changed', context)
+        AutomationEngine.run_automations(board, 'priority_changed', context)
     
     # 4. Trigger: Item Assigned
     if hasattr(instance, '_assigned_changed') and instance._assigned_changed:
-        from core.models import User
         new_username = getattr(instance, '_new_assigned', None)
         new_user_id = None
         if new_username:
-            user = User.objects.filter(username=new_username).first()
+            user = loaders.users_by_username().load(new_username)
             if user:
                 new_user_id = user.id
 
@@ -132,12 +139,43 @@ def execute_automation_actions(sender, instance, created, **kwargs):
             'new_assigned_username': new_username,
             'new_assigned_user_id': new_user_id,
         }
-        AutomationEngine.run_automations(instance.group.board, 'item_assigned', context)
+        AutomationEngine.run_automations(board, 'item_assigned', context)
     
     # 5. Trigger: Item Moved to Group
     if hasattr(instance, '_group_changed') and instance._group_changed:
         context = {
             'item': instance,
-            'new_group_id': instance.group.id if instance.group else None
+            'new_group_id': instance.group_id
         }
-        AutomationEngine.run_automations(instance.group.board, 'item_moved', context)
+        AutomationEngine.run_automations(board, 'item_moved', context)
+
+
+@receiver(item_values_patched, sender=Item)
+@traced('signal.item_values_patched.automation')
+def execute_patch_automations(sender, instance, old_values, columns=None, automation_update=False, **kwargs):
+    """
+    Same triggers as execute_automation_actions, for partial JSON writes (webapp.patching).
+    """
+    from automation.service import AutomationEngine
+
+    # Prevent recursion when the patch was made by an automation action
+    if automation_update:
+        return
+
+    board = loaders.item_board(instance)
+    if columns is None:
+        columns = loaders.board_columns().load(board.id)
+    AutomationEngine.run_change_automations_bulk(board, [(instance, old_values)], columns)
+
+
+@receiver(post_save, sender=AutomationRule)
+@receiver(post_delete, sender=AutomationRule)
+def rule_changed(sender, instance, signal, created=False, origin=None, **kwargs):
+    """Rule edits bump the board version so cached board pages revalidate."""
+    if signal is post_delete and _board_going_away(origin):
+        return
+    action = _change_action(created, signal)
+    data = None if action == 'delete' else {'name': instance.name, 'is_active': instance.is_active}
+    new_version = Board.bump_version(instance.board_id, [('rule', action, instance.id, data)])
+    if new_version is not None:
+        gantt.carry_forward(instance.board_id, new_version - 1, new_version)
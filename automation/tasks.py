@@ -50,11 +50,9 @@ def process_automation_action(rule_id, item_id, target_config):
             new_value = target_config.get('new_value')
             
             if col_id and new_value:
-                # Update the specific column value
-                item.values[str(col_id)] = new_value
-                # Prevent infinite loops: Don't trigger 'status_change' if we are changing status?
-                item._is_automation_update = True
-                item.save()
+                # Update the specific column value (partial write, no automation re-trigger)
+                from webapp.patching import patch_item_values
+                patch_item_values(item, {str(col_id): new_value}, automation_update=True)
                 log_message = f"Changed column {col_id} to {new_value}"
 
         # --- Action 3: Archive Item ---
@@ -10,6 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/4.2/ref/settings/
 """
 
+import os
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -55,6 +56,10 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'core.middleware.MetricsMiddleware',
+    'core.middleware.TracingMiddleware',
+    # Brotli/gzip; streamed pages are flushed chunk by chunk
+    'core.middleware.CompressionMiddleware',
     'django.middleware.security.SecurityMiddleware',
     # "whitenoise.middleware.WhiteNoiseMiddleware", # Optional
     'django.contrib.sessions.middleware.SessionMiddleware',
@@ -64,8 +69,59 @@ MIDDLEWARE = [
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
     'django_htmx.middleware.HtmxMiddleware',
+    'core.middleware.ProfilingMiddleware',
+    'core.middleware.QueryCountMiddleware',
+    # Request-scoped batch loaders (core.loaders)
+    'core.middleware.LoaderMiddleware',
 ]
 
+# Max queries per URL name. Exceeding a budget logs a warning (core.middleware) and
+# fails the view's budget test (core.testing.QueryBudgetMixin). Board pages and the item
+# side panel include the ETag lookup that lets repeat visits end in a 304. Board views
+# cover a viewer who needs a membership check; update_status covers an edit that fires
+# one automation rule (the rule's run is metered and logged).
+QUERY_BUDGETS = {
+    'board_detail': 10,
+    'board_kanban': 8,
+    'board_calendar': 8,
+    'my_work': 7,
+    'update_status': 13,
+    'add_item': 14,
+    'get_item_details': 6,
+    'notifications': 4,
+    'global_search': 6,
+}
+QUERY_DUPLICATE_THRESHOLD = 5
+
+# Request profiling (core.middleware.ProfilingMiddleware). Staff can profile a request by
+# sending this header; PROFILING_SAMPLE_RATE (0.0-1.0) profiles a random share of all
+# requests. Set the header to None and the rate to 0 to remove the middleware entirely.
+PROFILING_HEADER = 'X-Profile'
+PROFILING_SAMPLE_RATE = 0.0
+PROFILING_INTERVAL = 0.005  # seconds between stack samples
+PROFILING_KEEP_PER_URL = 50
+
+# Prometheus endpoint (/core/metrics/). Staff sessions can always read it; scrapers send
+# `Authorization: Bearer <METRICS_TOKEN>`. Leave unset to allow staff only.
+METRICS_TOKEN = os.environ.get('METRICS_TOKEN')
+
+# Trace spans (core.tracing). Finished spans are kept in an in-process ring buffer of
+# TRACING_BUFFER_SIZE entries and, if TRACING_EXPORT_PATH is set, appended to that file
+# as JSON lines by a background writer (one file can be shared by web and worker processes).
+TRACING_ENABLED = False
+TRACING_BUFFER_SIZE = 10000
+TRACING_EXPORT_PATH = os.environ.get('TRACING_EXPORT_PATH')
+
+# Board change feed (webapp.changes). Open streams wake immediately on changes committed
+# in the same process and poll the change log every BOARD_FEED_POLL_INTERVAL seconds for
+# changes from other processes. Streams end after BOARD_FEED_MAX_AGE seconds and the
+# browser reconnects where it left off.
+BOARD_FEED_POLL_INTERVAL = 5.0
+BOARD_FEED_MAX_AGE = 300
+# Change log entries older than this are compacted away (webapp.tasks.compact_board_changes);
+# delta sync answers clients that were away longer with a full snapshot.
+BOARD_CHANGE_RETENTION_DAYS = 7
+
 AUTHENTICATION_BACKENDS = [
     'core.backends.EmailBackend',
     'django.contrib.auth.backends.ModelBackend',
@@ -146,6 +202,10 @@ STATIC_ROOT = BASE_DIR / 'staticfiles'  # For production: python manage.py colle
 
 MEDIA_URL = '/media/'
 MEDIA_ROOT = BASE_DIR / 'media'
+# Background board exports (webapp.export): kept out of MEDIA_ROOT and served only through
+# the access-checked download view; removed by webapp.tasks.purge_exports once expired.
+EXPORT_ROOT = BASE_DIR / 'exports'
+EXPORT_RETENTION_HOURS = 24
 
 # Custom User Model
 AUTH_USER_MODEL = 'core.User'
@@ -168,6 +228,14 @@ CELERY_ACCEPT_CONTENT = ['json']
 CELERY_TASK_SERIALIZER = 'json'
 CELERY_RESULT_SERIALIZER = 'json'
 CELERY_TIMEZONE = TIME_ZONE
+CELERY_BEAT_SCHEDULE = {
+    # Corrects the maintained dashboard counters for writes that bypass signals
+    'reconcile-stats': {'task': 'core.tasks.reconcile_stats', 'schedule': 60 * 60},
+    # Same for the per-organization usage meters behind plan limits
+    'reconcile-usage': {'task': 'core.tasks.reconcile_usage', 'schedule': 60 * 60},
+    'compact-board-changes': {'task': 'webapp.tasks.compact_board_changes', 'schedule': 24 * 60 * 60},
+    'purge-exports': {'task': 'webapp.tasks.purge_exports', 'schedule': 60 * 60},
+}
 CELERY_TASK_ALWAYS_EAGER = True # Force sync execution for Windows Dev
 
 # Email Backend (SMTP for Real Emails)
@@ -1,3 +1,5 @@
+from django.utils.functional import SimpleLazyObject
+
 from core.models import FooterLink
 
 def footer_links(request):
@@ -5,14 +7,19 @@ def footer_links(request):
     Injects footer links into the context, organized by section.
     Matches the variable names expected by base.html:
     footer_products, footer_solutions, footer_resources, footer_company
+    The links are read (in one query) only when a template uses them, so HTMX partials
+    that never render the footer do not pay for it.
     """
     links = FooterLink.objects.filter(is_active=True).order_by('section', 'order')
+
+    def section(name):
+        return SimpleLazyObject(lambda: [l for l in links if l.section == name])
     
     return {
-        'footer_products': [l for l in links if l.section == 'products'],
-        'footer_solutions': [l for l in links if l.section == 'solutions'],
-        'footer_resources': [l for l in links if l.section == 'resources'],
-        'footer_company': [l for l in links if l.section == 'company'],
+        'footer_products': section('products'),
+        'footer_solutions': section('solutions'),
+        'footer_resources': section('resources'),
+        'footer_company': section('company'),
     }
 
 def notifications_processor(request):
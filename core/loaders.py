@@ -0,0 +1,92 @@
+"""
+Request-scoped batch loaders (the DataLoader pattern, without promises).
+
+A BatchLoader turns lookups by key into one `IN` query per batch. Code that knows which
+keys it is about to need queues them with prime(); the first load() that misses fetches
+everything queued in the same query, and results are kept for the rest of the scope, so
+a relation looked up from a template, a view and several automation handlers during one
+request costs a single query.
+
+LoaderMiddleware opens a scope per request; tasks and bulk jobs can open one with
+scope(). Outside a scope, loader() hands out a fresh loader per call, so nothing is ever
+cached across requests or tasks. Writes invalidate the affected keys (see
+webapp.loaders) so a scope never returns data its own request has changed.
+"""
+import contextvars
+from contextlib import contextmanager
+
+_current = contextvars.ContextVar('core_loaders', default=None)
+
+
+class BatchLoader:
+    def __init__(self, batch_fn):
+        # batch_fn(keys) -> {key: value}; keys it leaves out load as None
+        self.batch_fn = batch_fn
+        self.batches = 0
+        self._cache = {}
+        self._pending = set()
+
+    def prime(self, keys):
+        """Queues keys to be fetched with the next batch."""
+        self._pending.update(key for key in keys if key is not None and key not in self._cache)
+        return self
+
+    def load(self, key, default=None):
+        if key is None:
+            return default
+        if key not in self._cache:
+            self._pending.add(key)
+            self._dispatch()
+        value = self._cache[key]
+        return default if value is None else value
+
+    def load_many(self, keys):
+        keys = list(keys)
+        self.prime(keys)
+        self._dispatch()
+        return [self._cache.get(key) for key in keys]
+
+    def clear(self, key=None):
+        if key is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(key, None)
+
+    def _dispatch(self):
+        keys, self._pending = self._pending, set()
+        if not keys:
+            return
+        found = self.batch_fn(list(keys))
+        self.batches += 1
+        for key in keys:
+            self._cache[key] = found.get(key)
+
+
+def loader(name, batch_fn):
+    """The current scope's loader called `name`, created from batch_fn on first use."""
+    loaders = _current.get()
+    if loaders is None:
+        return BatchLoader(batch_fn)
+    if name not in loaders:
+        loaders[name] = BatchLoader(batch_fn)
+    return loaders[name]
+
+
+def invalidate(name, key=None):
+    """Drops `key` (or everything) from the current scope's `name` loader, if any."""
+    loaders = _current.get()
+    if loaders is not None and name in loaders:
+        loaders[name].clear(key)
+
+
+@contextmanager
+def scope():
+    """Opens a loader scope; nested scopes share the outer one."""
+    if _current.get() is not None:
+        yield
+        return
+    token = _current.set({})
+    try:
+        yield
+    finally:
+        _current.reset(token)
@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+
+from core.stats import reconcile, RECONCILE_DAYS
+
+
+class Command(BaseCommand):
+    help = 'Recomputes the saas-admin dashboard counters and daily growth series from the source tables'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, default=RECONCILE_DAYS, help='How many days of daily series to rebuild')
+
+    def handle(self, *args, **options):
+        totals = reconcile(days=max(1, options['days']))
+        for key, value in totals.items():
+            self.stdout.write(f"{key:<20} {value}")
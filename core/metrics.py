@@ -0,0 +1,258 @@
+"""
+In-process metrics with Prometheus text export.
+
+Every metric keeps one cell per (thread, label values). A thread only ever writes its
+own cells, so updates are plain attribute arithmetic with no lock; the registry lock is
+taken only the first time a thread touches a label combination and when exporting,
+which sums the cells of all threads. When a thread exits, its cells are folded into one
+retired cell per label combination, so thread churn does not grow the metric. Values live in the process: with several workers,
+scrape each one (or aggregate in Prometheus).
+
+Usage:
+    from core import metrics
+    metrics.FORMULA_EVALUATIONS.inc()
+    metrics.REQUEST_LATENCY.observe(0.042, view='board_detail', method='GET')
+    with metrics.ACTION_LATENCY.time(action='send_notification'):
+        ...
+"""
+import bisect
+import threading
+import time
+import weakref
+from contextlib import contextmanager
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+_registry_lock = threading.Lock()
+REGISTRY = []
+# name -> callable returning [(labels_dict, value)], evaluated at export time
+GAUGE_CALLBACKS = {}
+
+
+class _CounterCell:
+    __slots__ = ('value',)
+
+    def __init__(self):
+        self.value = 0.0
+
+
+class _HistogramCell:
+    __slots__ = ('buckets', 'sum', 'count')
+
+    def __init__(self, size):
+        self.buckets = [0] * size
+        self.sum = 0.0
+        self.count = 0
+
+
+class _ThreadCells:
+    """A thread's cells of one metric; collected (and retired) when the thread exits."""
+    __slots__ = ('cells', '__weakref__')
+
+    def __init__(self):
+        self.cells = {}
+
+
+class _Metric:
+    kind = None
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._local = threading.local()
+        # (label values) -> list of cells: one per live thread that used them, plus the
+        # retired cell holding what exited threads counted
+        self._cells = {}
+        self._retired = {}
+        with _registry_lock:
+            REGISTRY.append(self)
+
+    def _new_cell(self):
+        raise NotImplementedError
+
+    def _merge(self, into, cell):
+        raise NotImplementedError
+
+    def _cell(self, labels):
+        key = tuple(str(labels.get(name, '')) for name in self.labelnames) if self.labelnames else ()
+        holder = getattr(self._local, 'holder', None)
+        if holder is None:
+            holder = self._local.holder = _ThreadCells()
+            # Runs when the thread's locals are torn down; holds the dict, not the holder
+            weakref.finalize(holder, self._retire, holder.cells).atexit = False
+        cell = holder.cells.get(key)
+        if cell is None:
+            cell = holder.cells[key] = self._new_cell()
+            with _registry_lock:
+                self._cells.setdefault(key, []).append(cell)
+        return cell
+
+    def _retire(self, cells):
+        with _registry_lock:
+            for key, cell in cells.items():
+                retired = self._retired.get(key)
+                if retired is None:
+                    retired = self._retired[key] = self._new_cell()
+                    self._cells[key].append(retired)
+                self._merge(retired, cell)
+                self._cells[key].remove(cell)
+
+    def _snapshot(self):
+        with _registry_lock:
+            return {key: list(cells) for key, cells in self._cells.items()}
+
+    def _label_str(self, key, extra=None):
+        pairs = list(zip(self.labelnames, key))
+        if extra:
+            pairs.append(extra)
+        if not pairs:
+            return ''
+        escaped = (f'{k}="{_escape(v)}"' for k, v in pairs)
+        return '{' + ','.join(escaped) + '}'
+
+
+class Counter(_Metric):
+    kind = 'counter'
+
+    def _new_cell(self):
+        return _CounterCell()
+
+    def _merge(self, into, cell):
+        into.value += cell.value
+
+    def inc(self, amount=1, **labels):
+        self._cell(labels).value += amount
+
+    def value(self, **labels):
+        key = tuple(str(labels.get(name, '')) for name in self.labelnames)
+        return sum(c.value for c in self._snapshot().get(key, []))
+
+    def render(self):
+        for key, cells in sorted(self._snapshot().items()):
+            yield f"{self.name}{self._label_str(key)} {_fmt(sum(c.value for c in cells))}"
+
+
+class Histogram(_Metric):
+    kind = 'histogram'
+
+    def __init__(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        self.bounds = tuple(sorted(buckets))
+        super().__init__(name, documentation, labelnames)
+
+    def _new_cell(self):
+        return _HistogramCell(len(self.bounds) + 1)
+
+    def _merge(self, into, cell):
+        into.buckets = [a + b for a, b in zip(into.buckets, cell.buckets)]
+        into.sum += cell.sum
+        into.count += cell.count
+
+    def observe(self, value, **labels):
+        cell = self._cell(labels)
+        cell.buckets[bisect.bisect_left(self.bounds, value)] += 1
+        cell.sum += value
+        cell.count += 1
+
+    @contextmanager
+    def time(self, **labels):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def count(self, **labels):
+        key = tuple(str(labels.get(name, '')) for name in self.labelnames)
+        return sum(c.count for c in self._snapshot().get(key, []))
+
+    def render(self):
+        for key, cells in sorted(self._snapshot().items()):
+            buckets = [sum(c.buckets[i] for c in cells) for i in range(len(self.bounds) + 1)]
+            cumulative = 0
+            for bound, n in zip(self.bounds, buckets):
+                cumulative += n
+                yield f"{self.name}_bucket{self._label_str(key, ('le', _fmt(bound)))} {cumulative}"
+            cumulative += buckets[-1]
+            yield f"{self.name}_bucket{self._label_str(key, ('le', '+Inf'))} {cumulative}"
+            yield f"{self.name}_sum{self._label_str(key)} {_fmt(sum(c.sum for c in cells))}"
+            yield f"{self.name}_count{self._label_str(key)} {cumulative}"
+
+
+def register_gauge(name, documentation, callback):
+    """
+    Registers a gauge computed at scrape time. `callback()` returns a list of
+    (labels_dict, value) pairs; an exception or empty list exports no samples.
+    """
+    GAUGE_CALLBACKS[name] = (documentation, callback)
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _fmt(value):
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value)) if abs(value) < 1e15 else repr(value)
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+def render_prometheus():
+    """
+    All metrics in the Prometheus text exposition format (version 0.0.4).
+    """
+    lines = []
+    with _registry_lock:
+        metrics = list(REGISTRY)
+    for metric in metrics:
+        lines.append(f"# HELP {metric.name} {metric.documentation}")
+        lines.append(f"# TYPE {metric.name} {metric.kind}")
+        lines.extend(metric.render())
+    for name, (documentation, callback) in sorted(GAUGE_CALLBACKS.items()):
+        try:
+            samples = callback() or []
+        except Exception:
+            samples = []
+        lines.append(f"# HELP {name} {documentation}")
+        lines.append(f"# TYPE {name} gauge")
+        for labels, value in samples:
+            label_str = ','.join(f'{k}="{_escape(v)}"' for k, v in labels.items())
+            lines.append(f"{name}{{{label_str}}} {_fmt(value)}" if label_str else f"{name} {_fmt(value)}")
+    return '\n'.join(lines) + '\n'
+
+
+# --- Application metrics -------------------------------------------------
+
+REQUESTS = Counter('http_requests_total', 'HTTP requests by view, method and status.',
+                   ['view', 'method', 'status'])
+REQUEST_LATENCY = Histogram('http_request_duration_seconds', 'Request latency by view.',
+                            ['view', 'method'])
+AUTOMATION_EVENTS = Counter('automation_events_total', 'Automation trigger events evaluated.', ['trigger'])
+AUTOMATION_MATCHES = Counter('automation_rule_matches_total', 'Automation rules whose condition matched.',
+                             ['trigger', 'action'])
+AUTOMATION_FAILURES = Counter('automation_rule_failures_total', 'Automation rules that raised.', ['trigger', 'action'])
+ACTION_LATENCY = Histogram('automation_action_duration_seconds', 'Automation action execution time.', ['action'])
+FORMULA_EVALUATIONS = Counter('formula_evaluations_total', 'Formula expressions evaluated.')
+CACHE_REQUESTS = Counter('cache_requests_total', 'Derived-data cache lookups.', ['cache', 'result'])
+
+
+def _celery_queue_depth():
+    """
+    Pending messages in the default Celery queue. Only the Redis broker is inspected;
+    nothing is reported when tasks run eagerly.
+    """
+    from django.conf import settings
+
+    if getattr(settings, 'CELERY_TASK_ALWAYS_EAGER', False):
+        return []
+    broker = getattr(settings, 'CELERY_BROKER_URL', '') or ''
+    if not broker.startswith(('redis://', 'rediss://')):
+        return []
+    import redis
+
+    queue = getattr(settings, 'CELERY_TASK_DEFAULT_QUEUE', 'celery')
+    client = redis.Redis.from_url(broker, socket_timeout=0.5, socket_connect_timeout=0.5)
+    return [({'queue': queue}, client.llen(queue))]
+
+
+register_gauge('celery_queue_depth', 'Messages waiting in the Celery broker queue.', _celery_queue_depth)
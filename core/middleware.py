@@ -0,0 +1,342 @@
+"""
+Per-request instrumentation.
+
+QueryCountMiddleware wraps every database connection for the duration of a request and
+records the number of queries, total SQL time and repeated query shapes (the usual
+sign of an N+1). In DEBUG the numbers are returned as response headers; otherwise one
+line per request goes to the 'core.queries' logger (INFO), with a WARNING when a view
+exceeds its budget in settings.QUERY_BUDGETS or repeats the same query too often.
+
+Streaming responses are measured up to the point the view returns.
+
+ProfilingMiddleware stack-samples selected requests (see core.profiling) and stores
+the result as a RequestProfile, viewable from the saas-admin dashboard.
+
+MetricsMiddleware counts requests and records their latency per view (see core.metrics).
+
+TracingMiddleware opens the root trace span of each request (see core.tracing).
+
+CompressionMiddleware compresses responses with Brotli (when the optional `brotli`
+package is installed) or gzip, flushing after every chunk of a streamed response.
+
+LoaderMiddleware opens the request's batch loader scope (see core.loaders).
+"""
+import logging
+import random
+import re
+import threading
+import time
+from collections import Counter
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from django.middleware.gzip import GZipMiddleware
+from django.utils.cache import patch_vary_headers
+
+try:
+    import brotli
+except ImportError:  # Optional: gzip only
+    brotli = None
+
+logger = logging.getLogger('core.queries')
+
+DEFAULT_DUPLICATE_THRESHOLD = 5
+
+_IN_LIST = re.compile(r'\(\s*%s(?:\s*,\s*%s)*\s*\)')
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r'\b\d+\b')
+_ACCEPTS_BROTLI = re.compile(r'\bbr\b')
+_ACCEPTS_GZIP = re.compile(r'\bgzip\b')
+
+BROTLI_QUALITY = 5
+
+
+def fingerprint(sql):
+    """
+    Reduces a query to its shape: literals and IN (...) lists are collapsed, so the
+    same query run for different rows maps to the same fingerprint.
+    """
+    sql = _IN_LIST.sub('(...)', sql)
+    sql = _STRING.sub('?', sql)
+    sql = _NUMBER.sub('?', sql)
+    return ' '.join(sql.split())
+
+
+class QueryStats:
+    """
+    Execute wrapper (see connection.execute_wrapper) that collects query statistics.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        self.fingerprints = Counter()
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.duration += time.perf_counter() - start
+            self.count += 1
+            self.fingerprints[fingerprint(sql)] += 1
+
+    @property
+    def duplicates(self):
+        """Number of queries that repeated an earlier query shape."""
+        return sum(n - 1 for n in self.fingerprints.values() if n > 1)
+
+    def most_repeated(self, limit=3):
+        return [(sql, n) for sql, n in self.fingerprints.most_common(limit) if n > 1]
+
+
+class QueryCountMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        stats = QueryStats()
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(stats))
+            response = self.get_response(request)
+
+        match = getattr(request, 'resolver_match', None)
+        view_name = (match.view_name if match else None) or request.path
+        budget = getattr(settings, 'QUERY_BUDGETS', {}).get(match.url_name if match else None)
+        duration_ms = stats.duration * 1000
+
+        if settings.DEBUG:
+            response['X-Query-Count'] = str(stats.count)
+            response['X-Query-Time-Ms'] = f"{duration_ms:.1f}"
+            response['X-Query-Duplicates'] = str(stats.duplicates)
+            if budget is not None:
+                response['X-Query-Budget'] = str(budget)
+
+        logger.info(
+            "%s %s view=%s queries=%d sql_ms=%.1f duplicates=%d",
+            request.method, request.path, view_name, stats.count, duration_ms, stats.duplicates,
+        )
+        threshold = getattr(settings, 'QUERY_DUPLICATE_THRESHOLD', DEFAULT_DUPLICATE_THRESHOLD)
+        repeated = [(sql, n) for sql, n in stats.most_repeated() if n >= threshold]
+        if budget is not None and stats.count > budget:
+            logger.warning("view=%s ran %d queries (budget %d)", view_name, stats.count, budget)
+        if repeated:
+            logger.warning(
+                "view=%s repeated queries: %s", view_name,
+                '; '.join(f"{n}x {sql[:200]}" for sql, n in repeated),
+            )
+        return response
+
+
+class LoaderMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        from . import loaders
+        with loaders.scope():
+            return self.get_response(request)
+
+
+class ProfilingMiddleware:
+    """
+    Profiles a request when a staff user sends the PROFILING_HEADER header, or at random
+    with probability PROFILING_SAMPLE_RATE. With the header disabled and a zero rate the
+    middleware removes itself at startup, so it costs nothing.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.sample_rate = getattr(settings, 'PROFILING_SAMPLE_RATE', 0.0)
+        header = getattr(settings, 'PROFILING_HEADER', None)
+        self.header_key = 'HTTP_' + header.upper().replace('-', '_') if header else None
+        self.interval = getattr(settings, 'PROFILING_INTERVAL', 0.005)
+        self.keep = getattr(settings, 'PROFILING_KEEP_PER_URL', 50)
+        if not self.sample_rate and not self.header_key:
+            raise MiddlewareNotUsed
+
+    def _wants_profile(self, request):
+        if self.header_key and request.META.get(self.header_key):
+            user = getattr(request, 'user', None)
+            if user is not None and user.is_authenticated and user.is_staff:
+                return True
+        return bool(self.sample_rate) and random.random() < self.sample_rate
+
+    def __call__(self, request):
+        if not self._wants_profile(request):
+            return self.get_response(request)
+
+        from .profiling import StackSampler
+        sampler = StackSampler(threading.get_ident(), self.interval)
+        started = time.perf_counter()
+        sampler.start()
+        try:
+            response = self.get_response(request)
+        finally:
+            sampler.stop()
+        duration_ms = (time.perf_counter() - started) * 1000
+
+        profile = self._store(request, response, sampler, duration_ms)
+        if profile is not None:
+            response['X-Profile-Id'] = str(profile.id)
+        return response
+
+    def _store(self, request, response, sampler, duration_ms):
+        from .models import RequestProfile
+
+        match = getattr(request, 'resolver_match', None)
+        url_name = (match.view_name if match else None) or request.path
+        user = getattr(request, 'user', None)
+        try:
+            profile = RequestProfile.objects.create(
+                url_name=url_name[:200], path=request.path[:500], method=request.method,
+                user=user if user is not None and user.is_authenticated else None,
+                status_code=response.status_code, duration_ms=duration_ms,
+                sample_count=sampler.sample_count, stacks=sampler.compressed(),
+            )
+            # Keep only the latest profiles per URL name
+            stale = list(
+                RequestProfile.objects.filter(url_name=profile.url_name)
+                .order_by('-created_at', '-id').values_list('id', flat=True)[self.keep:self.keep + 100]
+            )
+            if stale:
+                RequestProfile.objects.filter(id__in=stale).delete()
+        except Exception:
+            logger.exception("Could not store request profile for %s", request.path)
+            return None
+        return profile
+
+
+class MetricsMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        from . import metrics
+
+        start = time.perf_counter()
+        status = 500
+        try:
+            response = self.get_response(request)
+            status = response.status_code
+            return response
+        finally:
+            match = getattr(request, 'resolver_match', None)
+            # Unresolved paths (404s, static) share one label so label cardinality stays bounded
+            view = (match.view_name if match else None) or 'unmatched'
+            metrics.REQUESTS.inc(view=view, method=request.method, status=status)
+            metrics.REQUEST_LATENCY.observe(time.perf_counter() - start, view=view, method=request.method)
+
+
+class TracingMiddleware:
+    """
+    Wraps the request in an 'http.request' span, continuing the caller's trace when a
+    W3C `traceparent` header is sent, and returns the trace id as X-Trace-Id.
+    """
+
+    def __init__(self, get_response):
+        from . import tracing
+
+        if not tracing.enabled():
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+
+    def __call__(self, request):
+        from . import tracing
+
+        s, token = tracing.start_span(
+            'http.request', traceparent=request.META.get('HTTP_TRACEPARENT'),
+            method=request.method, path=request.path,
+        )
+        error = None
+        try:
+            response = self.get_response(request)
+            s.set(status=response.status_code)
+            if response.status_code >= 500:
+                s.status = 'error'
+            response['X-Trace-Id'] = s.trace_id
+            return response
+        except BaseException as exc:
+            error = exc
+            raise
+        finally:
+            match = getattr(request, 'resolver_match', None)
+            s.set(view=(match.view_name if match else None) or 'unmatched')
+            tracing.end_span(s, token, error)
+
+
+def _gzip_sequence(sequence, max_random_bytes):
+    """
+    Like django.utils.text.compress_sequence, but syncs the compressor after every chunk
+    so each chunk reaches the client as soon as it is produced.
+    """
+    from gzip import GzipFile
+    from django.utils.crypto import get_random_string
+    from django.utils.text import StreamingBuffer
+
+    buf = StreamingBuffer()
+    # Random-length filename in the gzip header, as Django does against BREACH
+    filename = get_random_string(random.randint(1, max_random_bytes))
+    with GzipFile(filename=filename, mode='wb', compresslevel=6, fileobj=buf, mtime=0) as zfile:
+        yield buf.read()
+        for item in sequence:
+            zfile.write(item)
+            zfile.flush()
+            data = buf.read()
+            if data:
+                yield data
+    yield buf.read()
+
+
+def _brotli_sequence(sequence):
+    compressor = brotli.Compressor(quality=BROTLI_QUALITY)
+    for item in sequence:
+        data = compressor.process(item) + compressor.flush()
+        if data:
+            yield data
+    yield compressor.finish()
+
+
+class CompressionMiddleware(GZipMiddleware):
+    """
+    GZipMiddleware that prefers Brotli when the client and the installed packages allow
+    it, and compresses synchronous streaming responses chunk by chunk with a flush after
+    each one, so the browser can render early parts of a streamed page. Event streams are
+    passed through untouched.
+    """
+
+    def process_response(self, request, response):
+        if response.has_header('Content-Encoding') or response.get('Content-Type', '').startswith('text/event-stream'):
+            return response
+        accept = request.META.get('HTTP_ACCEPT_ENCODING', '')
+        use_brotli = brotli is not None and bool(_ACCEPTS_BROTLI.search(accept))
+        sync_stream = response.streaming and not response.is_async
+        if not use_brotli and not (sync_stream and _ACCEPTS_GZIP.search(accept)):
+            return super().process_response(request, response)
+        if response.streaming and response.is_async:
+            return response  # Brotli for async streams is not implemented; rare, send as is
+        if not response.streaming and len(response.content) < 200:
+            return response
+
+        patch_vary_headers(response, ('Accept-Encoding',))
+        if response.streaming:
+            if use_brotli:
+                response.streaming_content = _brotli_sequence(response.streaming_content)
+            else:
+                response.streaming_content = _gzip_sequence(response.streaming_content, self.max_random_bytes)
+            del response.headers['Content-Length']
+        else:
+            compressed = brotli.compress(response.content, quality=BROTLI_QUALITY)
+            if len(compressed) >= len(response.content):
+                return response
+            response.content = compressed
+            response.headers['Content-Length'] = str(len(compressed))
+
+        etag = response.get('ETag')
+        if etag and etag.startswith('"'):
+            response.headers['ETag'] = 'W/' + etag
+        response.headers['Content-Encoding'] = 'br' if use_brotli else 'gzip'
+        return response
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.18 on 2026-10-19 16:09
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0013_stat_counters'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UsageMeter',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('period', models.DateField()),
+                ('users', models.IntegerField(default=0)),
+                ('boards', models.IntegerField(default=0)),
+                ('automation_runs', models.IntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('organization', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='usage_meters', to='core.organization')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('organization', 'period'), name='usagemeter_org_period_uniq')],
+            },
+        ),
+    ]
@@ -55,6 +55,10 @@ class Notification(models.Model):
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            # user.notifications (unread first / latest first)
+            models.Index(fields=['user', 'is_read', '-created_at'], name='notification_user_read_idx'),
+        ]
 
     def __str__(self):
         return f"{self.user.username}: {self.title}"
@@ -80,3 +84,62 @@ class FooterLink(models.Model):
 
     def __str__(self):
         return f"{self.get_section_display()} - {self.title}"
+
+class RequestProfile(models.Model):
+    """
+    Stack samples recorded for one request by core.middleware.ProfilingMiddleware.
+    `stacks` holds zlib-compressed collapsed stacks ("root;caller;callee count" per line).
+    """
+    url_name = models.CharField(max_length=200)
+    path = models.CharField(max_length=500)
+    method = models.CharField(max_length=10)
+    user = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True)
+    status_code = models.PositiveSmallIntegerField(default=200)
+    duration_ms = models.FloatField()
+    sample_count = models.PositiveIntegerField(default=0)
+    stacks = models.BinaryField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['url_name', '-created_at'], name='profile_url_created_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.method} {self.path} ({self.duration_ms:.0f} ms)"
+
+    def collapsed_stacks(self):
+        import zlib
+        return zlib.decompress(bytes(self.stacks)).decode('utf-8')
+
+
+class StatCounter(models.Model):
+    """
+    A maintained platform-wide count (users, organizations, boards, active automations),
+    kept up to date by core.signals and corrected by core.stats.reconcile().
+    """
+    key = models.CharField(max_length=50, unique=True)
+    value = models.BigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.key}={self.value}"
+
+
+class DailyStat(models.Model):
+    """
+    Per-day event counts for growth charts (signups, boards created, automation runs).
+    """
+    metric = models.CharField(max_length=50)
+    day = models.DateField()
+    value = models.BigIntegerField(default=0)
+
+    class Meta:
+        ordering = ['metric', 'day']
+        constraints = [
+            models.UniqueConstraint(fields=['metric', 'day'], name='dailystat_metric_day_uniq'),
+        ]
+
+    def __str__(self):
+        return f"{self.metric} {self.day}: {self.value}"
@@ -0,0 +1,85 @@
+"""
+Low-overhead stack sampling for a single request.
+
+A daemon thread wakes every `interval` seconds, grabs the request thread's current
+frame from sys._current_frames() and counts the collapsed stack. The output is the
+"collapsed stacks" format used by flamegraph.pl and speedscope:
+
+    django/core/handlers/base.py:get_response;webapp/views.py:board_detail 42
+"""
+import os
+import sys
+import threading
+import zlib
+from collections import Counter
+
+from django.conf import settings
+
+MAX_DEPTH = 128
+
+
+def _short_path(filename):
+    # Keep paths readable and stable across machines: project-relative or package-relative
+    base = str(settings.BASE_DIR)
+    if filename.startswith(base):
+        return os.path.relpath(filename, base)
+    marker = 'site-packages' + os.sep
+    index = filename.rfind(marker)
+    if index != -1:
+        return filename[index + len(marker):]
+    return os.path.basename(filename)
+
+
+class StackSampler:
+    """
+    Usage:
+        sampler = StackSampler(threading.get_ident(), interval=0.005)
+        sampler.start()
+        ...  # work to profile
+        sampler.stop()
+        sampler.collapsed()
+    """
+
+    def __init__(self, thread_id, interval=0.005):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.counts = Counter()
+        self._labels = {}
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='stack-sampler', daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def _label(self, code):
+        label = self._labels.get(code)
+        if label is None:
+            label = f"{_short_path(code.co_filename)}:{code.co_name}"
+            self._labels[code] = label
+        return label
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+            stack = []
+            while frame is not None and len(stack) < MAX_DEPTH:
+                stack.append(self._label(frame.f_code))
+                frame = frame.f_back
+            stack.reverse()
+            self.counts[';'.join(stack)] += 1
+
+    @property
+    def sample_count(self):
+        return sum(self.counts.values())
+
+    def collapsed(self):
+        return '\n'.join(f"{stack} {count}" for stack, count in self.counts.most_common())
+
+    def compressed(self):
+        return zlib.compress(self.collapsed().encode('utf-8'), 6)
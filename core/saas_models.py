@@ -87,3 +87,25 @@ class BillingProfile(models.Model):
     def __str__(self):
         plan_name = self.plan.name if self.plan else "No Plan"
         return f"Billing for {self.organization.name} ({plan_name})"
+
+class UsageMeter(models.Model):
+    """
+    Usage of one organization in one billing period (calendar month, `period` is its
+    first day). `users` and `boards` are running totals carried into each new period;
+    `automation_runs` starts at zero. Maintained by core.usage; limits are checked against
+    this row instead of counting the underlying tables.
+    """
+    organization = models.ForeignKey(Organization, on_delete=models.CASCADE, related_name='usage_meters')
+    period = models.DateField()
+    users = models.IntegerField(default=0)
+    boards = models.IntegerField(default=0)
+    automation_runs = models.IntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['organization', 'period'], name='usagemeter_org_period_uniq'),
+        ]
+
+    def __str__(self):
+        return f"Usage for {self.organization_id} in {self.period:%Y-%m}"
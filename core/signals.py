@@ -0,0 +1,91 @@
+from django.db.models.signals import pre_save, post_save, post_delete
+from django.dispatch import receiver
+
+from automation.models import AutomationRule, AutomationLog
+from webapp.models import Board, Workspace
+from . import stats, usage
+from .models import User, Organization, Membership
+
+
+def _board_organization_id(board):
+    if Board.workspace.is_cached(board):
+        return board.workspace.organization_id
+    # The workspace may already be gone when the board is deleted by cascade
+    return Workspace.objects.filter(id=board.workspace_id).values_list('organization_id', flat=True).first()
+
+
+@receiver(post_save, sender=User)
+def user_created(sender, instance, created, raw=False, **kwargs):
+    if created and not raw:
+        stats.increment('users')
+        stats.bump_daily('signups')
+
+
+@receiver(post_delete, sender=User)
+def user_deleted(sender, instance, **kwargs):
+    stats.increment('users', -1)
+
+
+@receiver(post_save, sender=Organization)
+def organization_created(sender, instance, created, raw=False, **kwargs):
+    if created and not raw:
+        stats.increment('organizations')
+
+
+@receiver(post_delete, sender=Organization)
+def organization_deleted(sender, instance, **kwargs):
+    stats.increment('organizations', -1)
+
+
+@receiver(post_save, sender=Board)
+def board_created(sender, instance, created, raw=False, **kwargs):
+    if created and not raw:
+        stats.increment('boards')
+        stats.bump_daily('boards_created')
+        usage.record(_board_organization_id(instance), 'boards')
+
+
+@receiver(post_delete, sender=Board)
+def board_deleted(sender, instance, **kwargs):
+    stats.increment('boards', -1)
+    usage.record(_board_organization_id(instance), 'boards', -1, create=False)
+
+
+@receiver(post_save, sender=Membership)
+def membership_created(sender, instance, created, raw=False, **kwargs):
+    if created and not raw:
+        usage.record(instance.organization_id, 'users')
+
+
+@receiver(post_delete, sender=Membership)
+def membership_deleted(sender, instance, **kwargs):
+    usage.record(instance.organization_id, 'users', -1, create=False)
+
+
+@receiver(pre_save, sender=AutomationRule)
+def remember_rule_state(sender, instance, raw=False, **kwargs):
+    if instance.pk and not raw:
+        instance._was_active = (
+            AutomationRule.objects.filter(pk=instance.pk).values_list('is_active', flat=True).first()
+        )
+
+
+@receiver(post_save, sender=AutomationRule)
+def rule_saved(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+    was_active = False if created else bool(getattr(instance, '_was_active', False))
+    if instance.is_active != was_active:
+        stats.increment('active_automations', 1 if instance.is_active else -1)
+
+
+@receiver(post_delete, sender=AutomationRule)
+def rule_deleted(sender, instance, **kwargs):
+    if instance.is_active:
+        stats.increment('active_automations', -1)
+
+
+@receiver(post_save, sender=AutomationLog)
+def automation_logged(sender, instance, created, raw=False, **kwargs):
+    if created and not raw:
+        stats.buffer_daily('automation_runs')
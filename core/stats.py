@@ -0,0 +1,155 @@
+"""
+Maintained platform statistics for the saas-admin dashboard.
+
+Totals live in StatCounter rows and per-day event counts in DailyStat rows. Both are
+updated incrementally by the receivers in core.signals, so reading the dashboard costs
+two small queries however large the tables get. Bulk inserts (bulk_create) and raw
+deletes bypass signals; reconcile() recomputes everything from the source tables and
+runs periodically (core.tasks.reconcile_stats) and after the tenant generator.
+
+High-frequency events (automation runs) go through buffer_daily() instead of
+bump_daily(): counts collect in the process and are written once DAILY_FLUSH_SIZE
+events have piled up or DAILY_FLUSH_INTERVAL seconds have passed since the last write,
+so a busy automation run does not turn the day's row into a write hot spot. Counts a
+process never gets to flush are recovered by the next reconcile().
+"""
+import threading
+import time as _time
+from datetime import datetime, time, timedelta
+
+from django.apps import apps as global_apps
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+COUNTERS = ('users', 'organizations', 'boards', 'active_automations')
+DAILY_METRICS = ('signups', 'boards_created', 'automation_runs')
+RECONCILE_DAYS = 90
+DAILY_FLUSH_SIZE = 100
+DAILY_FLUSH_INTERVAL = 30.0
+
+# (metric, day) -> count not yet written, with the time of the last flush
+_pending_daily = {}
+_pending_lock = threading.Lock()
+_last_flush = _time.monotonic()
+
+
+def _upsert_add(model, lookup, delta):
+    # UPDATE first: after the first event of a key/day the row exists and this is one query
+    if model.objects.filter(**lookup).update(value=F('value') + delta):
+        return
+    try:
+        with transaction.atomic():
+            model.objects.create(value=delta, **lookup)
+    except IntegrityError:
+        # Created concurrently
+        model.objects.filter(**lookup).update(value=F('value') + delta)
+
+
+def increment(key, delta=1):
+    from .models import StatCounter
+    _upsert_add(StatCounter, {'key': key}, delta)
+
+
+def bump_daily(metric, delta=1, day=None):
+    from .models import DailyStat
+    _upsert_add(DailyStat, {'metric': metric, 'day': day or timezone.localdate()}, delta)
+
+
+def buffer_daily(metric, delta=1):
+    """Like bump_daily() for today, but batched in the process (see the module docstring)."""
+    global _last_flush
+    key = (metric, timezone.localdate())
+    with _pending_lock:
+        _pending_daily[key] = _pending_daily.get(key, 0) + delta
+        due = (
+            sum(_pending_daily.values()) >= DAILY_FLUSH_SIZE
+            or _time.monotonic() - _last_flush >= DAILY_FLUSH_INTERVAL
+        )
+    if due:
+        flush_daily()
+
+
+def flush_daily():
+    """Writes this process's buffered daily counts, one upsert per metric and day."""
+    global _last_flush
+    with _pending_lock:
+        pending = dict(_pending_daily)
+        _pending_daily.clear()
+        _last_flush = _time.monotonic()
+    for (metric, day), delta in pending.items():
+        if delta:
+            bump_daily(metric, delta, day)
+
+
+def counters():
+    """All counters as a dict; missing counters read as 0."""
+    from .models import StatCounter
+    values = dict.fromkeys(COUNTERS, 0)
+    values.update(StatCounter.objects.filter(key__in=COUNTERS).values_list('key', 'value'))
+    return values
+
+
+def growth_series(days=30):
+    """
+    {metric: [(day, value), ...]} for the last `days` days (oldest first), zero-filled.
+    """
+    from .models import DailyStat
+    flush_daily()
+    today = timezone.localdate()
+    start = today - timedelta(days=days - 1)
+    rows = DailyStat.objects.filter(metric__in=DAILY_METRICS, day__gte=start).values_list('metric', 'day', 'value')
+    found = {(metric, day): value for metric, day, value in rows}
+    span = [start + timedelta(days=i) for i in range(days)]
+    return {metric: [(day, found.get((metric, day), 0)) for day in span] for metric in DAILY_METRICS}
+
+
+def _daily_counts(model, field, start):
+    # Compare the raw column with local midnight so the index on it can be used
+    since = timezone.make_aware(datetime.combine(start, time.min))
+    return (
+        model.objects.filter(**{f'{field}__gte': since})
+        .annotate(day=TruncDate(field)).values('day').annotate(n=Count('id')).values_list('day', 'n')
+    )
+
+
+def reconcile(days=RECONCILE_DAYS, apps=None):
+    """
+    Recomputes all counters and the last `days` days of the daily series from the source
+    tables. `apps` lets data migrations pass their historical app registry.
+    """
+    apps = apps or global_apps
+    User = apps.get_model('core', 'User')
+    Organization = apps.get_model('core', 'Organization')
+    Board = apps.get_model('webapp', 'Board')
+    AutomationRule = apps.get_model('automation', 'AutomationRule')
+    AutomationLog = apps.get_model('automation', 'AutomationLog')
+    StatCounter = apps.get_model('core', 'StatCounter')
+    DailyStat = apps.get_model('core', 'DailyStat')
+
+    totals = {
+        'users': User.objects.count(),
+        'organizations': Organization.objects.count(),
+        'boards': Board.objects.count(),
+        'active_automations': AutomationRule.objects.filter(is_active=True).count(),
+    }
+    start = timezone.localdate() - timedelta(days=days - 1)
+    daily = {
+        'signups': _daily_counts(User, 'date_joined', start),
+        'boards_created': _daily_counts(Board, 'created_at', start),
+        'automation_runs': _daily_counts(AutomationLog, 'executed_at', start),
+    }
+
+    # Buffered counts are covered by the recount
+    with _pending_lock:
+        _pending_daily.clear()
+    with transaction.atomic():
+        for key, value in totals.items():
+            StatCounter.objects.update_or_create(key=key, defaults={'value': value})
+        DailyStat.objects.filter(metric__in=DAILY_METRICS, day__gte=start).delete()
+        DailyStat.objects.bulk_create([
+            DailyStat(metric=metric, day=day, value=n)
+            for metric, rows in daily.items() for day, n in rows
+        ])
+    return totals
@@ -0,0 +1,20 @@
+from celery import shared_task
+
+
+@shared_task
+def reconcile_stats():
+    """
+    Periodic correction of the dashboard counters (see core.stats); scheduled in
+    CELERY_BEAT_SCHEDULE.
+    """
+    from .stats import reconcile
+    return reconcile()
+
+
+@shared_task
+def reconcile_usage():
+    """
+    Periodic correction of the per-organization usage meters (see core.usage).
+    """
+    from .usage import reconcile
+    return reconcile()
@@ -0,0 +1,34 @@
+"""
+Test helpers shared across apps.
+"""
+from collections import Counter
+
+from django.conf import settings
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from .middleware import fingerprint
+
+
+class QueryBudgetMixin:
+    """
+    TestCase mixin: assertQueryBudget('board_detail', board.id) requests the URL with
+    self.client and fails if it runs more queries than settings.QUERY_BUDGETS allows.
+    """
+
+    def assertQueryBudget(self, url_name, *args, method='get', data=None, budget=None, **kwargs):
+        if budget is None:
+            budget = settings.QUERY_BUDGETS[url_name]
+        url = reverse(url_name, args=args, kwargs=kwargs)
+        with CaptureQueriesContext(connection) as ctx:
+            response = getattr(self.client, method)(url, data or {})
+
+        if len(ctx) > budget:
+            repeated = Counter(fingerprint(q['sql']) for q in ctx.captured_queries)
+            details = '\n'.join(f"  {n}x {sql}" for sql, n in repeated.most_common() if n > 1)
+            self.fail(
+                f"{url_name} ran {len(ctx)} queries, budget is {budget}.\n"
+                f"Repeated queries:\n{details or '  (none)'}"
+            )
+        return response
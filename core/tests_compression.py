@@ -0,0 +1,73 @@
+import gzip
+import zlib
+from unittest import mock
+
+from django.http import HttpResponse, StreamingHttpResponse
+from django.test import RequestFactory, TestCase
+from django.urls import reverse
+
+from webapp.models import Board, Column, Group, Item, Workspace
+
+from . import middleware
+from .middleware import CompressionMiddleware
+from .models import Membership, Organization, User
+
+
+class StreamedBoardPageTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username='zip', email='zip@example.com', password='pw')
+        org = Organization.objects.create(name='Org', owner=self.user)
+        Membership.objects.create(user=self.user, organization=org, role='admin')
+        workspace = Workspace.objects.create(name='WS', organization=org)
+        self.board = Board.objects.create(name='Zipped', workspace=workspace, created_by=self.user)
+        Column.objects.create(board=self.board, title='Status', type='status', position=0)
+        for g in range(3):
+            group = Group.objects.create(board=self.board, title=f'Group {g}', position=g)
+            for i in range(5):
+                Item.objects.create(group=group, name=f'Task {g}-{i}', position=i, created_by=self.user)
+        self.client.force_login(self.user)
+
+    def test_board_page_streams_one_group_per_chunk(self):
+        response = self.client.get(reverse('board_detail', args=[self.board.id]))
+        self.assertTrue(response.streaming)
+        chunks = [c.decode() for c in response.streaming_content]
+        # head, three groups, tail
+        self.assertEqual(len(chunks), 5)
+        self.assertIn('Group 1', chunks[2])
+        page = ''.join(chunks)
+        self.assertEqual(page.count('<tr id="item-'), 15)
+        self.assertIn('</html>', chunks[-1])
+
+    def test_gzip_is_flushed_per_group(self):
+        response = self.client.get(reverse('board_detail', args=[self.board.id]), HTTP_ACCEPT_ENCODING='gzip')
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertFalse(response.has_header('Content-Length'))
+        chunks = list(response.streaming_content)
+
+        # Every chunk decodes on its own once the previous ones have been fed in
+        decoder = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        seen = ''
+        for chunk in chunks:
+            seen += decoder.decompress(chunk).decode()
+            if 'Group 0' in seen:
+                break
+        self.assertNotIn('</html>', seen)
+        page = gzip.decompress(b''.join(chunks)).decode()
+        self.assertEqual(page.count('<tr id="item-'), 15)
+
+    def test_brotli_is_preferred_when_installed(self):
+        fake = mock.Mock()
+        fake.compress.return_value = b'br'
+        request = RequestFactory().get('/', HTTP_ACCEPT_ENCODING='gzip, br')
+        with mock.patch.object(middleware, 'brotli', fake):
+            response = CompressionMiddleware(lambda r: HttpResponse('x' * 1000))(request)
+        self.assertEqual(response['Content-Encoding'], 'br')
+        self.assertEqual(response.content, b'br')
+        self.assertIn('Accept-Encoding', response['Vary'])
+
+    def test_event_streams_are_not_compressed(self):
+        request = RequestFactory().get('/', HTTP_ACCEPT_ENCODING='gzip')
+        stream = StreamingHttpResponse(iter([b'data: 1\n\n']), content_type='text/event-stream')
+        response = CompressionMiddleware(lambda r: stream)(request)
+        self.assertFalse(response.has_header('Content-Encoding'))
+        self.assertEqual(b''.join(response.streaming_content), b'data: 1\n\n')
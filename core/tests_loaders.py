@@ -0,0 +1,83 @@
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from automation.models import AutomationRule
+from webapp import loaders as webapp_loaders
+from webapp.bulk import bulk_update_values
+from webapp.models import Board, Column, Group, Item, Workspace
+
+from . import loaders
+from .models import Membership, Organization, User
+
+
+class BatchLoaderTest(TestCase):
+    def setUp(self):
+        self.calls = []
+
+    def _fetch(self, keys):
+        self.calls.append(sorted(keys))
+        return {key: key * 10 for key in keys if key != 4}
+
+    def test_primed_keys_load_in_one_batch(self):
+        with loaders.scope():
+            loader = loaders.loader('numbers', self._fetch).prime([1, 2, 3])
+            self.assertEqual(loader.load(2), 20)
+            self.assertEqual(loader.load(1), 10)
+            self.assertEqual(loader.load(4, default='missing'), 'missing')
+            self.assertEqual(loaders.loader('numbers', self._fetch).load_many([3, 4]), [30, None])
+        self.assertEqual(self.calls, [[1, 2, 3], [4]])
+
+    def test_scope_is_shared_and_invalidated(self):
+        with loaders.scope():
+            loaders.loader('numbers', self._fetch).load(1)
+            with loaders.scope():
+                loaders.loader('numbers', self._fetch).load(1)
+            loaders.invalidate('numbers', 1)
+            loaders.loader('numbers', self._fetch).load(1)
+        self.assertEqual(self.calls, [[1], [1]])
+
+    def test_nothing_is_cached_outside_a_scope(self):
+        loaders.loader('numbers', self._fetch).load(1)
+        loaders.loader('numbers', self._fetch).load(1)
+        self.assertEqual(self.calls, [[1], [1]])
+
+
+class AutomationBatchingTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username='loader', email='loader@example.com', password='pw')
+        org = Organization.objects.create(name='Org', owner=self.user)
+        Membership.objects.create(user=self.user, organization=org, role='admin')
+        workspace = Workspace.objects.create(name='WS', organization=org)
+        self.board = Board.objects.create(name='Loaders', workspace=workspace, created_by=self.user)
+        self.status = Column.objects.create(board=self.board, title='Status', type='status', position=0)
+        self.owner = Column.objects.create(board=self.board, title='Owner', type='person', position=1)
+        group = Group.objects.create(board=self.board, title='G', position=0)
+        self.items = [
+            Item.objects.create(group=group, name=f'Task {i}', position=i, created_by=self.user) for i in range(10)
+        ]
+        AutomationRule.objects.create(
+            board=self.board, name='Assign', trigger_type='status_change',
+            trigger_config={'column_id': self.status.id, 'value': 'Done'},
+            action_type='assign_person', action_config={'user_id': self.user.id},
+        )
+
+    def test_bulk_assign_looks_up_user_and_columns_once(self):
+        with CaptureQueriesContext(connection) as ctx:
+            bulk_update_values(self.board, [i.id for i in self.items], {self.status.id: 'Done'})
+
+        selects = [q['sql'] for q in ctx.captured_queries if q['sql'].startswith('SELECT')]
+        self.assertEqual(sum('FROM "core_user"' in sql for sql in selects), 1)
+        # bulk_update_values' own column read plus the loader's
+        self.assertEqual(sum('FROM "webapp_column"' in sql for sql in selects), 2)
+        for item in self.items:
+            item.refresh_from_db()
+            self.assertEqual(item.values[str(self.owner.id)], 'loader')
+
+    def test_request_sees_its_own_column_writes(self):
+        self.client.force_login(self.user)
+        with loaders.scope():
+            self.assertEqual(len(webapp_loaders.board_columns().load(self.board.id)), 2)
+            self.client.post(reverse('add_column', args=[self.board.id]), {'type': 'text'})
+            self.assertEqual(len(webapp_loaders.board_columns().load(self.board.id)), 3)
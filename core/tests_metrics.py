@@ -0,0 +1,92 @@
+import threading
+
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from .metrics import Counter, Histogram, REGISTRY, REQUESTS, render_prometheus
+from .models import User
+
+
+class MetricTypesTest(TestCase):
+    def tearDown(self):
+        # Drop the throwaway metrics so they do not show up in later exports
+        REGISTRY[:] = [m for m in REGISTRY if not m.name.startswith('test_')]
+
+    def test_counter_sums_cells_of_all_threads(self):
+        counter = Counter('test_events_total', 'Test events.', ['kind'])
+
+        def work():
+            for _ in range(1000):
+                counter.inc(kind='a')
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        counter.inc(5, kind='b')
+
+        self.assertEqual(counter.value(kind='a'), 4000)
+        self.assertEqual(counter.value(kind='b'), 5)
+
+    def test_exited_threads_are_folded_into_one_cell(self):
+        counter = Counter('test_churn_total', 'Test churn.')
+        histogram = Histogram('test_churn_seconds', 'Test churn.', buckets=(1.0,))
+
+        def work():
+            counter.inc()
+            histogram.observe(0.5)
+
+        for _ in range(50):
+            thread = threading.Thread(target=work)
+            thread.start()
+            thread.join()
+
+        self.assertEqual(counter.value(), 50)
+        self.assertEqual(histogram.count(), 50)
+        self.assertEqual(len(counter._cells[()]), 1)
+        self.assertEqual(len(histogram._cells[()]), 1)
+        self.assertIn('test_churn_seconds_bucket{le="1"} 50', render_prometheus())
+
+    def test_histogram_exposition(self):
+        histogram = Histogram('test_latency_seconds', 'Test latency.', ['view'], buckets=(0.1, 1.0))
+        for value in (0.05, 0.5, 3.0):
+            histogram.observe(value, view='home')
+
+        text = render_prometheus()
+        self.assertIn('# TYPE test_latency_seconds histogram', text)
+        self.assertIn('test_latency_seconds_bucket{view="home",le="0.1"} 1', text)
+        self.assertIn('test_latency_seconds_bucket{view="home",le="1"} 2', text)
+        self.assertIn('test_latency_seconds_bucket{view="home",le="+Inf"} 3', text)
+        self.assertIn('test_latency_seconds_sum{view="home"} 3.55', text)
+        self.assertIn('test_latency_seconds_count{view="home"} 3', text)
+
+
+class MetricsEndpointTest(TestCase):
+    def setUp(self):
+        self.staff = User.objects.create_user(username='staff', email='staff@example.com', password='pw', is_staff=True)
+        self.member = User.objects.create_user(username='member', email='member@example.com', password='pw')
+
+    def test_requests_are_counted_per_view(self):
+        self.client.force_login(self.member)
+        before = REQUESTS.value(view='notifications', method='GET', status=200)
+        self.client.get(reverse('notifications'))
+        self.assertEqual(REQUESTS.value(view='notifications', method='GET', status=200), before + 1)
+
+    def test_staff_can_scrape(self):
+        self.client.force_login(self.staff)
+        response = self.client.get(reverse('metrics'))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response['Content-Type'].startswith('text/plain; version=0.0.4'))
+        self.assertIn('# TYPE http_request_duration_seconds histogram', response.content.decode())
+
+    @override_settings(METRICS_TOKEN='s3cret')
+    def test_bearer_token(self):
+        self.assertEqual(self.client.get(reverse('metrics'), HTTP_AUTHORIZATION='Bearer s3cret').status_code, 200)
+        self.assertEqual(self.client.get(reverse('metrics'), HTTP_AUTHORIZATION='Bearer nope').status_code, 403)
+
+    def test_members_and_anonymous_are_refused(self):
+        self.assertEqual(self.client.get(reverse('metrics')).status_code, 403)
+        self.client.force_login(self.member)
+        self.assertEqual(self.client.get(reverse('metrics')).status_code, 403)
@@ -0,0 +1,65 @@
+import threading
+import time
+
+from django.core.exceptions import MiddlewareNotUsed
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from .middleware import ProfilingMiddleware
+from .models import RequestProfile, User
+from .profiling import StackSampler
+
+
+def _busy(seconds):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+class StackSamplerTest(TestCase):
+    def test_collapsed_stacks_name_the_running_function(self):
+        sampler = StackSampler(threading.get_ident(), interval=0.001)
+        sampler.start()
+        _busy(0.05)
+        sampler.stop()
+
+        self.assertGreater(sampler.sample_count, 0)
+        self.assertIn('core/tests_profiling.py:_busy', sampler.collapsed())
+
+
+@override_settings(PROFILING_INTERVAL=0.0005)
+class ProfilingMiddlewareTest(TestCase):
+    def setUp(self):
+        self.staff = User.objects.create_user(username='staff', email='staff@example.com', password='pw', is_staff=True)
+        self.member = User.objects.create_user(username='member', email='member@example.com', password='pw')
+
+    def test_staff_header_stores_profile(self):
+        self.client.force_login(self.staff)
+        response = self.client.get(reverse('saas_admin_dashboard'), HTTP_X_PROFILE='1')
+
+        profile = RequestProfile.objects.get(id=response['X-Profile-Id'])
+        self.assertEqual(profile.url_name, 'saas_admin_dashboard')
+        self.assertEqual(profile.user, self.staff)
+
+        stacks = self.client.get(reverse('saas_admin_profile_stacks', args=[profile.id]))
+        self.assertEqual(stacks.content.decode(), profile.collapsed_stacks())
+
+    def test_header_ignored_for_non_staff(self):
+        self.client.force_login(self.member)
+        response = self.client.get(reverse('notifications'), HTTP_X_PROFILE='1')
+
+        self.assertNotIn('X-Profile-Id', response)
+        self.assertFalse(RequestProfile.objects.exists())
+
+    @override_settings(PROFILING_SAMPLE_RATE=1.0, PROFILING_KEEP_PER_URL=2)
+    def test_sample_rate_and_retention(self):
+        self.client.force_login(self.member)
+        for _ in range(4):
+            self.client.get(reverse('notifications'))
+
+        self.assertEqual(RequestProfile.objects.filter(url_name='notifications').count(), 2)
+
+    @override_settings(PROFILING_SAMPLE_RATE=0.0, PROFILING_HEADER=None)
+    def test_disabled_middleware_is_removed(self):
+        with self.assertRaises(MiddlewareNotUsed):
+            ProfilingMiddleware(lambda request: None)
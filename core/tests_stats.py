@@ -0,0 +1,84 @@
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from automation.models import AutomationRule, AutomationLog
+from webapp.models import Board, Workspace
+
+from . import stats
+from .models import DailyStat, Organization, User
+
+
+class StatCounterTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username='owner', email='owner@example.com', password='pw')
+        self.org = Organization.objects.create(name='Org', owner=self.user)
+        self.workspace = Workspace.objects.create(name='WS', organization=self.org)
+        self.board = Board.objects.create(name='B', workspace=self.workspace, created_by=self.user)
+
+    def test_signals_maintain_counters(self):
+        rule = AutomationRule.objects.create(board=self.board, name='R', trigger_type='item_created',
+                                             action_type='send_notification')
+        self.assertEqual(stats.counters(), {'users': 1, 'organizations': 1, 'boards': 1, 'active_automations': 1})
+
+        rule.is_active = False
+        rule.save()
+        self.assertEqual(stats.counters()['active_automations'], 0)
+        rule.delete()
+        self.board.delete()
+        self.assertEqual(stats.counters()['active_automations'], 0)
+        self.assertEqual(stats.counters()['boards'], 0)
+
+    def test_daily_series(self):
+        rule = AutomationRule.objects.create(board=self.board, name='R', trigger_type='item_created',
+                                             action_type='send_notification')
+        AutomationLog.objects.create(rule=rule, status='success')
+        AutomationLog.objects.bulk_create([AutomationLog(rule=rule, status='success')] * 2)
+        stats.bump_daily('automation_runs', 2)
+
+        series = stats.growth_series(days=7)
+        today = timezone.localdate()
+        self.assertEqual(series['signups'][-1], (today, 1))
+        self.assertEqual(series['boards_created'][-1], (today, 1))
+        self.assertEqual(series['automation_runs'][-1], (today, 3))
+        self.assertEqual(len(series['signups']), 7)
+
+    def test_automation_runs_are_buffered(self):
+        rule = AutomationRule.objects.create(board=self.board, name='R', trigger_type='item_created',
+                                             action_type='send_notification')
+        stats.flush_daily()
+        with CaptureQueriesContext(connection) as ctx:
+            for _ in range(10):
+                AutomationLog.objects.create(rule=rule, status='success')
+        self.assertFalse([q['sql'] for q in ctx.captured_queries if 'core_dailystat' in q['sql']])
+
+        stats.flush_daily()
+        self.assertEqual(DailyStat.objects.get(metric='automation_runs', day=timezone.localdate()).value, 10)
+
+    def test_reconcile_filters_on_the_raw_column(self):
+        start = timezone.localdate()
+        sql = str(stats._daily_counts(AutomationLog, 'executed_at', start).query)
+        where = sql.split(' WHERE ', 1)[1].split(' GROUP BY ', 1)[0]
+        self.assertNotIn('cast_date', where.lower())
+        self.assertIn('"executed_at" >=', where)
+
+    def test_reconcile_fixes_drift_from_bulk_writes(self):
+        User.objects.bulk_create([User(username=f'bulk{i}', email=f'bulk{i}@example.com') for i in range(3)])
+        self.assertEqual(stats.counters()['users'], 1)
+
+        totals = stats.reconcile(days=7)
+        self.assertEqual(totals['users'], 4)
+        self.assertEqual(stats.counters()['users'], 4)
+        self.assertEqual(DailyStat.objects.get(metric='signups', day=timezone.localdate()).value, 4)
+
+    def test_dashboard_reads_counters(self):
+        self.user.is_staff = True
+        self.user.save()
+        self.client.force_login(self.user)
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(reverse('saas_admin_dashboard'))
+        self.assertFalse([q['sql'] for q in ctx.captured_queries if 'COUNT(' in q['sql']])
+        self.assertEqual(response.context['boards_count'], 1)
+        self.assertEqual(response.context['growth'][0]['total'], 1)
@@ -0,0 +1,154 @@
+import json
+import os
+import tempfile
+import threading
+from unittest import mock
+
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from automation.models import AutomationRule
+from config.celery import debug_task
+from webapp.models import Board, Column, Group, Item, Workspace
+
+from . import tracing
+from .models import Membership, Organization, User
+
+
+@override_settings(TRACING_ENABLED=True)
+class SpanTest(TestCase):
+    def setUp(self):
+        tracing.clear()
+
+    def test_nested_spans_share_trace_and_link_parents(self):
+        with tracing.span('outer') as outer:
+            with tracing.span('inner', step=1):
+                pass
+
+        inner, recorded_outer = tracing.recent_spans()
+        self.assertEqual(recorded_outer['span_id'], outer.span_id)
+        self.assertIsNone(recorded_outer['parent_id'])
+        self.assertEqual(inner['trace_id'], outer.trace_id)
+        self.assertEqual(inner['parent_id'], outer.span_id)
+        self.assertEqual(inner['attrs'], {'step': 1})
+
+    def test_errors_are_recorded(self):
+        with self.assertRaises(ValueError):
+            with tracing.span('failing'):
+                raise ValueError('boom')
+        self.assertEqual(tracing.recent_spans()[-1]['status'], 'error')
+
+    @override_settings(TRACING_BUFFER_SIZE=3)
+    def test_ring_buffer_keeps_latest(self):
+        for i in range(5):
+            with tracing.span(f'span{i}'):
+                pass
+        self.assertEqual([s['name'] for s in tracing.recent_spans()], ['span2', 'span3', 'span4'])
+
+    def test_jsonl_export(self):
+        fd, path = tempfile.mkstemp(suffix='.jsonl')
+        os.close(fd)
+        self.addCleanup(os.remove, path)
+        writers = []
+
+        def tracked_open(file, *args, **kwargs):
+            if file == path:
+                writers.append(threading.current_thread().name)
+            return real_open(file, *args, **kwargs)
+
+        real_open = open
+        with override_settings(TRACING_EXPORT_PATH=path), mock.patch('builtins.open', tracked_open):
+            with tracing.span('request'):
+                for i in range(20):
+                    with tracing.span(f'exported{i}'):
+                        pass
+            self.assertTrue(tracing.flush_exports())
+        # Only the background writer touches the file, a batch at a time
+        self.assertTrue(writers)
+        self.assertEqual(set(writers), {'tracing-export'})
+        with open(path, encoding='utf-8') as fh:
+            lines = [json.loads(line) for line in fh]
+        self.assertEqual([s['name'] for s in lines], [f'exported{i}' for i in range(20)] + ['request'])
+
+    def test_disabled_by_default(self):
+        with self.settings(TRACING_ENABLED=False):
+            with tracing.span('off') as s:
+                self.assertIsNone(s)
+        self.assertEqual(tracing.recent_spans(), [])
+
+
+@override_settings(TRACING_ENABLED=True)
+class CeleryPropagationTest(TestCase):
+    def setUp(self):
+        tracing.clear()
+
+    def test_publish_injects_traceparent(self):
+        headers = {}
+        with tracing.span('request') as s:
+            tracing._inject_task_headers(headers=headers)
+        self.assertEqual(headers['traceparent'], s.traceparent)
+
+    def test_task_joins_trace_from_headers(self):
+        # What a worker process sees: no current span, only the message header
+        parent = tracing.Span('web.request')
+        debug_task.apply(headers={'traceparent': parent.traceparent})
+
+        task_span = [s for s in tracing.recent_spans() if s['name'] == 'celery.task'][-1]
+        self.assertEqual(task_span['trace_id'], parent.trace_id)
+        self.assertEqual(task_span['parent_id'], parent.span_id)
+        self.assertEqual(task_span['attrs']['state'], 'SUCCESS')
+
+    def test_eager_task_nests_under_current_span(self):
+        with tracing.span('request') as s:
+            debug_task.delay()
+        task_span = [x for x in tracing.recent_spans() if x['name'] == 'celery.task'][-1]
+        self.assertEqual(task_span['parent_id'], s.span_id)
+
+
+@override_settings(TRACING_ENABLED=True)
+class RequestTraceTest(TestCase):
+    def setUp(self):
+        tracing.clear()
+        self.user = User.objects.create_user(username='tracer', email='tracer@example.com', password='pw')
+        org = Organization.objects.create(name='Org', owner=self.user)
+        Membership.objects.create(user=self.user, organization=org, role='admin')
+        workspace = Workspace.objects.create(name='WS', organization=org)
+        self.board = Board.objects.create(name='Traced', workspace=workspace, created_by=self.user)
+        self.status = Column.objects.create(board=self.board, title='Status', type='status', position=0)
+        group = Group.objects.create(board=self.board, title='G', position=0)
+        self.item = Item.objects.create(group=group, name='Task', position=0, created_by=self.user, values={})
+        AutomationRule.objects.create(
+            board=self.board, name='Note it', trigger_type='status_change',
+            trigger_config={'column_id': str(self.status.id)},
+            action_type='create_update', action_config={'message': 'changed'},
+        )
+        self.client.force_login(self.user)
+
+    def test_edit_produces_one_trace(self):
+        response = self.client.post(reverse('update_status', args=[self.item.id, self.status.id]),
+                                    {'action_value': 'Done'})
+
+        spans = tracing.recent_spans(trace_id=response['X-Trace-Id'])
+        by_name = {s['name']: s for s in spans}
+        root = by_name['http.request']
+        self.assertEqual(root['attrs']['view'], 'update_status')
+        self.assertIsNone(root['parent_id'])
+        self.assertIn('automation.action', by_name)
+        self.assertEqual(by_name['automation.action']['attrs']['action'], 'create_update')
+        # Every span hangs off another span of the same trace
+        ids = {s['span_id'] for s in spans}
+        self.assertTrue(all(s['parent_id'] in ids for s in spans if s is not root))
+
+    def test_incoming_traceparent_is_continued(self):
+        caller = tracing.Span('upstream')
+        response = self.client.get(reverse('notifications'), HTTP_TRACEPARENT=caller.traceparent)
+        self.assertEqual(response['X-Trace-Id'], caller.trace_id)
+
+    def test_admin_traces_endpoint(self):
+        response = self.client.get(reverse('notifications'))
+        self.user.is_staff = True
+        self.user.save()
+
+        export = self.client.get(reverse('saas_admin_traces'), {'trace_id': response['X-Trace-Id']})
+        lines = [json.loads(line) for line in export.content.decode().splitlines()]
+        self.assertEqual([s['name'] for s in lines], ['http.request'])
@@ -0,0 +1,104 @@
+from datetime import date
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from automation.models import AutomationRule, AutomationLog
+from webapp.models import Board, Group, Item, Workspace
+
+from . import usage
+from .models import Membership, Organization, User
+from .saas_models import BillingProfile, PricingPlan, UsageMeter
+
+
+class UsageMeterTest(TestCase):
+    def setUp(self):
+        self.owner = User.objects.create_user(username='owner', email='owner@example.com', password='pw')
+        self.org = Organization.objects.create(name='Org', owner=self.owner)
+        Membership.objects.create(user=self.owner, organization=self.org, role='admin')
+        self.workspace = Workspace.objects.create(name='WS', organization=self.org)
+        self.plan = PricingPlan.objects.create(name='Small', slug='small', price=0,
+                                               max_users=2, max_boards=2, max_automations=2)
+        BillingProfile.objects.create(organization=self.org, plan=self.plan)
+
+    def test_signals_maintain_meter(self):
+        board = Board.objects.create(name='B1', workspace=self.workspace, created_by=self.owner)
+        Board.objects.create(name='B2', workspace=self.workspace, created_by=self.owner)
+        board.delete()
+
+        meter = usage.get_meter(self.org.id)
+        self.assertEqual((meter.users, meter.boards, meter.automation_runs), (1, 1, 0))
+
+    def test_limit_check_is_one_query_and_raises(self):
+        Board.objects.create(name='B1', workspace=self.workspace, created_by=self.owner)
+        with self.assertNumQueries(1):
+            usage.check_limit(self.org.id, 'boards')
+        Board.objects.create(name='B2', workspace=self.workspace, created_by=self.owner)
+        with self.assertRaises(usage.PlanLimitExceeded):
+            usage.check_limit(self.org.id, 'boards')
+
+    def test_no_plan_means_unlimited(self):
+        self.org.billing.delete()
+        for i in range(3):
+            Board.objects.create(name=f'B{i}', workspace=self.workspace, created_by=self.owner)
+        usage.check_limit(self.org.id, 'boards')
+
+    def test_automation_runs_are_capped_without_scanning_logs(self):
+        board = Board.objects.create(name='B', workspace=self.workspace, created_by=self.owner)
+        group = Group.objects.create(board=board, title='G', position=0)
+        rule = AutomationRule.objects.create(board=board, name='Notify', trigger_type='item_created',
+                                             action_type='send_notification')
+        with CaptureQueriesContext(connection) as ctx:
+            for i in range(3):
+                Item.objects.create(group=group, name=f'Task {i}', position=i, created_by=self.owner)
+
+        self.assertEqual(AutomationLog.objects.filter(rule=rule).count(), 2)
+        self.assertEqual(usage.get_meter(self.org.id).automation_runs, 2)
+        self.assertFalse([q for q in ctx.captured_queries
+                          if 'COUNT(' in q['sql'] and 'automation_automationlog' in q['sql']])
+
+    def test_new_period_carries_totals(self):
+        Board.objects.create(name='B', workspace=self.workspace, created_by=self.owner)
+        UsageMeter.objects.filter(organization=self.org).update(period=date(2000, 1, 1), automation_runs=7)
+
+        meter = usage.get_meter(self.org.id)
+        self.assertEqual((meter.users, meter.boards, meter.automation_runs), (1, 1, 0))
+
+    def test_reconcile_fixes_drift(self):
+        Board.objects.bulk_create([Board(name=f'B{i}', workspace=self.workspace) for i in range(2)])
+        usage.get_meter(self.org.id)
+        UsageMeter.objects.filter(organization=self.org).update(users=9)
+
+        usage.reconcile([self.org.id])
+        meter = usage.get_meter(self.org.id)
+        self.assertEqual((meter.users, meter.boards), (1, 2))
+
+
+class PlanLimitViewTest(TestCase):
+    def setUp(self):
+        self.owner = User.objects.create_user(username='owner', email='owner@example.com', password='pw')
+        self.org = Organization.objects.create(name='Org', owner=self.owner)
+        Membership.objects.create(user=self.owner, organization=self.org, role='admin')
+        self.workspace = Workspace.objects.create(name='WS', organization=self.org)
+        plan = PricingPlan.objects.create(name='Tiny', slug='tiny', price=0, max_users=1, max_boards=1)
+        BillingProfile.objects.create(organization=self.org, plan=plan)
+        self.client.force_login(self.owner)
+
+    def test_create_board_respects_limit(self):
+        self.client.post(reverse('create_board', args=[self.workspace.id]), {'name': 'First'})
+        response = self.client.post(reverse('create_board', args=[self.workspace.id]), {'name': 'Second'})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(Board.objects.filter(workspace=self.workspace).count(), 1)
+
+    def test_invite_respects_member_limit(self):
+        User.objects.create_user(username='guest', email='guest@example.com', password='pw')
+        self.client.post(reverse('invite_member'), {'email': 'guest@example.com'})
+
+        self.assertFalse(Membership.objects.filter(user__username='guest').exists())
+
+    def test_billing_page_shows_usage(self):
+        response = self.client.get(reverse('billing'))
+        self.assertEqual(response.context['usage_rows'][0], {'label': 'members', 'used': 1, 'limit': 1, 'percent': 100})
@@ -0,0 +1,286 @@
+"""
+Lightweight trace spans.
+
+A span records one unit of work (a request, a signal receiver, an automation rule, a
+Celery task) with its trace id, its own id and its parent's id. The current span lives
+in a context variable, so nested `span()` blocks form a tree without passing anything
+around. Finished spans go to an in-process ring buffer (settings.TRACING_BUFFER_SIZE,
+readable from the saas-admin traces endpoint) and, when settings.TRACING_EXPORT_PATH is
+set, are appended to that file as JSON lines. Exporting never touches the file on the
+request path: spans are queued and a background writer thread appends whatever has
+piled up in one write (see flush_exports()). Tracing is off unless settings.TRACING_ENABLED.
+
+The trace context crosses process boundaries as a W3C `traceparent` value: incoming
+HTTP requests may carry one (TracingMiddleware), and Celery task messages get one in
+their headers at publish time, so a task's spans join the trace of the request that
+queued it, in whatever worker process runs it.
+
+Usage:
+    from core import tracing
+
+    with tracing.span('export.render', board=board.id) as s:
+        ...
+        s.set(rows=count)
+
+    @tracing.traced('signal.post_save.automation')
+    def receiver(sender, instance, **kwargs):
+        ...
+"""
+import atexit
+import contextvars
+import functools
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BUFFER_SIZE = 10000
+# Spans waiting for the export writer; beyond this, new spans are dropped from the export
+EXPORT_QUEUE_SIZE = 10000
+TRACEPARENT_HEADER = 'traceparent'
+
+_current = contextvars.ContextVar('core_tracing_span', default=None)
+_buffer = deque(maxlen=DEFAULT_BUFFER_SIZE)
+_export_queue = queue.Queue(maxsize=EXPORT_QUEUE_SIZE)
+_writer = None
+_writer_lock = threading.Lock()
+
+
+class Span:
+    __slots__ = ('name', 'trace_id', 'span_id', 'parent_id', 'attrs', 'status', 'start', '_started')
+
+    def __init__(self, name, trace_id=None, parent_id=None, attrs=None):
+        self.name = name
+        self.trace_id = trace_id or os.urandom(16).hex()
+        self.span_id = os.urandom(8).hex()
+        self.parent_id = parent_id
+        self.attrs = attrs or {}
+        self.status = 'ok'
+        self.start = time.time()
+        self._started = time.perf_counter()
+
+    def set(self, **attrs):
+        self.attrs.update(attrs)
+
+    @property
+    def traceparent(self):
+        return f"00-{self.trace_id}-{self.span_id}-01"
+
+    def finish(self):
+        record({
+            'trace_id': self.trace_id,
+            'span_id': self.span_id,
+            'parent_id': self.parent_id,
+            'name': self.name,
+            'start': round(self.start, 6),
+            'duration_ms': round((time.perf_counter() - self._started) * 1000, 3),
+            'status': self.status,
+            'pid': os.getpid(),
+            'attrs': self.attrs,
+        })
+
+
+def enabled():
+    return getattr(settings, 'TRACING_ENABLED', False)
+
+
+def current_span():
+    return _current.get()
+
+
+def parse_traceparent(value):
+    """Returns (trace_id, parent_span_id) from a W3C traceparent value, or (None, None)."""
+    parts = (value or '').strip().split('-')
+    if len(parts) != 4 or len(parts[1]) != 32 or len(parts[2]) != 16:
+        return None, None
+    try:
+        int(parts[1], 16), int(parts[2], 16)
+    except ValueError:
+        return None, None
+    return parts[1], parts[2]
+
+
+def start_span(name, traceparent=None, **attrs):
+    """
+    Opens a span and makes it current; returns (span, token) for `end_span`. A valid
+    `traceparent` overrides the current span as parent. Prefer `span()` where a with-block fits.
+    """
+    trace_id, parent_id = parse_traceparent(traceparent) if traceparent else (None, None)
+    if trace_id is None:
+        parent = _current.get()
+        if parent is not None:
+            trace_id, parent_id = parent.trace_id, parent.span_id
+    s = Span(name, trace_id, parent_id, attrs)
+    return s, _current.set(s)
+
+
+def end_span(s, token, error=None):
+    if error is not None:
+        s.status = 'error'
+        s.attrs['error'] = repr(error)[:300]
+    try:
+        _current.reset(token)
+    except ValueError:
+        # Token created in another context (e.g. a task finished in a different thread)
+        _current.set(None)
+    s.finish()
+
+
+@contextmanager
+def span(name, **attrs):
+    if not enabled():
+        yield None
+        return
+    s, token = start_span(name, **attrs)
+    error = None
+    try:
+        yield s
+    except BaseException as exc:
+        error = exc
+        raise
+    finally:
+        end_span(s, token, error)
+
+
+def traced(name=None):
+    """Decorator form of `span()`; the span is named after the function by default."""
+    def decorator(func):
+        span_name = name or f"{func.__module__}.{func.__qualname__}"
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(span_name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def record(data):
+    size = getattr(settings, 'TRACING_BUFFER_SIZE', DEFAULT_BUFFER_SIZE)
+    global _buffer
+    if _buffer.maxlen != size:
+        _buffer = deque(_buffer, maxlen=size)
+    _buffer.append(data)
+
+    path = getattr(settings, 'TRACING_EXPORT_PATH', None)
+    if path:
+        try:
+            _export_queue.put_nowait((path, data))
+        except queue.Full:
+            return
+        _ensure_writer()
+
+
+def _ensure_writer():
+    global _writer
+    # A forked worker inherits the Thread object but not the thread
+    if _writer is None or not _writer.is_alive():
+        with _writer_lock:
+            if _writer is None or not _writer.is_alive():
+                _writer = threading.Thread(target=_write_exports, name='tracing-export', daemon=True)
+                _writer.start()
+
+
+def _write_exports():
+    while True:
+        batch = [_export_queue.get()]
+        while True:
+            try:
+                batch.append(_export_queue.get_nowait())
+            except queue.Empty:
+                break
+        lines = {}
+        for path, data in batch:
+            if isinstance(data, threading.Event):
+                continue
+            lines.setdefault(path, []).append(json.dumps(data, default=str) + '\n')
+        for path, chunk in lines.items():
+            try:
+                with open(path, 'a', encoding='utf-8') as fh:
+                    fh.write(''.join(chunk))
+            except OSError:
+                logger.exception("Could not export %d spans to %s", len(chunk), path)
+        for path, data in batch:
+            if isinstance(data, threading.Event):
+                data.set()
+
+
+def flush_exports(timeout=5.0):
+    """Waits until spans queued so far are written; returns False if the writer fell behind."""
+    if _writer is None or not _writer.is_alive():
+        return _export_queue.empty()
+    done = threading.Event()
+    try:
+        _export_queue.put((None, done), timeout=timeout)
+    except queue.Full:
+        return False
+    return done.wait(timeout)
+
+
+atexit.register(flush_exports)
+
+
+def recent_spans(trace_id=None, limit=None):
+    """Finished spans from the ring buffer, oldest first."""
+    spans = list(_buffer)
+    if trace_id:
+        spans = [s for s in spans if s['trace_id'] == trace_id]
+    return spans[-limit:] if limit else spans
+
+
+def clear():
+    _buffer.clear()
+
+
+# --- Celery propagation ---------------------------------------------------
+
+_task_spans = {}
+
+
+def _inject_task_headers(headers=None, **kwargs):
+    s = _current.get()
+    if s is not None and headers is not None and TRACEPARENT_HEADER not in headers:
+        headers[TRACEPARENT_HEADER] = s.traceparent
+
+
+def _task_traceparent(task):
+    request = task.request
+    value = getattr(request, TRACEPARENT_HEADER, None)
+    if not value:
+        value = (getattr(request, 'headers', None) or {}).get(TRACEPARENT_HEADER)
+    return value
+
+
+def _start_task_span(task_id=None, task=None, **kwargs):
+    if not enabled() or task is None:
+        return
+    _task_spans[task_id] = start_span(
+        'celery.task', traceparent=_task_traceparent(task), task=task.name, task_id=task_id,
+    )
+
+
+def _end_task_span(task_id=None, state=None, **kwargs):
+    entry = _task_spans.pop(task_id, None)
+    if entry is not None:
+        s, token = entry
+        s.set(state=state)
+        if state == 'FAILURE':
+            s.status = 'error'
+        end_span(s, token)
+
+
+def install_celery_hooks():
+    """Connects the publish/prerun/postrun handlers; called from CoreConfig.ready()."""
+    from celery import signals
+
+    signals.before_task_publish.connect(_inject_task_headers, weak=False, dispatch_uid='core.tracing.publish')
+    signals.task_prerun.connect(_start_task_span, weak=False, dispatch_uid='core.tracing.prerun')
+    signals.task_postrun.connect(_end_task_span, weak=False, dispatch_uid='core.tracing.postrun')
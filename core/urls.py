@@ -3,6 +3,9 @@ from . import views
 
 urlpatterns = [
     path('saas-admin/', views.admin_dashboard, name='saas_admin_dashboard'),
+    path('saas-admin/profiles/<int:profile_id>/stacks/', views.admin_profile_stacks, name='saas_admin_profile_stacks'),
+    path('saas-admin/traces/', views.admin_traces, name='saas_admin_traces'),
+    path('metrics/', views.metrics_view, name='metrics'),
     path('signup/', views.signup_view, name='signup'),
     path('verify/<str:token>/', views.verify_email_view, name='verify_email'),
     path('login/', views.login_view, name='login'),
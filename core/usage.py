@@ -0,0 +1,207 @@
+"""
+Per-organization usage metering and plan limits.
+
+Each organization has one UsageMeter row per billing period (calendar month). Members
+and boards are counted by the receivers in core.signals; automation runs are added by
+the automation engine once per batch. A limit check is a single indexed query that
+reads the meter together with the organization's plan, so create_board, invite_member
+and automation firing never COUNT the underlying tables (in particular AutomationLog).
+
+Writes that bypass signals (bulk_create, raw SQL) make the meters drift; reconcile()
+recomputes the current period from the source tables and runs periodically
+(core.tasks.reconcile_usage).
+
+Organizations without a billing plan are not limited, and a limit of 0 means unlimited.
+"""
+from datetime import date, datetime
+
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F
+from django.utils import timezone
+
+# Meter field -> PricingPlan limit field
+LIMIT_FIELDS = {
+    'users': 'max_users',
+    'boards': 'max_boards',
+    'automation_runs': 'max_automations',
+}
+
+
+class PlanLimitExceeded(Exception):
+    def __init__(self, resource, limit, used):
+        self.resource = resource
+        self.limit = limit
+        self.used = used
+        super().__init__(f"Plan limit reached: {used}/{limit} {resource.replace('_', ' ')}")
+
+
+def current_period(today=None):
+    today = today or timezone.localdate()
+    return date(today.year, today.month, 1)
+
+
+def _previous_totals(organization_id, period):
+    # A new period carries the running totals over from the latest earlier meter
+    from .saas_models import UsageMeter
+    return (
+        UsageMeter.objects.filter(organization_id=organization_id, period__lt=period)
+        .order_by('-period').values('users', 'boards').first()
+    )
+
+
+def get_meter(organization_id, period=None):
+    """
+    The organization's meter for `period` (default: current), with organization, billing
+    profile and plan loaded in the same query. Created on first use in a period.
+    """
+    from .saas_models import UsageMeter
+    period = period or current_period()
+    meters = UsageMeter.objects.select_related('organization__billing__plan')
+    meter = meters.filter(organization_id=organization_id, period=period).first()
+    if meter is None:
+        try:
+            with transaction.atomic():
+                totals = (_previous_totals(organization_id, period)
+                          or _count_totals([organization_id]).get(organization_id, {'users': 0, 'boards': 0}))
+                UsageMeter.objects.create(organization_id=organization_id, period=period, **totals)
+        except IntegrityError:
+            pass  # Created concurrently
+        meter = meters.get(organization_id=organization_id, period=period)
+    return meter
+
+
+def plan_for(meter):
+    billing = getattr(meter.organization, 'billing', None)
+    return billing.plan if billing is not None else None
+
+
+def remaining(meter, resource):
+    """How much of `resource` is left this period; None when unlimited."""
+    plan = plan_for(meter)
+    limit = getattr(plan, LIMIT_FIELDS[resource], 0) if plan is not None else 0
+    if not limit:
+        return None
+    return max(0, limit - getattr(meter, resource))
+
+
+def summary(meter):
+    """Rows for the billing page: label, used, limit (None when unlimited) and percent."""
+    plan = plan_for(meter)
+    rows = []
+    for resource, label in (('users', 'members'), ('boards', 'boards'),
+                            ('automation_runs', 'automation runs this month')):
+        limit = getattr(plan, LIMIT_FIELDS[resource], 0) if plan is not None else 0
+        used = getattr(meter, resource)
+        rows.append({
+            'label': label, 'used': used, 'limit': limit or None,
+            'percent': min(100, round(used * 100 / limit)) if limit else 0,
+        })
+    return rows
+
+
+def check_limit(organization_id, resource, amount=1):
+    """
+    Raises PlanLimitExceeded if adding `amount` of `resource` would exceed the plan.
+    """
+    meter = get_meter(organization_id)
+    left = remaining(meter, resource)
+    if left is not None and amount > left:
+        limit = getattr(plan_for(meter), LIMIT_FIELDS[resource])
+        raise PlanLimitExceeded(resource, limit, getattr(meter, resource))
+    return meter
+
+
+class RunAllowance:
+    """
+    Automation runs for one engine call: the meter is read once, at the first matching
+    rule, and the runs taken are written back with one UPDATE in commit().
+    """
+
+    def __init__(self, organization_id):
+        self.organization_id = organization_id
+        self.used = 0
+        self._left = None
+        self._loaded = False
+
+    def take(self):
+        if not self._loaded:
+            self._left = remaining(get_meter(self.organization_id), 'automation_runs')
+            self._loaded = True
+        if self._left is not None and self.used >= self._left:
+            return False
+        self.used += 1
+        return True
+
+    def commit(self):
+        record(self.organization_id, 'automation_runs', self.used)
+        self.used = 0
+
+
+def record(organization_id, resource, delta=1, create=True):
+    """
+    Atomically adds `delta` to the current period's counter. With create=False a missing
+    meter is left alone (used on deletes, where the organization may be going away too).
+    """
+    from .saas_models import UsageMeter
+    if not delta or organization_id is None:
+        return
+    period = current_period()
+    meter = UsageMeter.objects.filter(organization_id=organization_id, period=period)
+    if meter.update(**{resource: F(resource) + delta}) or not create:
+        return
+    # First event of the period. Without an earlier meter the new one is counted from the
+    # tables, which already include this change (runs are never counted that way).
+    carried = _previous_totals(organization_id, period) is not None
+    get_meter(organization_id, period)
+    if carried or resource == 'automation_runs':
+        meter.update(**{resource: F(resource) + delta})
+
+
+def _count_totals(organization_ids=None):
+    from webapp.models import Board
+    from .models import Membership
+
+    members = Membership.objects.all()
+    boards = Board.objects.all()
+    if organization_ids is not None:
+        members = members.filter(organization_id__in=organization_ids)
+        boards = boards.filter(workspace__organization_id__in=organization_ids)
+    totals = {}
+    for org_id, n in members.values_list('organization_id').annotate(n=Count('id')).order_by():
+        totals.setdefault(org_id, {'users': 0, 'boards': 0})['users'] = n
+    for org_id, n in boards.values_list('workspace__organization_id').annotate(n=Count('id')).order_by():
+        totals.setdefault(org_id, {'users': 0, 'boards': 0})['boards'] = n
+    return totals
+
+
+def reconcile(organization_ids=None):
+    """
+    Recomputes the current period's meters from memberships, boards and this period's
+    automation logs. Returns the number of meters written.
+    """
+    from automation.models import AutomationLog
+    from .models import Organization
+    from .saas_models import UsageMeter
+
+    period = current_period()
+    organizations = Organization.objects.all()
+    if organization_ids is not None:
+        organizations = organizations.filter(id__in=organization_ids)
+    org_ids = list(organizations.values_list('id', flat=True))
+
+    totals = _count_totals(org_ids)
+    period_start = timezone.make_aware(datetime(period.year, period.month, 1))
+    runs = dict(
+        AutomationLog.objects.filter(executed_at__gte=period_start,
+                                     rule__board__workspace__organization_id__in=org_ids)
+        .values_list('rule__board__workspace__organization_id').annotate(n=Count('id')).order_by()
+    )
+
+    with transaction.atomic():
+        for org_id in org_ids:
+            values = totals.get(org_id, {'users': 0, 'boards': 0})
+            UsageMeter.objects.update_or_create(
+                organization_id=org_id, period=period,
+                defaults={**values, 'automation_runs': runs.get(org_id, 0)},
+            )
+    return len(org_ids)
@@ -147,23 +147,90 @@ def admin_dashboard(request):
     """
     Custom Admin Dashboard for SaaS Metrics.
     """
-    total_users = User.objects.count()
-    active_companies = Organization.objects.count()
-    boards_count = Board.objects.count()
-    automations_count = AutomationRule.objects.filter(is_active=True).count()
+    # Maintained counters and daily series (core.stats) instead of COUNT(*) over whole tables
+    from core import stats
+    counters = stats.counters()
+    growth = stats.growth_series(days=30)
     
     # Recent logs for activity feed
     recent_logs = AutomationLog.objects.select_related('rule').order_by('-executed_at')[:10]
+
+    # Request profiles (see core.middleware.ProfilingMiddleware); `stacks` is left out of the list
+    from core.models import RequestProfile
+    profiles = RequestProfile.objects.defer('stacks').select_related('user')
+    profile_url = request.GET.get('profile_url', '').strip()
+    if profile_url:
+        profiles = profiles.filter(url_name=profile_url)
     
     context = {
-        'total_users': total_users,
-        'active_companies': active_companies,
-        'boards_count': boards_count,
-        'automations_count': automations_count,
+        'total_users': counters['users'],
+        'active_companies': counters['organizations'],
+        'boards_count': counters['boards'],
+        'automations_count': counters['active_automations'],
+        'growth': [
+            {'label': label, 'total': sum(v for _, v in growth[metric]), 'max': max(v for _, v in growth[metric]) or 1,
+             'days': growth[metric]}
+            for metric, label in (('signups', 'Signups'), ('boards_created', 'Boards created'),
+                                  ('automation_runs', 'Automation runs'))
+        ],
         'recent_logs': recent_logs,
+        'recent_profiles': profiles[:20],
+        'profile_url': profile_url,
     }
     return render(request, 'core/admin_dashboard.html', context)
 
+@staff_member_required
+def admin_profile_stacks(request, profile_id):
+    """
+    Collapsed stacks for one request profile, as plain text
+    (load into speedscope or pipe into flamegraph.pl).
+    """
+    from django.http import HttpResponse
+    from django.shortcuts import get_object_or_404
+    from core.models import RequestProfile
+
+    profile = get_object_or_404(RequestProfile, id=profile_id)
+    response = HttpResponse(profile.collapsed_stacks(), content_type='text/plain; charset=utf-8')
+    if request.GET.get('download'):
+        response['Content-Disposition'] = f'attachment; filename="profile-{profile.id}.folded"'
+    return response
+
+@staff_member_required
+def admin_traces(request):
+    """
+    Recent trace spans from this process's ring buffer, as JSON lines.
+    Filter with ?trace_id=...; ?limit= caps the number of spans (default 1000).
+    """
+    import json
+    from django.http import HttpResponse
+    from core.tracing import recent_spans
+
+    try:
+        limit = max(1, int(request.GET.get('limit', 1000)))
+    except ValueError:
+        limit = 1000
+    spans = recent_spans(trace_id=request.GET.get('trace_id') or None, limit=limit)
+    body = ''.join(json.dumps(span, default=str) + '\n' for span in spans)
+    return HttpResponse(body, content_type='application/x-ndjson')
+
+def metrics_view(request):
+    """
+    Prometheus scrape endpoint. Open to staff sessions, or to scrapers sending
+    `Authorization: Bearer <METRICS_TOKEN>`.
+    """
+    import hmac
+    from django.http import HttpResponse
+    from core.metrics import render_prometheus
+
+    token = getattr(settings, 'METRICS_TOKEN', None)
+    auth = request.META.get('HTTP_AUTHORIZATION', '')
+    allowed = request.user.is_authenticated and request.user.is_staff
+    if not allowed and token and auth.startswith('Bearer '):
+        allowed = hmac.compare_digest(auth[len('Bearer '):].encode(), token.encode())
+    if not allowed:
+        return HttpResponse('Forbidden', status=403, content_type='text/plain')
+    return HttpResponse(render_prometheus(), content_type='text/plain; version=0.0.4; charset=utf-8')
+
 @login_required
 def billing_dashboard(request):
     """
@@ -183,8 +250,11 @@ def billing_dashboard(request):
     # Context for Plans
     from core.saas_models import PricingPlan
     plans = PricingPlan.objects.filter(is_active=True).order_by('price')
+
+    from core import usage
+    usage_rows = usage.summary(usage.get_meter(org.id))
     
-    return render(request, 'core/billing.html', {'billing': billing, 'plans': plans})
+    return render(request, 'core/billing.html', {'billing': billing, 'plans': plans, 'usage_rows': usage_rows})
 
 @login_required
 def upgrade_plan(request, plan_name):
@@ -305,6 +375,16 @@ def remove_member(request, membership_id):
     
     return redirect('team_list')
 
+def _member_limit_reached(org, user):
+    """True when adding `user` to `org` would exceed the plan (existing members are fine)."""
+    from core.models import Membership
+    from core.usage import check_limit, PlanLimitExceeded
+    try:
+        check_limit(org.id, 'users')
+    except PlanLimitExceeded:
+        return not Membership.objects.filter(user=user, organization=org).exists()
+    return False
+
 @login_required
 def invite_member(request):
     """
@@ -333,6 +413,8 @@ def invite_member(request):
             user_to_invite = User.objects.get(email=email)
             if user_to_invite == request.user:
                  messages.warning(request, "You cannot invite yourself.")
+            elif _member_limit_reached(org, user_to_invite):
+                messages.error(request, "Your plan's member limit is reached. Upgrade to invite more people.")
             else:
                 # Create Membership
                 obj, created = Membership.objects.get_or_create(
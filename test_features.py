@@ -42,7 +42,7 @@ def run_tests():
     group, _ = Group.objects.get_or_create(board=board, title="QA Group")
     
     # Clean up previous items
-    Item.objects.filter(group__board=board).delete()
+    Item.objects.filter(board=board).delete()
     print("[OK] Board & Group ready.")
 
     # 3. Test Feature: Country Column
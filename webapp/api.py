@@ -0,0 +1,180 @@
+"""
+Read API helpers: sparse fieldsets, keyset cursors and JSON encoding.
+
+Every list endpoint takes ?fields= (comma separated) and selects only those columns from
+the database. For items, a field may also be a board column id, which returns just that
+cell (`values` is then trimmed to the requested keys; column ids are numeric, which the
+JSON key lookups treat as array indexes, so the trimming happens in Python). `id` is
+always returned.
+
+Pages are keyset paginated on the primary key: ?cursor= is the opaque `next` value of the
+previous page, so a page costs the same however deep into the list it is. Responses are
+encoded with orjson when it is installed.
+"""
+import base64
+import datetime
+import decimal
+import json
+import uuid
+
+from django.http import HttpResponse
+
+try:
+    import orjson
+except ImportError:  # Optional: falls back to the stdlib encoder
+    orjson = None
+
+DEFAULT_LIMIT = 100
+MAX_LIMIT = 1000
+
+BOARD_FIELDS = ('name', 'description', 'type', 'privacy', 'version', 'created_at', 'columns', 'groups')
+COLUMN_FIELDS = ('id', 'title', 'type', 'position', 'settings')
+GROUP_FIELDS = ('title', 'color', 'position')
+ITEM_FIELDS = (
+    'name', 'group_id', 'parent_id', 'position', 'version', 'values',
+    'created_by_id', 'created_at', 'updated_at',
+)
+ITEM_DEFAULT_FIELDS = ('name', 'group_id', 'parent_id', 'position', 'version', 'values')
+UPDATE_FIELDS = ('item_id', 'user_id', 'user', 'body', 'created_at', 'like_count')
+# API field -> ORM lookup, where they differ
+UPDATE_LOOKUPS = {'user': 'user__username'}
+
+
+class ApiError(Exception):
+    def __init__(self, message, status=400):
+        super().__init__(message)
+        self.status = status
+
+
+def _default(value):
+    if isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, (decimal.Decimal, uuid.UUID)):
+        return str(value)
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def dumps(data):
+    """Encodes to UTF-8 JSON bytes; dates come out as ISO 8601 with either encoder."""
+    if orjson is not None:
+        return orjson.dumps(data, default=_default)
+    return json.dumps(data, default=_default, ensure_ascii=False, separators=(',', ':')).encode()
+
+
+def json_response(data, status=200):
+    return HttpResponse(dumps(data), content_type='application/json', status=status)
+
+
+def encode_cursor(last_id):
+    return base64.urlsafe_b64encode(dumps([last_id])).decode().rstrip('=')
+
+
+def decode_cursor(cursor):
+    try:
+        (last_id,) = json.loads(base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)))
+    except (ValueError, TypeError):
+        raise ApiError('Invalid cursor')
+    if not isinstance(last_id, int):
+        raise ApiError('Invalid cursor')
+    return last_id
+
+
+def parse_limit(value):
+    if not value:
+        return DEFAULT_LIMIT
+    if not value.isdigit() or not 1 <= int(value) <= MAX_LIMIT:
+        raise ApiError(f'limit must be between 1 and {MAX_LIMIT}')
+    return int(value)
+
+
+def parse_fields(value, allowed, default=None, extra=()):
+    """
+    The requested fields in request order, or `default` (all allowed fields) when ?fields=
+    is absent. Unknown names are an ApiError; `extra` lists additional accepted names.
+    """
+    if not value:
+        return list(default or allowed)
+    fields = []
+    for name in value.split(','):
+        name = name.strip()
+        if not name or name == 'id' or name in fields:
+            continue
+        if name not in allowed and name not in extra:
+            raise ApiError(f'Unknown field: {name}')
+        fields.append(name)
+    return fields
+
+
+def paginate(queryset, cursor, limit, descending=False):
+    """One keyset page of a .values() queryset, ordered by id: (rows, next cursor or None)."""
+    if cursor:
+        last_id = decode_cursor(cursor)
+        queryset = queryset.filter(id__lt=last_id) if descending else queryset.filter(id__gt=last_id)
+    rows = list(queryset.order_by('-id' if descending else 'id')[:limit + 1])
+    if len(rows) > limit:
+        rows = rows[:limit]
+        return rows, encode_cursor(rows[-1]['id'])
+    return rows, None
+
+
+def board_data(board, fields):
+    data = {'id': board.id}
+    for name in fields:
+        if name == 'columns':
+            data['columns'] = list(board.columns.order_by('position').values(*COLUMN_FIELDS))
+        elif name == 'groups':
+            data['groups'] = group_rows(board, GROUP_FIELDS)
+        else:
+            data[name] = getattr(board, name)
+    return data
+
+
+def group_rows(board, fields):
+    # A board has few groups, so they are returned whole, in board order
+    return list(board.groups.order_by('position', 'id').values('id', *fields))
+
+
+def item_page(board, params):
+    """Items of the board (optionally ?group=), projected to ?fields= and paginated."""
+    column_keys = set()
+    for column_id, column_type in board.columns.values_list('id', 'type'):
+        column_keys.add(str(column_id))
+        if column_type == 'formula':
+            column_keys.add(f'{column_id}_result')
+
+    fields = parse_fields(params.get('fields'), ITEM_FIELDS, ITEM_DEFAULT_FIELDS, extra=column_keys)
+    cells = [name for name in fields if name in column_keys]
+    columns = [name for name in fields if name not in column_keys]
+    if cells and 'values' not in columns:
+        columns.append('values')
+
+    queryset = board.items.all()
+    group = params.get('group')
+    if group:
+        if not group.isdigit():
+            raise ApiError('group must be a group id')
+        queryset = queryset.filter(group_id=int(group))
+
+    rows, next_cursor = paginate(
+        queryset.values('id', *columns), params.get('cursor'), parse_limit(params.get('limit')),
+    )
+    if cells and 'values' not in fields:
+        for row in rows:
+            values = row['values'] or {}
+            row['values'] = {key: values[key] for key in cells if key in values}
+    return {'results': rows, 'next': next_cursor}
+
+
+def update_page(item, params):
+    """The item's updates, newest first, projected to ?fields= and paginated."""
+    fields = parse_fields(params.get('fields'), UPDATE_FIELDS)
+    lookups = [UPDATE_LOOKUPS.get(name, name) for name in fields]
+    rows, next_cursor = paginate(
+        item.updates.values('id', *lookups), params.get('cursor'), parse_limit(params.get('limit')),
+        descending=True,
+    )
+    renames = [(lookup, name) for name, lookup in zip(fields, lookups) if lookup != name]
+    for row in rows:
+        for lookup, name in renames:
+            row[name] = row.pop(lookup)
+    return {'results': rows, 'next': next_cursor}
@@ -0,0 +1,231 @@
+"""
+End-to-end benchmarks for the hot views and write paths.
+
+Each scenario is a request made with the Django test client against whatever data is
+in the database (see the generate_tenant command). Latency is sampled over many
+iterations and reported as p50/p95/p99; query counts and peak Python allocations
+(tracemalloc) are measured in a separate pass so their overhead does not skew timings.
+Write scenarios run inside a transaction that is rolled back, so the dataset is
+unchanged between runs.
+"""
+import json
+import platform
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+from django.db import connection, transaction
+from django.db.models import Count
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from .models import Board, Column, Item
+
+
+def percentile(samples, pct):
+    """Nearest-rank percentile of a list of numbers."""
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    rank = max(1, -(-len(ordered) * pct // 100))  # ceil without floats
+    return ordered[int(rank) - 1]
+
+
+def pick_target(organization_id=None, board_id=None):
+    """
+    Returns (board, user) to benchmark: `board_id` or the largest board of the organization
+    (default: the organization with the most items), and that organization's owner.
+    """
+    from core.models import Organization
+
+    if board_id:
+        board = Board.objects.select_related('workspace__organization__owner').filter(id=board_id).first()
+        return (board, board.workspace.organization.owner) if board else (None, None)
+    organizations = Organization.objects.annotate(n=Count('items')).order_by('-n', '-id')
+    if organization_id:
+        organizations = organizations.filter(id=organization_id)
+    organization = organizations.select_related('owner').first()
+    if organization is None:
+        return None, None
+    board = Board.objects.filter(workspace__organization=organization).annotate(
+        n=Count('items')
+    ).order_by('-n', 'id').first()
+    return board, organization.owner
+
+
+class Scenario:
+    def __init__(self, name, method, url, data=None, content_type=None, writes=False):
+        self.name = name
+        self.method = method
+        self.url = url
+        self.data = data
+        self.content_type = content_type
+        self.writes = writes
+
+    def request(self, client):
+        if self.method == 'get':
+            response = client.get(self.url, self.data or {})
+        elif self.content_type:
+            response = client.post(self.url, self.data, content_type=self.content_type)
+        else:
+            response = client.post(self.url, self.data or {})
+        if response.streaming:
+            # Streamed pages do most of their work while the body is read
+            b''.join(response.streaming_content)
+        return response
+
+
+def build_scenarios(board, user):
+    """
+    The benchmarked requests for one board. Write scenarios touch the board's first item.
+    """
+    item = Item.objects.filter(board=board, parent__isnull=True).order_by('group__position', 'position').first()
+    status = Column.objects.filter(board=board, type='status').order_by('position', 'id').first()
+    text = Column.objects.filter(board=board, type='text').order_by('position', 'id').first()
+    other_group = board.groups.order_by('-position').first()
+    search_word = item.name.split()[0] if item else 'plan'
+
+    scenarios = [
+        Scenario('board_detail', 'get', reverse('board_detail', args=[board.id])),
+        Scenario('kanban_view', 'get', reverse('board_kanban', args=[board.id])),
+        Scenario('calendar_view', 'get', reverse('board_calendar', args=[board.id])),
+        Scenario('my_work_view', 'get', reverse('my_work')),
+        Scenario('global_search', 'get', reverse('global_search'), {'q': search_word}),
+    ]
+    if item and text:
+        scenarios.append(Scenario(
+            'update_status', 'post', reverse('update_status', args=[item.id, text.id]),
+            {'action_value': 'Benchmark edit'}, writes=True,
+        ))
+    if item and other_group:
+        scenarios.append(Scenario(
+            'update_item_order', 'post', reverse('update_item_order'),
+            json.dumps({'itemId': item.id, 'newPosition': 1, 'newGroupId': other_group.id}),
+            content_type='application/json', writes=True,
+        ))
+    if item and status:
+        # Fires the board's status_change rules (and their actions) through the normal edit path
+        scenarios.append(Scenario(
+            'automation_status_change', 'post', reverse('update_status', args=[item.id, status.id]),
+            {'action_value': 'Done'}, writes=True,
+        ))
+    return scenarios
+
+
+class _Rollback(Exception):
+    pass
+
+
+class BenchmarkRunner:
+    """
+    Usage:
+        results = BenchmarkRunner(board, user, iterations=30).run()
+    """
+
+    def __init__(self, board, user, iterations=30, warmup=3, alloc_iterations=1, only=None, log=None):
+        self.board = board
+        self.user = user
+        self.iterations = iterations
+        self.warmup = warmup
+        self.alloc_iterations = alloc_iterations
+        self.only = set(only or ())
+        self.log = log or (lambda message: None)
+        self.client = Client()
+        self.client.force_login(user)
+
+    def _call(self, scenario):
+        if not scenario.writes:
+            return scenario.request(self.client)
+        response = None
+        try:
+            with transaction.atomic():
+                response = scenario.request(self.client)
+                raise _Rollback
+        except _Rollback:
+            pass
+        return response
+
+    def measure(self, scenario):
+        for _ in range(self.warmup):
+            self._call(scenario)
+
+        timings = []
+        status_code = None
+        for _ in range(self.iterations):
+            start = time.perf_counter()
+            response = self._call(scenario)
+            timings.append((time.perf_counter() - start) * 1000)
+            status_code = response.status_code
+
+        with CaptureQueriesContext(connection) as ctx:
+            self._call(scenario)
+        # The rollback savepoint statements are not part of the view's cost
+        queries = len([q for q in ctx.captured_queries if 'SAVEPOINT' not in q['sql']])
+
+        peaks = []
+        for _ in range(self.alloc_iterations):
+            tracemalloc.start()
+            self._call(scenario)
+            peaks.append(tracemalloc.get_traced_memory()[1])
+            tracemalloc.stop()
+
+        return {
+            'status': status_code,
+            'iterations': len(timings),
+            'mean_ms': round(sum(timings) / len(timings), 3),
+            'p50_ms': round(percentile(timings, 50), 3),
+            'p95_ms': round(percentile(timings, 95), 3),
+            'p99_ms': round(percentile(timings, 99), 3),
+            'queries': queries,
+            'alloc_peak_kb': round(max(peaks) / 1024, 1) if peaks else None,
+        }
+
+    def run(self):
+        results = {}
+        for scenario in build_scenarios(self.board, self.user):
+            if self.only and scenario.name not in self.only:
+                continue
+            results[scenario.name] = self.measure(scenario)
+            r = results[scenario.name]
+            self.log(f"{scenario.name:<26} p50 {r['p50_ms']:>9.2f}ms  p95 {r['p95_ms']:>9.2f}ms  "
+                     f"p99 {r['p99_ms']:>9.2f}ms  {r['queries']:>4} queries  {r['alloc_peak_kb']:>9} KB")
+        return {
+            'meta': {
+                'created_at': datetime.now(timezone.utc).isoformat(),
+                'board': self.board.id,
+                'board_items': Item.objects.filter(board=self.board).count(),
+                'organization_items': Item.objects.filter(organization_id=self.board.workspace.organization_id).count(),
+                'iterations': self.iterations,
+                'database': connection.vendor,
+                'python': platform.python_version(),
+            },
+            'results': results,
+        }
+
+
+def compare(current, baseline, threshold=0.10):
+    """
+    Compares two result documents. Returns a list of rows
+    (name, metric, baseline, current, change, regressed) for every shared scenario.
+    A latency metric regresses when it grows by more than `threshold`; query counts
+    regress on any increase.
+    """
+    rows = []
+    for name, result in current['results'].items():
+        base = baseline.get('results', {}).get(name)
+        if not base:
+            continue
+        for metric in ('p50_ms', 'p95_ms', 'p99_ms', 'queries', 'alloc_peak_kb'):
+            old, new = base.get(metric), result.get(metric)
+            if old is None or new is None:
+                continue
+            change = (new - old) / old if old else 0.0
+            if metric == 'queries':
+                regressed = new > old
+            elif metric == 'alloc_peak_kb':
+                regressed = change > threshold * 2
+            else:
+                regressed = change > threshold
+            rows.append((name, metric, old, new, change, regressed))
+    return rows
@@ -0,0 +1,125 @@
+"""
+Multi-item operations (update values, move, delete) for a single board.
+
+Access is checked once by the caller, writes go out as bulk_update / a single
+DELETE, and automations fire as one batched pass per trigger type.
+"""
+import json
+
+from django.db import transaction
+from django.db.models import F, Max
+from django.utils import timezone
+
+from .changes import item_payload
+from .formula_service import FormulaEngine
+from .models import Board, Item
+from .patching import set_value_keys
+from .signals import batched_board_changes
+
+
+def _load_items(board, item_ids):
+    items = list(Item.objects.filter(board=board, id__in=item_ids).select_related('group'))
+    for item in items:
+        # Handlers reach the board through item.group.board; reuse the instance we have
+        item.group.board = board
+    return items
+
+
+def _refresh(items, *fields):
+    """Copies the freshly written `fields` back onto the in-memory items."""
+    rows = Item.objects.filter(id__in=[item.id for item in items]).values('id', *fields)
+    current = {row['id']: row for row in rows}
+    for item in items:
+        for name in fields:
+            setattr(item, name, current[item.id][name])
+
+
+def bulk_update_values(board, item_ids, changes):
+    """
+    Applies `changes` ({column_id: value}) to every listed item on the board.
+    Unknown column ids are ignored. Returns the number of items updated.
+
+    The changed keys and the version bump go out as one UPDATE, so concurrent writers
+    neither overwrite other keys of the same items nor hand out the same version twice.
+    """
+    from automation.service import AutomationEngine
+
+    columns = list(board.columns.all())
+    known = {str(c.id) for c in columns}
+    changes = {str(k): v for k, v in changes.items() if str(k) in known}
+    if not changes:
+        return 0
+
+    items = _load_items(board, item_ids)
+    if not items:
+        return 0
+    now = timezone.now()
+    history = [(item, dict(item.values)) for item in items]
+
+    with transaction.atomic():
+        set_value_keys(
+            Item.objects.filter(id__in=[item.id for item in items]), changes,
+            version=F('version') + 1, updated_at=now,
+        )
+        _refresh(items, 'values', 'version')
+        # Formula results depend on each item's other cells; write back only the results
+        # that changed, one UPDATE per distinct set of them
+        results = {}
+        for item in items:
+            before = dict(item.values)
+            FormulaEngine.recompute(item.values, columns)
+            changed = {k: v for k, v in item.values.items() if before.get(k, object()) != v}
+            item.updated_at = now
+            if changed:
+                key = json.dumps(changed, sort_keys=True, default=str)
+                results.setdefault(key, (changed, []))[1].append(item.id)
+        for changed, ids in results.values():
+            set_value_keys(Item.objects.filter(id__in=ids), changed)
+        Board.bump_version(board.id, [('item', 'update', item.id, item_payload(item)) for item in items])
+
+    AutomationEngine.run_change_automations_bulk(board, history, columns)
+    return len(items)
+
+
+def bulk_move(board, item_ids, group):
+    """
+    Moves the listed items to the end of `group` (which must belong to the board),
+    keeping their relative order. Returns the number of items moved.
+    """
+    from automation.service import AutomationEngine
+
+    items = _load_items(board, item_ids)
+    items.sort(key=lambda i: (i.group.position, i.position, i.id))
+    last_position = group.items.aggregate(last=Max('position'))['last'] or 0
+    now = timezone.now()
+    moved = []
+    for offset, item in enumerate(items, start=1):
+        if item.group_id != group.id:
+            moved.append(item)
+        item.group = group
+        item.position = last_position + offset
+        item.updated_at = now
+        item.version = F('version') + 1
+
+    with transaction.atomic():
+        Item.objects.bulk_update(items, ['group', 'position', 'updated_at', 'version'], batch_size=500)
+        if items:
+            _refresh(items, 'version')
+        Board.bump_version(board.id, [('item', 'update', item.id, item_payload(item)) for item in items])
+
+    if moved:
+        AutomationEngine.run_automations_bulk(board, 'item_moved', [
+            {'item': item, 'new_group_id': group.id} for item in moved
+        ])
+    return len(items)
+
+
+def bulk_delete(board, item_ids):
+    """
+    Deletes the listed items (and their subitems, updates, attachments) in one pass.
+    Returns the number of items deleted.
+    """
+    with transaction.atomic(), batched_board_changes() as touched:
+        touched.add(board.id)
+        _, per_model = Item.objects.filter(board=board, id__in=item_ids).delete()
+    return per_model.get(Item._meta.label, 0)
@@ -0,0 +1,75 @@
+"""
+Pre-resolved cell view-models for item rows.
+
+The row templates used to look up every cell through the get_value filter, reverse the
+update URL for every cell (and for every choice in a cell's menu), and read choice lists
+from column settings per row. Everything that only depends on the column is resolved once
+per column in a ColumnSpec; each row then gets a flat list of Cells in column order.
+"""
+from django.urls import reverse
+
+# Stand-in item id used to reverse the update URL once per column
+_ITEM_SENTINEL = 987654321
+
+RATING_OPTIONS = ['1', '2', '3', '4', '5']
+COUNTRY_OPTIONS = ['🇺🇸 US', '🇬🇧 UK', '🇨🇦 CA', '🇩🇪 DE', '🇫🇷 FR', '🇮🇳 IN', '🇯🇵 JP', '🇦🇺 AU']
+
+
+class ColumnSpec:
+    """Per-column data shared by every row of a board render."""
+    __slots__ = ('id', 'type', 'key', 'result_key', 'label', 'choices', 'options', 'url_prefix', 'url_suffix')
+
+    def __init__(self, column):
+        self.id = column.id
+        self.type = column.type
+        self.key = str(column.id)
+        self.result_key = f"{column.id}_result"
+        self.label = column.type.title()
+        self.choices = (column.settings or {}).get('choices') or ''
+        if column.type == 'rating':
+            self.options = RATING_OPTIONS
+        elif column.type == 'country':
+            self.options = COUNTRY_OPTIONS
+        else:
+            self.options = ()
+        url = reverse('update_status', args=[_ITEM_SENTINEL, column.id])
+        self.url_prefix, self.url_suffix = url.split(str(_ITEM_SENTINEL), 1)
+
+
+class Cell:
+    """One cell of a row: its column, raw value and the strings the template shows."""
+    __slots__ = ('column', 'value', 'update_url', 'display', 'checked', 'result')
+
+    def __init__(self, column, value, update_url, display='', checked=False, result=''):
+        self.column = column
+        self.value = value
+        self.update_url = update_url
+        self.display = display
+        self.checked = checked
+        self.result = result
+
+
+def column_specs(columns):
+    return [ColumnSpec(column) for column in columns]
+
+
+def build_cells(item, specs):
+    values = item.values or {}
+    item_id = str(item.id)
+    cells = []
+    for spec in specs:
+        value = values.get(spec.key, '')
+        display, checked, result = '', False, ''
+        if spec.type == 'person' and value:
+            display = str(value)[:2].upper()
+        elif spec.type == 'checkbox':
+            checked = value in ('true', True)
+        elif spec.type == 'formula':
+            result = values.get(spec.result_key, '')
+        cells.append(Cell(spec, value, spec.url_prefix + item_id + spec.url_suffix, display, checked, result))
+    return cells
+
+
+def row_context(item, specs, users):
+    """Template context for item_row_final.html."""
+    return {'item': item, 'cells': build_cells(item, specs), 'users': users}
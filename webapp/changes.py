@@ -0,0 +1,208 @@
+"""
+Per-board change feed.
+
+Every Board.bump_version() call logs what changed as BoardChange rows whose `seq` is the
+new board version (the receivers in webapp.signals describe item, group and column
+changes). Viewers follow a board over Server-Sent Events: each connection is one
+coroutine that sleeps until this process commits a change to the board (notify()), or
+until BOARD_FEED_POLL_INTERVAL passes, which picks up changes committed by other
+processes. Each wake-up costs one indexed range query on (board, seq).
+
+Events carry JSON patches:
+
+    id: 42
+    event: change
+    data: {"seq": 42, "kind": "item", "action": "update", "id": 7, "data": {...}}
+
+A group deletion is logged once and stands for the deletion of the group's items.
+
+The `id` lets EventSource resume with Last-Event-ID after a reconnect. Clients that were
+away longer fetch delta() instead: the squashed changes since their last seq, or a full
+snapshot once compact() has removed the entries they would need.
+"""
+import asyncio
+import json
+import threading
+import time
+
+from django.conf import settings
+
+DEFAULT_POLL_INTERVAL = 5.0
+DEFAULT_MAX_AGE = 300
+DEFAULT_RETENTION_DAYS = 7
+FETCH_LIMIT = 500
+DELTA_LIMIT = 2000
+
+# board_id -> set of (event loop, asyncio.Event) for the open streams in this process
+_listeners = {}
+_listeners_lock = threading.Lock()
+
+
+def item_payload(item):
+    return {
+        'group_id': item.group_id, 'parent_id': item.parent_id, 'name': item.name,
+        'position': item.position, 'values': item.values, 'version': item.version,
+    }
+
+
+def group_payload(group):
+    return {'title': group.title, 'color': group.color, 'position': group.position}
+
+
+def column_payload(column):
+    return {'title': column.title, 'type': column.type, 'position': column.position, 'settings': column.settings}
+
+
+def notify(board_id, seq=None):
+    """Wakes this process's streams for the board. Safe to call from any thread."""
+    with _listeners_lock:
+        listeners = list(_listeners.get(board_id, ()))
+    for loop, event in listeners:
+        try:
+            loop.call_soon_threadsafe(event.set)
+        except RuntimeError:
+            pass  # Loop already closed; the stream is being torn down
+
+
+def _listen(board_id, loop, event):
+    with _listeners_lock:
+        _listeners.setdefault(board_id, set()).add((loop, event))
+
+
+def _unlisten(board_id, loop, event):
+    with _listeners_lock:
+        listeners = _listeners.get(board_id)
+        if listeners is not None:
+            listeners.discard((loop, event))
+            if not listeners:
+                del _listeners[board_id]
+
+
+def changes_since(board_id, since, limit=FETCH_LIMIT):
+    """
+    (changes, more): logged changes with seq > `since`, oldest first, as dicts, and whether
+    more follow. Readers resume from the last seq they saw, so a page always ends on a whole
+    seq; a single bulk seq with more than `limit` entries is returned in full.
+    """
+    from .models import BoardChange
+    log = BoardChange.objects.filter(board_id=board_id)
+    changes = list(log.filter(seq__gt=since).order_by('seq', 'id')[:limit + 1])
+    more = len(changes) > limit
+    if more:
+        last_seq = changes[-1].seq
+        complete = [change for change in changes if change.seq < last_seq]
+        changes = complete or list(log.filter(seq=last_seq).order_by('id'))
+    return [change.as_dict() for change in changes], more
+
+
+def squash(changes):
+    """
+    Folds the changes down to one entry per object, in order of each object's last change:
+    an insert followed by updates stays an insert with the latest data, and an object both
+    inserted and deleted in the range is dropped.
+    """
+    merged = {}
+    for change in changes:
+        key = (change['kind'], change['id'])
+        previous = merged.pop(key, None)
+        if previous is not None and previous['action'] == 'insert':
+            if change['action'] == 'delete':
+                continue
+            change = dict(change, action='insert')
+        merged[key] = change
+    return list(merged.values())
+
+
+def snapshot(board_id):
+    """The board's current columns, groups and items, shaped like the change payloads."""
+    from .models import Column, Group, Item
+    columns = Column.objects.filter(board_id=board_id).order_by('position')
+    groups = Group.objects.filter(board_id=board_id).order_by('position')
+    items = Item.objects.filter(board_id=board_id).only(
+        'id', 'group_id', 'parent_id', 'name', 'position', 'values', 'version'
+    ).order_by('position', 'id')
+    return {
+        'columns': [dict(column_payload(c), id=c.id) for c in columns],
+        'groups': [dict(group_payload(g), id=g.id) for g in groups],
+        'items': [dict(item_payload(i), id=i.id) for i in items.iterator(chunk_size=2000)],
+    }
+
+
+def delta(board, since, limit=DELTA_LIMIT):
+    """
+    What a client that has seen the board up to `since` needs to catch up:
+    {'version', 'changes': [...]} with the squashed changes, or {'version', 'snapshot': {...}}
+    when the log no longer covers the range (compacted, or the client is ahead of the board),
+    logs a full reload, or holds more than `limit` entries.
+    """
+    from .models import BoardChange
+    version = board.version
+    if since == version:
+        return {'version': version, 'changes': []}
+    changes = []
+    if since < version:
+        changes = [
+            change.as_dict()
+            for change in BoardChange.objects.filter(board_id=board.id, seq__gt=since, seq__lte=version)
+            .order_by('seq', 'id')[:limit + 1]
+        ]
+    # Every version logs at least one entry, so a missing first seq means it was compacted
+    complete = (
+        changes and changes[0]['seq'] == since + 1 and len(changes) <= limit
+        and not any(change['action'] == 'reload' for change in changes)
+    )
+    if not complete:
+        return {'version': version, 'snapshot': snapshot(board.id)}
+    return {'version': version, 'changes': squash(changes)}
+
+
+def compact(retention_days=None):
+    """Deletes change log entries older than BOARD_CHANGE_RETENTION_DAYS. Returns the count."""
+    from datetime import timedelta
+    from django.utils import timezone
+    from .models import BoardChange
+
+    retention_days = retention_days or getattr(settings, 'BOARD_CHANGE_RETENTION_DAYS', DEFAULT_RETENTION_DAYS)
+    cutoff = timezone.now() - timedelta(days=retention_days)
+    deleted, _ = BoardChange.objects.filter(created_at__lt=cutoff).delete()
+    return deleted
+
+
+def format_event(change):
+    return f"id: {change['seq']}\nevent: change\ndata: {json.dumps(change, separators=(',', ':'))}\n\n"
+
+
+async def stream(board_id, since, poll_interval=None, max_age=None):
+    """
+    Async generator of SSE chunks for the board, starting after `since`. Ends after
+    `max_age` seconds; the browser then reconnects with Last-Event-ID.
+    """
+    from asgiref.sync import sync_to_async
+
+    poll_interval = poll_interval or getattr(settings, 'BOARD_FEED_POLL_INTERVAL', DEFAULT_POLL_INTERVAL)
+    max_age = max_age or getattr(settings, 'BOARD_FEED_MAX_AGE', DEFAULT_MAX_AGE)
+    fetch = sync_to_async(changes_since)
+    loop = asyncio.get_running_loop()
+    event = asyncio.Event()
+    deadline = time.monotonic() + max_age
+    _listen(board_id, loop, event)
+    try:
+        yield f"retry: {int(poll_interval * 1000)}\n\n"
+        while True:
+            event.clear()
+            changes, more = await fetch(board_id, since)
+            for change in changes:
+                since = change['seq']
+                yield format_event(change)
+            if more:
+                continue
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            try:
+                await asyncio.wait_for(event.wait(), timeout=min(poll_interval, remaining))
+            except asyncio.TimeoutError:
+                # Comment line: keeps proxies from closing an idle connection
+                yield ": keepalive\n\n"
+    finally:
+        _unlisten(board_id, loop, event)
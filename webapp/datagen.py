@@ -0,0 +1,350 @@
+"""
+Synthetic tenant data for performance work.
+
+TenantGenerator builds one organization with users, workspaces, boards (one column of
+every Column.COLUMN_TYPES type), groups, items, subitems, updates, attachment metadata
+and automation rules. Everything is written with bulk_create and driven by a seeded RNG,
+so the same options always produce the same dataset.
+"""
+import math
+import random
+from datetime import date, timedelta
+
+from django.db import transaction
+
+from .models import Board, Column, Group, Item, ItemAttachment, ItemUpdate, Workspace
+
+GENERATOR_BATCH_SIZE = 5000
+
+WORDS = (
+    'launch plan review budget design api mobile release bug fix onboarding campaign '
+    'report audit migrate sync dashboard invoice contract hiring roadmap research test '
+    'deploy refactor survey webinar partner pricing feedback backlog sprint metrics'
+).split()
+STATUSES = ['Not Started', 'Working on it', 'Stuck', 'Done']
+PRIORITIES = ['Critical', 'High', 'Medium', 'Low']
+TAGS = ['frontend', 'backend', 'urgent', 'q1', 'q2', 'customer', 'internal', 'design']
+COUNTRIES = ['United States', 'India', 'Germany', 'Brazil', 'Japan', 'United Kingdom', 'France']
+TIMEZONES = ['UTC', 'Europe/London', 'America/New_York', 'Asia/Kolkata', 'Asia/Tokyo']
+CITIES = ['London', 'New York', 'Mumbai', 'Berlin', 'Tokyo', 'Sao Paulo']
+
+RULE_TEMPLATES = [
+    ('status_change', 'send_notification'),
+    ('item_created', 'create_update'),
+    ('column_changed', 'send_notification'),
+    ('item_moved', 'create_update'),
+    ('status_change', 'change_status'),
+]
+
+
+def board_weights(count, distribution):
+    """
+    Share of items per board. 'uniform' splits evenly; 'skewed' follows a Zipf-like
+    curve (a few very large boards and a long tail), which is closer to real tenants.
+    """
+    if distribution == 'skewed':
+        weights = [1 / (rank ** 1.1) for rank in range(1, count + 1)]
+    else:
+        weights = [1.0] * count
+    total = sum(weights)
+    return [w / total for w in weights]
+
+
+class TenantGenerator:
+    """
+    Usage:
+        summary = TenantGenerator(items=1_000_000, seed=42).run()
+    """
+
+    def __init__(self, name='Synthetic Tenant', users=25, workspaces=4, boards=5, groups=6,
+                 items=10000, subitem_ratio=0.1, updates_per_item=0.5, attachment_ratio=0.05,
+                 rules_per_board=3, fill=0.7, distribution='skewed', seed=42,
+                 batch_size=GENERATOR_BATCH_SIZE, log=None):
+        self.name = name
+        self.user_count = users
+        self.workspace_count = workspaces
+        self.boards_per_workspace = boards
+        self.groups_per_board = groups
+        self.item_count = items
+        self.subitem_ratio = subitem_ratio
+        self.updates_per_item = updates_per_item
+        self.attachment_ratio = attachment_ratio
+        self.rules_per_board = rules_per_board
+        self.fill = fill
+        self.distribution = distribution
+        self.batch_size = batch_size
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.log = log or (lambda message: None)
+        self.today = date.today()
+        self.counts = {'users': 0, 'boards': 0, 'items': 0, 'subitems': 0,
+                       'updates': 0, 'attachments': 0, 'rules': 0}
+
+    # --- Tenant skeleton -------------------------------------------------
+
+    def _create_users(self):
+        from core.models import Membership, Organization, User
+
+        from django.utils.text import slugify
+
+        # Usernames derive from name + seed so the same options give the same people
+        slug = f"{slugify(self.name) or 'tenant'}-{self.seed}"
+        if User.objects.filter(username__startswith=f'{slug}-user').exists():
+            raise ValueError(f"A tenant named {self.name!r} was already generated with seed {self.seed}")
+        users = User.objects.bulk_create([
+            User(
+                username=f'{slug}-user{i}', email=f'{slug}-user{i}@example.test',
+                first_name=self.rng.choice(WORDS).title(), last_name=f'User{i}',
+                password='!',  # unusable password
+            )
+            for i in range(self.user_count)
+        ])
+        if not users[0].pk:
+            users = list(User.objects.filter(username__startswith=f'{slug}-user').order_by('id'))
+        organization = Organization.objects.create(name=self.name, owner=users[0])
+        roles = ['admin'] + ['member'] * (len(users) - 1)
+        Membership.objects.bulk_create([
+            Membership(user=user, organization=organization, role=role) for user, role in zip(users, roles)
+        ])
+        self.counts['users'] = len(users)
+        return organization, users
+
+    def _create_columns(self, board):
+        columns = []
+        seen = set()
+        for position, (col_type, label) in enumerate(Column.COLUMN_TYPES):
+            if col_type in seen:
+                continue
+            seen.add(col_type)
+            settings = {}
+            if col_type == 'status':
+                settings = {'choices': STATUSES}
+            elif col_type == 'dropdown':
+                settings = {'choices': ['Option A', 'Option B', 'Option C']}
+            columns.append(Column(board=board, title=label, type=col_type, settings=settings, position=position))
+        return Column.objects.bulk_create(columns)
+
+    # --- Cell values -----------------------------------------------------
+
+    def _value(self, column, board_state, sequence):
+        rng = self.rng
+        col_type = column.type
+        if col_type == 'status':
+            return rng.choice(STATUSES)
+        if col_type == 'priority':
+            return rng.choice(PRIORITIES)
+        if rng.random() > self.fill:
+            return None
+        if col_type == 'text':
+            return ' '.join(rng.choices(WORDS, k=rng.randint(2, 6)))
+        if col_type == 'date':
+            return (self.today + timedelta(days=rng.randint(-60, 90))).isoformat()
+        if col_type == 'timeline':
+            start = self.today + timedelta(days=rng.randint(-60, 60))
+            return {'start': start.isoformat(), 'end': (start + timedelta(days=rng.randint(0, 20))).isoformat()}
+        if col_type == 'person':
+            return rng.choice(board_state['usernames'])
+        if col_type == 'number':
+            return rng.randint(0, 10000)
+        if col_type == 'dropdown':
+            return rng.choice(column.settings['choices'])
+        if col_type == 'checkbox':
+            return rng.random() < 0.5
+        if col_type == 'file':
+            return f'/media/attachments/synthetic/{sequence}.pdf'
+        if col_type == 'tags':
+            return rng.sample(TAGS, rng.randint(1, 3))
+        if col_type == 'link':
+            return f'https://example.com/{rng.choice(WORDS)}/{sequence}'
+        if col_type == 'world_clock':
+            return rng.choice(TIMEZONES)
+        if col_type == 'phone':
+            return f'+1 555 {rng.randint(100, 999)} {rng.randint(1000, 9999)}'
+        if col_type == 'location':
+            return rng.choice(CITIES)
+        if col_type == 'rating':
+            return rng.randint(1, 5)
+        if col_type == 'progress':
+            return rng.randint(0, 100)
+        if col_type == 'email':
+            return f'{rng.choice(WORDS)}{sequence}@example.test'
+        if col_type == 'vote':
+            return rng.randint(0, 20)
+        if col_type == 'auto_number':
+            return sequence
+        if col_type == 'country':
+            return rng.choice(COUNTRIES)
+        if col_type == 'color_picker':
+            return '#%06x' % rng.randint(0, 0xFFFFFF)
+        if col_type == 'time_tracking':
+            return rng.randint(0, 8 * 3600)
+        if col_type == 'week':
+            day = self.today + timedelta(days=rng.randint(-60, 90))
+            year, week, _ = day.isocalendar()
+            return f'{year}-W{week:02d}'
+        if col_type == 'hour':
+            return f'{rng.randint(8, 18):02d}:{rng.choice(["00", "15", "30", "45"])}'
+        if col_type in ('dependency', 'connect_boards'):
+            recent = board_state['recent']
+            if not recent:
+                return None
+            picks = rng.sample(recent, min(len(recent), rng.randint(1, 2)))
+            return {'ids': [pk for pk, _ in picks], 'names': [name for _, name in picks]}
+        # item_id, creation_log, last_updated are derived from the item itself
+        return None
+
+    def _values(self, board_state, sequence):
+        values = {}
+        for column in board_state['columns']:
+            if column.type == 'formula':
+                continue
+            value = self._value(column, board_state, sequence)
+            if value is not None:
+                values[str(column.id)] = value
+        # Formula: stored expression plus its precomputed result (see FormulaEngine.recompute)
+        formula, number = board_state['formula'], board_state['number']
+        number_value = values.get(str(number.id))
+        if number_value is not None:
+            values[str(formula.id)] = '={Numbers} * 2'
+            values[str(formula.id) + '_result'] = number_value * 2
+        return values
+
+    # --- Items -----------------------------------------------------------
+
+    def _flush(self, board_state, batch):
+        created = Item.objects.bulk_create(batch, batch_size=self.batch_size)
+        if not created or not created[0].pk:
+            return
+        rng = self.rng
+        self.counts['items'] += len(created)
+        board_state['recent'] = [(item.pk, item.name) for item in created[-500:]]
+
+        subitems, updates, attachments = [], [], []
+        users = board_state['users']
+        for item in created:
+            if rng.random() < self.subitem_ratio:
+                for n in range(rng.randint(1, 3)):
+                    subitems.append(Item(
+                        group_id=item.group_id, board_id=item.board_id, organization_id=item.organization_id,
+                        parent_id=item.pk, name=f'{item.name} / step {n + 1}', position=n,
+                        created_by=item.created_by, values={},
+                    ))
+            for _ in range(self._poisson(self.updates_per_item)):
+                updates.append(ItemUpdate(
+                    item_id=item.pk, user=rng.choice(users),
+                    body=' '.join(rng.choices(WORDS, k=rng.randint(4, 16))).capitalize(),
+                ))
+            if rng.random() < self.attachment_ratio:
+                attachments.append(ItemAttachment(
+                    item_id=item.pk, file=f'attachments/synthetic/{item.pk}.pdf',
+                    uploaded_by=rng.choice(users), column_id=str(board_state['file'].id),
+                ))
+        Item.objects.bulk_create(subitems, batch_size=self.batch_size)
+        ItemUpdate.objects.bulk_create(updates, batch_size=self.batch_size)
+        ItemAttachment.objects.bulk_create(attachments, batch_size=self.batch_size)
+        self.counts['subitems'] += len(subitems)
+        self.counts['updates'] += len(updates)
+        self.counts['attachments'] += len(attachments)
+
+    def _poisson(self, mean):
+        # Knuth's method; means here are small
+        if mean <= 0:
+            return 0
+        limit, k, p = math.exp(-mean), 0, 1.0
+        while True:
+            p *= self.rng.random()
+            if p <= limit:
+                return k
+            k += 1
+
+    def _fill_board(self, board, organization, users, item_total):
+        from automation.models import AutomationRule
+
+        rng = self.rng
+        columns = self._create_columns(board)
+        by_type = {c.type: c for c in columns}
+        groups = Group.objects.bulk_create([
+            Group(board=board, title=f'{rng.choice(WORDS).title()} {n + 1}', position=n,
+                  color=rng.choice(['#579bfc', '#00c875', '#fdab3d', '#e2445c', '#a25ddc']))
+            for n in range(self.groups_per_board)
+        ])
+        if not groups[0].pk:
+            groups = list(Group.objects.filter(board=board).order_by('position'))
+
+        board_state = {
+            'columns': columns, 'users': users, 'usernames': [u.username for u in users],
+            'formula': by_type['formula'], 'number': by_type['number'], 'file': by_type['file'],
+            'recent': [],
+        }
+        positions = {g.id: 0 for g in groups}
+        batch = []
+        for sequence in range(1, item_total + 1):
+            group = rng.choice(groups)
+            positions[group.id] += 1
+            batch.append(Item(
+                group=group, board=board, organization=organization,
+                name=' '.join(rng.choices(WORDS, k=rng.randint(2, 4))).capitalize(),
+                position=positions[group.id], created_by=rng.choice(users),
+                values=self._values(board_state, sequence),
+            ))
+            if len(batch) >= self.batch_size:
+                self._flush(board_state, batch)
+                batch = []
+        if batch:
+            self._flush(board_state, batch)
+
+        status = by_type['status']
+        rules = []
+        for n in range(self.rules_per_board):
+            trigger, action = RULE_TEMPLATES[n % len(RULE_TEMPLATES)]
+            trigger_config = {'column_id': status.id, 'value': 'Done'} if trigger == 'status_change' else {}
+            action_config = {
+                'send_notification': {},
+                'create_update': {'message': 'Automated update'},
+                'change_status': {'column_id': status.id, 'new_value': 'Working on it'},
+            }[action]
+            rules.append(AutomationRule(
+                board=board, name=f'{trigger} -> {action}', trigger_type=trigger,
+                trigger_config=trigger_config, action_type=action, action_config=action_config,
+            ))
+        AutomationRule.objects.bulk_create(rules)
+        self.counts['rules'] += len(rules)
+        # bulk_create skips the signals that normally bump the version
+        Board.bump_version(board.id)
+
+    def run(self):
+        """
+        Builds the tenant and returns a summary dict (organization id plus row counts).
+        """
+        organization, users = self._create_users()
+        workspaces = Workspace.objects.bulk_create([
+            Workspace(name=f'Workspace {n + 1}', organization=organization) for n in range(self.workspace_count)
+        ])
+        if not workspaces[0].pk:
+            workspaces = list(Workspace.objects.filter(organization=organization).order_by('id'))
+
+        board_total = self.workspace_count * self.boards_per_workspace
+        weights = board_weights(board_total, self.distribution)
+        # Largest remainder keeps the per-board counts summing exactly to item_count
+        shares = [w * self.item_count for w in weights]
+        item_counts = [int(s) for s in shares]
+        for index in sorted(range(board_total), key=lambda i: shares[i] - item_counts[i], reverse=True):
+            if sum(item_counts) >= self.item_count:
+                break
+            item_counts[index] += 1
+
+        for index in range(board_total):
+            workspace = workspaces[index // self.boards_per_workspace]
+            with transaction.atomic():
+                board = Board.objects.create(
+                    workspace=workspace, name=f'{self.rng.choice(WORDS).title()} board {index + 1}',
+                    created_by=self.rng.choice(users),
+                )
+                self._fill_board(board, organization, users, item_counts[index])
+            self.counts['boards'] += 1
+            self.log(f"Board {index + 1}/{board_total}: {item_counts[index]} items")
+
+        # Users, memberships and rules were bulk inserted without signals
+        from core import stats
+        stats.reconcile()
+        return {'organization': organization.id, **self.counts}
@@ -0,0 +1,220 @@
+"""
+Board export (CSV / XLSX).
+
+Rows are produced lazily from a single chunked item query, so memory stays flat
+regardless of board size. Column titles, people names and choice lookups are
+resolved once per export, not per cell.
+"""
+import csv
+import json
+import os
+import secrets
+import zipfile
+from xml.sax.saxutils import escape
+
+from .models import Column, Item
+
+EXPORT_CHUNK_SIZE = 2000
+DEFAULT_EXPORT_RETENTION_HOURS = 24
+
+
+class Echo:
+    """
+    File-like object that returns what is written, for streaming csv.writer output.
+    """
+    def write(self, value):
+        return value
+
+
+def _people_names(board):
+    """
+    Maps username -> display name for the board's organization (one query).
+    """
+    from core.models import Membership
+    names = {}
+    memberships = Membership.objects.filter(
+        organization_id=board.workspace.organization_id
+    ).values_list('user__username', 'user__first_name', 'user__last_name')
+    for username, first_name, last_name in memberships:
+        full_name = f"{first_name} {last_name}".strip()
+        names[username] = full_name or username
+    return names
+
+
+def format_cell(column, values, people):
+    """
+    Renders a single cell as plain text for export.
+    """
+    key = str(column.id)
+    if column.type == 'formula':
+        result = values.get(key + '_result')
+        return '' if result is None else str(result)
+
+    value = values.get(key, '')
+    if value in (None, ''):
+        return ''
+    if column.type == 'person':
+        return people.get(value, value)
+    if column.type == 'timeline':
+        if isinstance(value, str):
+            try:
+                value = json.loads(value)
+            except ValueError:
+                return value
+        if isinstance(value, dict):
+            return f"{value.get('start', '')} - {value.get('end', '')}".strip(' -')
+    if column.type in ('dependency', 'connect_boards'):
+        if isinstance(value, dict):
+            return ', '.join(str(n) for n in value.get('names', []))
+    if column.type == 'checkbox':
+        return 'Yes' if value in (True, 'true', 'on', '1', 1) else 'No'
+    if isinstance(value, (list, dict)):
+        return json.dumps(value)
+    return str(value)
+
+
+def iter_board_rows(board):
+    """
+    Yields the header row followed by one list of strings per item.
+    """
+    columns = list(Column.objects.filter(board=board).order_by('position', 'id'))
+    people = _people_names(board)
+
+    yield ['Group', 'Name'] + [c.title for c in columns]
+
+    items = Item.objects.filter(board=board).values_list(
+        'name', 'group__title', 'values'
+    ).order_by('group__position', 'position', 'id')
+    for name, group_title, values in items.iterator(chunk_size=EXPORT_CHUNK_SIZE):
+        values = values or {}
+        yield [group_title, name] + [format_cell(c, values, people) for c in columns]
+
+
+def iter_csv(board):
+    """
+    Streams the board as CSV text, one encoded line at a time.
+    """
+    writer = csv.writer(Echo())
+    for row in iter_board_rows(board):
+        yield writer.writerow(row)
+
+
+XLSX_CONTENT_TYPE = 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+
+_XLSX_STATIC_PARTS = {
+    '[Content_Types].xml': (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/xl/workbook.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+        '<Override PartName="/xl/worksheets/sheet1.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+        '</Types>'
+    ),
+    '_rels/.rels': (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+        'Target="xl/workbook.xml"/>'
+        '</Relationships>'
+    ),
+    'xl/workbook.xml': (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+        'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+        '<sheets><sheet name="Board" sheetId="1" r:id="rId1"/></sheets>'
+        '</workbook>'
+    ),
+    'xl/_rels/workbook.xml.rels': (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+        'Target="worksheets/sheet1.xml"/>'
+        '</Relationships>'
+    ),
+}
+
+
+def write_xlsx(board, fileobj):
+    """
+    Writes the board as a single-sheet XLSX workbook into `fileobj`.
+    The sheet XML is written row by row into the zip entry, so nothing is buffered.
+    """
+    with zipfile.ZipFile(fileobj, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+        for name, content in _XLSX_STATIC_PARTS.items():
+            archive.writestr(name, content)
+        with archive.open('xl/worksheets/sheet1.xml', 'w', force_zip64=True) as sheet:
+            sheet.write(
+                b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                b'<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><sheetData>'
+            )
+            for row in iter_board_rows(board):
+                cells = ''.join(
+                    f'<c t="inlineStr"><is><t xml:space="preserve">{escape(cell)}</t></is></c>' for cell in row
+                )
+                sheet.write(f'<row>{cells}</row>'.encode('utf-8'))
+            sheet.write(b'</sheetData></worksheet>')
+
+
+def export_filename(board, fmt):
+    from django.utils.text import slugify
+    return f"{slugify(board.name) or 'board'}-{board.id}.{fmt}"
+
+
+def export_storage():
+    """
+    Background exports are kept outside MEDIA_ROOT, under EXPORT_ROOT/<board id>/<token>/,
+    and are only served by the download_export view, which checks board access.
+    """
+    from django.conf import settings
+    from django.core.files.storage import FileSystemStorage
+    return FileSystemStorage(location=settings.EXPORT_ROOT)
+
+
+def save_export(board, name, fileobj):
+    """Stores a finished export under a random token and returns the token."""
+    from django.core.files import File
+    token = secrets.token_urlsafe(16)
+    export_storage().save(f'{board.id}/{token}/{name}', File(fileobj, name=name))
+    return token
+
+
+def open_export(board, token):
+    """(file, filename) of the board's export stored under `token`, or None."""
+    storage = export_storage()
+    folder = f'{board.id}/{token}'
+    try:
+        _, files = storage.listdir(folder)
+    except FileNotFoundError:
+        return None
+    if not files:
+        return None
+    return storage.open(f'{folder}/{files[0]}'), files[0]
+
+
+def purge_exports(retention_hours=None):
+    """Deletes exports older than EXPORT_RETENTION_HOURS. Returns the number of files removed."""
+    from datetime import timedelta
+    from django.conf import settings
+    from django.utils import timezone
+
+    retention_hours = retention_hours or getattr(settings, 'EXPORT_RETENTION_HOURS', DEFAULT_EXPORT_RETENTION_HOURS)
+    cutoff = timezone.now() - timedelta(hours=retention_hours)
+    storage = export_storage()
+    if not storage.exists(''):
+        return 0
+    deleted = 0
+    for board_dir in storage.listdir('')[0]:
+        for token in storage.listdir(board_dir)[0]:
+            folder = f'{board_dir}/{token}'
+            for name in storage.listdir(folder)[1]:
+                if storage.get_modified_time(f'{folder}/{name}') < cutoff:
+                    storage.delete(f'{folder}/{name}')
+                    deleted += 1
+            if not any(storage.listdir(folder)):
+                os.rmdir(storage.path(folder))
+    return deleted
@@ -1,6 +1,8 @@
 import re
 from decimal import Decimal
 
+from core import metrics, tracing
+
 class FormulaEngine:
     """
     A simple, safe formula engine for the Monday.com clone.
@@ -8,13 +10,15 @@ class FormulaEngine:
     """
     
     @staticmethod
-    def evaluate(expression, item):
+    def evaluate(expression, item, columns=None):
         """
         Evaluates a formula expression string in the context of an Item.
         Replaces {Column Name} with actual values.
+        Pass the board's `columns` when evaluating many items to avoid a query per call.
         """
         if not expression or not isinstance(expression, str):
             return ""
+        metrics.FORMULA_EVALUATIONS.inc()
 
         # 1. Identify Column References: {Column Name}
         # Regex to find text inside curly braces
@@ -22,7 +26,9 @@ class FormulaEngine:
         
         # 2. Resolve Column Values
         # We need to look up columns by Title on the board
-        board_columns = {c.title: c for c in item.group.board.columns.all()}
+        if columns is None:
+            columns = item.group.board.columns.all()
+        board_columns = {c.title: c for c in columns}
         
         processed_expr = expression
         
@@ -63,3 +69,26 @@ class FormulaEngine:
             return "Error: Div by 0"
         except Exception as e:
             return f"Error: {str(e)}"
+
+    @staticmethod
+    def recompute(values, columns):
+        """
+        Re-evaluates every formula column against a values dict, in place.
+        Formula expressions are stored as '=...' under the column id; results under '<id>_result'.
+        """
+        formula_cols = [c for c in columns if c.type == 'formula']
+        if not formula_cols:
+            return values
+        context = _ValuesContext(values)
+        with tracing.span('formula.recompute', formulas=len(formula_cols)):
+            for f_col in formula_cols:
+                expression = values.get(str(f_col.id), "")
+                if expression and isinstance(expression, str) and expression.startswith("="):
+                    values[str(f_col.id) + '_result'] = FormulaEngine.evaluate(expression[1:], context, columns)
+        return values
+
+
+class _ValuesContext:
+    """Minimal item stand-in for evaluating formulas on a bare values dict."""
+    def __init__(self, values):
+        self.values = values
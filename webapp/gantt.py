@@ -0,0 +1,287 @@
+"""
+Gantt scheduling for boards.
+
+Builds the dependency graph from a board's 'timeline' and 'dependency' columns and
+computes early/late dates, slack and the critical path in one topological pass.
+Results are cached per board version and patched in memory when a single item changes,
+so a timeline edit never re-reads the whole board. Cache writes wait for the surrounding
+transaction to commit: a rolled-back bump hands its version number to the next change,
+which must not find an entry built from the discarded data.
+"""
+import json
+from collections import deque
+from datetime import date
+
+from django.core.cache import cache
+from django.db import transaction
+
+from core import metrics
+
+from .models import Column, Item
+
+CACHE_TIMEOUT = 60 * 60
+
+
+def _cache_key(board_id, version):
+    return f"gantt:{board_id}:{version}"
+
+
+def parse_timeline(value):
+    """
+    Returns (start, end) as date ordinals for a timeline value, or (None, None).
+    Accepts the stored dict ({'start': 'YYYY-MM-DD', 'end': 'YYYY-MM-DD'}) or its JSON string.
+    """
+    if isinstance(value, str):
+        try:
+            value = json.loads(value)
+        except ValueError:
+            return None, None
+    if not isinstance(value, dict):
+        return None, None
+    try:
+        start = date.fromisoformat(value.get('start') or '')
+        end = date.fromisoformat(value.get('end') or '')
+    except (TypeError, ValueError):
+        return None, None
+    if end < start:
+        start, end = end, start
+    return start.toordinal(), end.toordinal()
+
+
+def parse_dependencies(value):
+    """
+    Returns the list of item IDs referenced by a dependency value ({'ids': [...], 'names': [...]}).
+    """
+    if isinstance(value, str):
+        try:
+            value = json.loads(value)
+        except ValueError:
+            return []
+    if isinstance(value, dict):
+        value = value.get('ids', [])
+    if not isinstance(value, list):
+        return []
+    ids = []
+    for raw in value:
+        try:
+            ids.append(int(raw))
+        except (TypeError, ValueError):
+            continue
+    return ids
+
+
+def _make_node(graph, item_id, name, group_id, position, values):
+    values = values or {}
+    start, end = (None, None)
+    if graph['timeline_col']:
+        start, end = parse_timeline(values.get(graph['timeline_col']))
+    deps = []
+    for col_id in graph['dependency_cols']:
+        for dep_id in parse_dependencies(values.get(col_id)):
+            if dep_id != item_id and dep_id not in deps:
+                deps.append(dep_id)
+    return {
+        'id': item_id,
+        'name': name,
+        'group_id': group_id,
+        'position': position,
+        'start': start,
+        'end': end,
+        'deps': deps,
+    }
+
+
+def build_graph(board):
+    """
+    Reads the board once and returns the scheduling graph.
+    Only the fields needed to draw bars are fetched.
+    """
+    columns = Column.objects.filter(board=board, type__in=['timeline', 'dependency']).values_list('id', 'type')
+    timeline_col = None
+    dependency_cols = []
+    for col_id, col_type in columns:
+        if col_type == 'timeline' and timeline_col is None:
+            timeline_col = str(col_id)
+        elif col_type == 'dependency':
+            dependency_cols.append(str(col_id))
+
+    graph = {'timeline_col': timeline_col, 'dependency_cols': dependency_cols, 'nodes': {}}
+    rows = Item.objects.filter(board=board).values_list(
+        'id', 'name', 'group_id', 'position', 'values'
+    ).order_by()
+    for item_id, name, group_id, position, values in rows.iterator(chunk_size=2000):
+        graph['nodes'][item_id] = _make_node(graph, item_id, name, group_id, position, values)
+    return graph
+
+
+def compute_schedule(nodes):
+    """
+    Forward and backward pass over a single topological order (Kahn's algorithm).
+
+    Each item keeps its own start date unless a predecessor finishes later, in which case
+    it is pushed to the day after. Returns (schedule, critical_path) where schedule maps
+    item id -> {'es', 'ef', 'ls', 'lf', 'slack', 'critical', 'cycle'} (dates as ordinals).
+    Items without a timeline are left out; items caught in a dependency cycle are flagged.
+    """
+    scheduled = {i: n for i, n in nodes.items() if n['start'] is not None}
+    preds = {i: [d for d in n['deps'] if d in scheduled] for i, n in scheduled.items()}
+    succs = {i: [] for i in scheduled}
+    indegree = {}
+    for i, p in preds.items():
+        indegree[i] = len(p)
+        for d in p:
+            succs[d].append(i)
+
+    queue = deque(i for i in scheduled if indegree[i] == 0)
+    order = []
+    es, ef = {}, {}
+    while queue:
+        i = queue.popleft()
+        order.append(i)
+        node = scheduled[i]
+        start = node['start']
+        for d in preds[i]:
+            start = max(start, ef[d] + 1)
+        es[i] = start
+        ef[i] = start + (node['end'] - node['start'])
+        for s in succs[i]:
+            indegree[s] -= 1
+            if indegree[s] == 0:
+                queue.append(s)
+
+    project_end = max(ef.values(), default=None)
+    ls, lf = {}, {}
+    for i in reversed(order):
+        finish = project_end
+        for s in succs[i]:
+            if s in ls:
+                finish = min(finish, ls[s] - 1)
+        lf[i] = finish
+        ls[i] = finish - (ef[i] - es[i])
+
+    schedule = {}
+    for i in scheduled:
+        if i not in es:
+            schedule[i] = {'es': None, 'ef': None, 'ls': None, 'lf': None, 'slack': None, 'critical': False, 'cycle': True}
+            continue
+        slack = ls[i] - es[i]
+        schedule[i] = {
+            'es': es[i], 'ef': ef[i], 'ls': ls[i], 'lf': lf[i],
+            'slack': slack, 'critical': slack == 0, 'cycle': False,
+        }
+    critical_path = sorted((i for i, s in schedule.items() if s['critical']), key=lambda i: (es[i], i))
+    return schedule, critical_path
+
+
+def _entry(graph):
+    schedule, critical_path = compute_schedule(graph['nodes'])
+    return {'graph': graph, 'schedule': schedule, 'critical_path': critical_path}
+
+
+def get_gantt_data(board):
+    """
+    Returns the cached Gantt entry for the board's current version, building it on a miss.
+    """
+    key = _cache_key(board.id, board.version)
+    entry = cache.get(key)
+    metrics.CACHE_REQUESTS.inc(cache='gantt', result='miss' if entry is None else 'hit')
+    if entry is None:
+        entry = _entry(build_graph(board))
+        transaction.on_commit(lambda: cache.set(key, entry, CACHE_TIMEOUT))
+    return entry
+
+
+def apply_item_change(board_id, old_version, new_version, item_id, item=None):
+    """
+    Carries the cached entry for `old_version` forward to `new_version` after a single
+    item was saved (`item`) or deleted (`item=None`), once the transaction commits.
+
+    The graph is patched in place; the schedule is only recomputed when the item's
+    timeline or dependencies actually changed. Does nothing if the old entry is not cached.
+    """
+    # Snapshot the item now; the instance may change again before the commit
+    fields = None if item is None else (item.id, item.name, item.group_id, item.position, dict(item.values or {}))
+    transaction.on_commit(lambda: _apply_item_change(board_id, old_version, new_version, item_id, fields))
+
+
+def _apply_item_change(board_id, old_version, new_version, item_id, fields):
+    entry = cache.get(_cache_key(board_id, old_version))
+    if entry is None:
+        return False
+
+    graph = entry['graph']
+    nodes = graph['nodes']
+    before = nodes.get(item_id)
+    if fields is None:
+        if before is None:
+            cache.set(_cache_key(board_id, new_version), entry, CACHE_TIMEOUT)
+            return True
+        del nodes[item_id]
+        entry = _entry(graph)
+    else:
+        node = _make_node(graph, *fields)
+        nodes[item_id] = node
+        unchanged = before is not None and all(before[k] == node[k] for k in ('start', 'end', 'deps'))
+        if not unchanged:
+            entry = _entry(graph)
+
+    cache.set(_cache_key(board_id, new_version), entry, CACHE_TIMEOUT)
+    return True
+
+
+def carry_forward(board_id, old_version, new_version):
+    """
+    Reuses the cached entry for a version bump that does not affect scheduling (e.g. group
+    edits), once the transaction commits.
+    """
+    transaction.on_commit(lambda: _carry_forward(board_id, old_version, new_version))
+
+
+def _carry_forward(board_id, old_version, new_version):
+    entry = cache.get(_cache_key(board_id, old_version))
+    if entry is not None:
+        cache.set(_cache_key(board_id, new_version), entry, CACHE_TIMEOUT)
+
+
+def _iso(ordinal):
+    return date.fromordinal(ordinal).isoformat() if ordinal is not None else None
+
+
+def iter_gantt_json(board, entry, groups):
+    """
+    Streams the Gantt payload as a JSON document, one item at a time.
+    `groups` is a list of {'id', 'title', 'color', 'position'} dicts used for ordering.
+    """
+    group_pos = {g['id']: g['position'] for g in groups}
+    header = {
+        'board': board.id,
+        'version': board.version,
+        'groups': [{'id': g['id'], 'title': g['title'], 'color': g['color']} for g in groups],
+        'critical_path': entry['critical_path'],
+    }
+    yield json.dumps(header)[:-1] + ', "items": ['
+
+    schedule = entry['schedule']
+    nodes = sorted(
+        entry['graph']['nodes'].values(),
+        key=lambda n: (group_pos.get(n['group_id'], 0), n['position'], n['id']),
+    )
+    for index, node in enumerate(nodes):
+        sched = schedule.get(node['id'], {})
+        row = {
+            'id': node['id'],
+            'name': node['name'],
+            'group_id': node['group_id'],
+            'start': _iso(node['start']),
+            'end': _iso(node['end']),
+            'deps': node['deps'],
+            'early_start': _iso(sched.get('es')),
+            'early_finish': _iso(sched.get('ef')),
+            'late_start': _iso(sched.get('ls')),
+            'late_finish': _iso(sched.get('lf')),
+            'slack': sched.get('slack'),
+            'critical': sched.get('critical', False),
+            'cycle': sched.get('cycle', False),
+        }
+        yield (',' if index else '') + json.dumps(row)
+    yield ']}'
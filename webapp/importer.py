@@ -0,0 +1,209 @@
+"""
+Bulk CSV import into a board.
+
+The file is parsed row by row and items are written with bulk_create in batches.
+Per-item work that normally happens in signals (formula recompute, 'item_created'
+automations, board version bump) runs once per batch / once per import instead.
+"""
+import csv
+import io
+from datetime import datetime
+
+from django.db import transaction
+from django.db.models import Max
+
+from .formula_service import FormulaEngine
+from .models import Board, Column, Group, Item
+
+IMPORT_BATCH_SIZE = 1000
+AUTOMATION_CHUNK_SIZE = 500
+
+NAME_HEADERS = ('name', 'item', 'task', 'task name', 'item name')
+GROUP_HEADERS = ('group',)
+
+
+def _parse_cell(column, raw, people):
+    """
+    Converts an exported/plain-text cell back to the stored value shape.
+    Returns None for empty cells.
+    """
+    raw = (raw or '').strip()
+    if not raw:
+        return None
+    if column.type == 'person':
+        return people.get(raw.lower(), raw)
+    if column.type == 'timeline':
+        start, sep, end = raw.partition(' - ')
+        return {'start': start.strip(), 'end': (end or start).strip()}
+    if column.type == 'checkbox':
+        return raw.lower() in ('yes', 'true', '1', 'x', 'on')
+    if column.type == 'date':
+        for fmt in ('%Y-%m-%d', '%d/%m/%Y', '%m/%d/%Y'):
+            try:
+                return datetime.strptime(raw, fmt).date().isoformat()
+            except ValueError:
+                continue
+    return raw
+
+
+def _default_values(columns):
+    """
+    Same defaults as a manually added item (see views.add_item).
+    """
+    defaults = {}
+    for col in columns:
+        if col.type == 'status':
+            choices = col.settings.get('choices', [])
+            defaults[str(col.id)] = choices[0] if choices else 'Not Started'
+        elif col.type == 'priority':
+            defaults[str(col.id)] = 'Medium'
+    return defaults
+
+
+class BoardImporter:
+    """
+    Streams a CSV file into a board.
+
+    Usage:
+        result = BoardImporter(board, user=request.user).run(uploaded_file)
+    """
+
+    def __init__(self, board, user=None, group=None, batch_size=IMPORT_BATCH_SIZE):
+        self.board = board
+        self.user = user
+        self.default_group = group
+        self.batch_size = batch_size
+        self.columns = list(Column.objects.filter(board=board).order_by('position', 'id'))
+        self.groups = {g.title.strip().lower(): g for g in Group.objects.filter(board=board)}
+        self.next_position = dict(
+            Item.objects.filter(board=board).values('group_id')
+            .annotate(last=Max('position')).values_list('group_id', 'last')
+        )
+        self.organization_id = board.workspace.organization_id
+        self.people = self._people_lookup()
+        self.created_ids = []
+
+    def _people_lookup(self):
+        from core.models import Membership
+        lookup = {}
+        memberships = Membership.objects.filter(
+            organization_id=self.board.workspace.organization_id
+        ).values_list('user__username', 'user__first_name', 'user__last_name')
+        for username, first_name, last_name in memberships:
+            lookup[username.lower()] = username
+            full_name = f"{first_name} {last_name}".strip()
+            if full_name:
+                lookup[full_name.lower()] = username
+        return lookup
+
+    def map_headers(self, headers):
+        """
+        Returns (name_index, group_index, [(index, column)], unmapped_headers).
+        Headers match column titles case-insensitively.
+        """
+        by_title = {c.title.strip().lower(): c for c in self.columns}
+        name_index = group_index = None
+        mapped, unmapped = [], []
+        for index, header in enumerate(headers):
+            key = header.strip().lower()
+            if name_index is None and key in NAME_HEADERS:
+                name_index = index
+            elif group_index is None and key in GROUP_HEADERS:
+                group_index = index
+            elif key in by_title:
+                mapped.append((index, by_title[key]))
+            else:
+                unmapped.append(header)
+        if name_index is None:
+            name_index = 0
+            mapped = [(i, c) for i, c in mapped if i != 0]
+        return name_index, group_index, mapped, unmapped
+
+    def _group_for(self, title):
+        if title:
+            key = title.strip().lower()
+            group = self.groups.get(key)
+            if group is None:
+                position = max([g.position for g in self.groups.values()], default=-1) + 1
+                group = Group.objects.create(board=self.board, title=title.strip(), color='#579bfc', position=position)
+                self.groups[key] = group
+            return group
+        if self.default_group is None:
+            self.default_group = min(self.groups.values(), key=lambda g: g.position, default=None)
+            if self.default_group is None:
+                self.default_group = Group.objects.create(board=self.board, title='Imported', color='#579bfc', position=0)
+                self.groups['imported'] = self.default_group
+        return self.default_group
+
+    def _flush(self, batch):
+        # Formula results are computed in memory for the whole batch before the insert
+        for item in batch:
+            FormulaEngine.recompute(item.values, self.columns)
+        created = Item.objects.bulk_create(batch, batch_size=self.batch_size)
+        # SQLite (3.35+) and PostgreSQL return primary keys from bulk inserts
+        self.created_ids.extend(obj.pk for obj in created if obj.pk)
+
+    def _run_item_created_automations(self):
+        from automation.service import AutomationEngine
+
+        def contexts():
+            for start in range(0, len(self.created_ids), AUTOMATION_CHUNK_SIZE):
+                chunk = self.created_ids[start:start + AUTOMATION_CHUNK_SIZE]
+                for item in Item.objects.filter(id__in=chunk).select_related('group', 'board'):
+                    yield {'item': item}
+
+        return AutomationEngine.run_automations_bulk(self.board, 'item_created', contexts())
+
+    def run(self, fileobj):
+        """
+        Imports every row of `fileobj` (binary or text) and returns a summary dict.
+        """
+        if isinstance(fileobj.read(0), bytes):
+            fileobj = io.TextIOWrapper(fileobj, encoding='utf-8-sig', newline='')
+        reader = csv.reader(fileobj)
+        headers = next(reader, None)
+        if not headers:
+            return {'created': 0, 'skipped': 0, 'unmapped_headers': [], 'automations': 0}
+
+        name_index, group_index, mapped, unmapped = self.map_headers(headers)
+        defaults = _default_values(self.columns)
+        skipped = 0
+        batch = []
+
+        with transaction.atomic():
+            for row in reader:
+                name = row[name_index].strip() if len(row) > name_index else ''
+                if not name:
+                    skipped += 1
+                    continue
+                group = self._group_for(row[group_index] if group_index is not None and len(row) > group_index else None)
+
+                values = dict(defaults)
+                for index, column in mapped:
+                    if index < len(row):
+                        value = _parse_cell(column, row[index], self.people)
+                        if value is not None:
+                            values[str(column.id)] = value
+
+                position = self.next_position.get(group.id, 0) + 1
+                self.next_position[group.id] = position
+                batch.append(Item(
+                    group=group, board=self.board, organization_id=self.organization_id,
+                    name=name[:255], position=position, created_by=self.user, values=values,
+                ))
+                if len(batch) >= self.batch_size:
+                    self._flush(batch)
+                    batch = []
+            if batch:
+                self._flush(batch)
+
+            # bulk_create skips model signals: bump the version once for the whole import
+            Board.bump_version(self.board.id)
+            automations = self._run_item_created_automations() if self.created_ids else 0
+
+        return {
+            'created': len(self.created_ids),
+            'skipped': skipped,
+            'unmapped_headers': unmapped,
+            'automations': automations,
+        }
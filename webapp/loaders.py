@@ -0,0 +1,106 @@
+"""
+Batch loaders for the relations the board code and the automation handlers look up one
+at a time (see core.loaders): users by id or username, a board's columns, groups (with
+their board and workspace) and an organization's memberships.
+
+Saving or deleting a column, group or membership drops the matching key from the current
+request's loader, so a request sees its own writes.
+"""
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from core.loaders import invalidate, loader
+from core.models import Membership, User
+
+from .models import Column, Group, Item
+
+
+def _users_by_id(ids):
+    return User.objects.in_bulk(ids)
+
+
+def _users_by_username(usernames):
+    return User.objects.in_bulk(usernames, field_name='username')
+
+
+def _columns_by_board(board_ids):
+    columns = {board_id: [] for board_id in board_ids}
+    for column in Column.objects.filter(board_id__in=board_ids).order_by('position'):
+        columns[column.board_id].append(column)
+    return columns
+
+
+def _groups_by_id(ids):
+    return Group.objects.select_related('board__workspace').in_bulk(ids)
+
+
+def _memberships_by_organization(organization_ids):
+    memberships = {organization_id: [] for organization_id in organization_ids}
+    for membership in Membership.objects.filter(organization_id__in=organization_ids).select_related('user'):
+        memberships[membership.organization_id].append(membership)
+    return memberships
+
+
+def users():
+    return loader('users', _users_by_id)
+
+
+def users_by_username():
+    return loader('users_by_username', _users_by_username)
+
+
+def board_columns():
+    """board id -> the board's columns in position order."""
+    return loader('board_columns', _columns_by_board)
+
+
+def groups():
+    return loader('groups', _groups_by_id)
+
+
+def memberships():
+    """organization id -> memberships with their users."""
+    return loader('memberships', _memberships_by_organization)
+
+
+def item_board(item):
+    """The item's board, from the item's own group when loaded with it, else the group loader."""
+    group = item.group if Item.group.is_cached(item) else None
+    if group is None or not Group.board.is_cached(group):
+        group = groups().load(item.group_id)
+    return group.board
+
+
+def item_board_id(item):
+    if Item.group.is_cached(item):
+        return item.group.board_id
+    return groups().load(item.group_id).board_id
+
+
+def item_columns(item):
+    return board_columns().load(item_board_id(item))
+
+
+@receiver(post_save, sender=Column)
+@receiver(post_delete, sender=Column)
+def _column_changed(sender, instance, **kwargs):
+    invalidate('board_columns', instance.board_id)
+
+
+@receiver(post_save, sender=Group)
+@receiver(post_delete, sender=Group)
+def _group_changed(sender, instance, **kwargs):
+    invalidate('groups', instance.id)
+
+
+@receiver(post_save, sender=Membership)
+@receiver(post_delete, sender=Membership)
+def _membership_changed(sender, instance, **kwargs):
+    invalidate('memberships', instance.organization_id)
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def _user_changed(sender, instance, **kwargs):
+    invalidate('users', instance.id)
+    invalidate('users_by_username')
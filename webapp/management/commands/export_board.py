@@ -0,0 +1,46 @@
+import gzip
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+from webapp.models import Board
+from webapp.export import iter_csv, write_xlsx
+
+
+class Command(BaseCommand):
+    help = 'Exports a board to CSV or XLSX with constant memory'
+
+    def add_arguments(self, parser):
+        parser.add_argument('board_id', type=int)
+        parser.add_argument('--format', choices=['csv', 'xlsx'], default='csv')
+        parser.add_argument('--output', '-o', help='Output file (defaults to stdout for CSV)')
+        parser.add_argument('--gzip', action='store_true', help='Gzip-compress CSV output')
+
+    def handle(self, *args, **options):
+        try:
+            board = Board.objects.select_related('workspace').get(id=options['board_id'])
+        except Board.DoesNotExist:
+            raise CommandError(f"Board {options['board_id']} does not exist")
+
+        output = options['output']
+        if options['format'] == 'xlsx':
+            if not output:
+                raise CommandError("--output is required for XLSX exports")
+            with open(output, 'wb') as fh:
+                write_xlsx(board, fh)
+        elif options['gzip']:
+            if not output:
+                raise CommandError("--output is required with --gzip")
+            with gzip.open(output, 'wt', encoding='utf-8', newline='') as fh:
+                for line in iter_csv(board):
+                    fh.write(line)
+        else:
+            fh = open(output, 'w', encoding='utf-8', newline='') if output else sys.stdout
+            try:
+                for line in iter_csv(board):
+                    fh.write(line)
+            finally:
+                if output:
+                    fh.close()
+
+        if output:
+            self.stdout.write(self.style.SUCCESS(f"Exported board '{board.name}' to {output}"))
@@ -0,0 +1,50 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from webapp.datagen import TenantGenerator, GENERATOR_BATCH_SIZE
+
+
+class Command(BaseCommand):
+    help = 'Generates a synthetic organization with realistic data volume for performance work'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--name', default='Synthetic Tenant')
+        parser.add_argument('--items', type=int, default=10000, help='Total top-level items across all boards')
+        parser.add_argument('--users', type=int, default=25)
+        parser.add_argument('--workspaces', type=int, default=4)
+        parser.add_argument('--boards', type=int, default=5, help='Boards per workspace')
+        parser.add_argument('--groups', type=int, default=6, help='Groups per board')
+        parser.add_argument('--subitem-ratio', type=float, default=0.1, help='Share of items that get 1-3 subitems')
+        parser.add_argument('--updates-per-item', type=float, default=0.5, help='Mean updates per item')
+        parser.add_argument('--attachment-ratio', type=float, default=0.05)
+        parser.add_argument('--rules', type=int, default=3, help='Automation rules per board')
+        parser.add_argument('--fill', type=float, default=0.7, help='Probability that an optional cell has a value')
+        parser.add_argument('--distribution', choices=['uniform', 'skewed'], default='skewed',
+                            help='How items are spread over boards')
+        parser.add_argument('--seed', type=int, default=42)
+        parser.add_argument('--batch-size', type=int, default=GENERATOR_BATCH_SIZE)
+
+    def handle(self, *args, **options):
+        if options['users'] < 1 or options['workspaces'] < 1 or options['boards'] < 1 or options['groups'] < 1:
+            raise CommandError("--users, --workspaces, --boards and --groups must be at least 1")
+
+        generator = TenantGenerator(
+            name=options['name'], users=options['users'], workspaces=options['workspaces'],
+            boards=options['boards'], groups=options['groups'], items=options['items'],
+            subitem_ratio=options['subitem_ratio'], updates_per_item=options['updates_per_item'],
+            attachment_ratio=options['attachment_ratio'], rules_per_board=options['rules'],
+            fill=options['fill'], distribution=options['distribution'], seed=options['seed'],
+            batch_size=options['batch_size'], log=self.stdout.write,
+        )
+        started = time.perf_counter()
+        try:
+            summary = generator.run()
+        except ValueError as exc:
+            raise CommandError(str(exc))
+        elapsed = time.perf_counter() - started
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Organization {summary['organization']}: {summary['boards']} boards, {summary['items']} items, "
+            f"{summary['subitems']} subitems, {summary['updates']} updates, {summary['attachments']} attachments, "
+            f"{summary['rules']} rules, {summary['users']} users in {elapsed:.1f}s"
+        ))
@@ -0,0 +1,39 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from webapp.models import Board, Group
+from webapp.importer import BoardImporter, IMPORT_BATCH_SIZE
+
+
+class Command(BaseCommand):
+    help = 'Bulk-imports items from a CSV file into a board'
+
+    def add_arguments(self, parser):
+        parser.add_argument('board_id', type=int)
+        parser.add_argument('path', help='CSV file with a header row (Name, Group, <column titles>...)')
+        parser.add_argument('--group', type=int, help='Target group id for rows without a Group column')
+        parser.add_argument('--batch-size', type=int, default=IMPORT_BATCH_SIZE)
+
+    def handle(self, *args, **options):
+        try:
+            board = Board.objects.select_related('workspace').get(id=options['board_id'])
+        except Board.DoesNotExist:
+            raise CommandError(f"Board {options['board_id']} does not exist")
+
+        group = None
+        if options['group']:
+            group = Group.objects.filter(id=options['group'], board=board).first()
+            if not group:
+                raise CommandError(f"Group {options['group']} is not on board {board.id}")
+
+        started = time.perf_counter()
+        with open(options['path'], encoding='utf-8-sig', newline='') as fh:
+            result = BoardImporter(board, group=group, batch_size=options['batch_size']).run(fh)
+        elapsed = time.perf_counter() - started
+
+        if result['unmapped_headers']:
+            self.stdout.write(self.style.WARNING(f"Ignored columns: {', '.join(result['unmapped_headers'])}"))
+        self.stdout.write(self.style.SUCCESS(
+            f"Imported {result['created']} items ({result['skipped']} skipped, "
+            f"{result['automations']} automation runs) in {elapsed:.1f}s"
+        ))
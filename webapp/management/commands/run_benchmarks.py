@@ -0,0 +1,61 @@
+import json
+
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from webapp.benchmarks import BenchmarkRunner, compare, pick_target
+
+
+class Command(BaseCommand):
+    help = 'Benchmarks the hot views and write paths against the data in the database'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--organization', type=int, help='Organization to benchmark (default: the largest)')
+        parser.add_argument('--board', type=int, help='Board to benchmark (default: the largest in the organization)')
+        parser.add_argument('--generate', type=int, metavar='ITEMS',
+                            help='Run generate_tenant with this many items first')
+        parser.add_argument('--iterations', type=int, default=30)
+        parser.add_argument('--warmup', type=int, default=3)
+        parser.add_argument('--only', nargs='+', metavar='SCENARIO', help='Run only these scenarios')
+        parser.add_argument('--output', help='Write results as JSON to this file')
+        parser.add_argument('--baseline', help='Compare against a previously saved results file')
+        parser.add_argument('--threshold', type=float, default=0.10,
+                            help='Relative latency increase that counts as a regression (default 0.10)')
+        parser.add_argument('--fail-on-regression', action='store_true')
+
+    def handle(self, *args, **options):
+        if options['generate']:
+            call_command('generate_tenant', items=options['generate'], stdout=self.stdout)
+
+        board, user = pick_target(options['organization'], options['board'])
+        if board is None:
+            raise CommandError("No data to benchmark. Run generate_tenant first or pass --generate.")
+
+        self.stdout.write(f"Benchmarking board {board.id} ({board.name}) as {user.username}")
+        runner = BenchmarkRunner(
+            board, user, iterations=options['iterations'], warmup=options['warmup'],
+            only=options['only'], log=self.stdout.write,
+        )
+        results = runner.run()
+
+        if options['output']:
+            with open(options['output'], 'w') as fh:
+                json.dump(results, fh, indent=2)
+            self.stdout.write(self.style.SUCCESS(f"Results written to {options['output']}"))
+
+        if options['baseline']:
+            try:
+                with open(options['baseline']) as fh:
+                    baseline = json.load(fh)
+            except (OSError, ValueError) as exc:
+                raise CommandError(f"Cannot read baseline: {exc}")
+
+            regressions = 0
+            for name, metric, old, new, change, regressed in compare(results, baseline, options['threshold']):
+                line = f"{name:<26} {metric:<14} {old:>10} -> {new:<10} {change:+.1%}"
+                if regressed:
+                    regressions += 1
+                    self.stdout.write(self.style.ERROR(line + '  REGRESSION'))
+                else:
+                    self.stdout.write(line)
+            if regressions and options['fail_on_regression']:
+                raise CommandError(f"{regressions} metric(s) regressed against {options['baseline']}")
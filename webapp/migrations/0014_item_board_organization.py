@@ -0,0 +1,47 @@
+from django.db import migrations, models
+import django.db.models.deletion
+
+BATCH_SIZE = 5000
+
+
+def backfill_item_scope(apps, schema_editor):
+    """
+    Copies board_id / organization_id onto existing items, one board and
+    BATCH_SIZE rows at a time so large tables are not locked in one statement.
+    """
+    Board = apps.get_model('webapp', 'Board')
+    Item = apps.get_model('webapp', 'Item')
+    boards = Board.objects.values_list('id', 'workspace__organization_id').order_by('id')
+    for board_id, organization_id in boards.iterator():
+        while True:
+            ids = list(
+                Item.objects.filter(group__board_id=board_id, board__isnull=True)
+                .values_list('id', flat=True)[:BATCH_SIZE]
+            )
+            if not ids:
+                break
+            Item.objects.filter(id__in=ids).update(board_id=board_id, organization_id=organization_id)
+
+
+class Migration(migrations.Migration):
+    # Each backfill batch commits on its own
+    atomic = False
+
+    dependencies = [
+        ('core', '0010_user_verification_token'),
+        ('webapp', '0013_item_version'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='item',
+            name='board',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, related_name='items', to='webapp.board'),
+        ),
+        migrations.AddField(
+            model_name='item',
+            name='organization',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, related_name='items', to='core.organization'),
+        ),
+        migrations.RunPython(backfill_item_scope, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,22 @@
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('webapp', '0014_item_board_organization'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='item',
+            name='board',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='items', to='webapp.board'),
+        ),
+        migrations.AlterField(
+            model_name='item',
+            name='organization',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='items', to='core.organization'),
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 5.2.18 on 2026-10-19 15:38
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0011_composite_indexes'),
+        ('webapp', '0015_item_board_organization_not_null'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='column',
+            index=models.Index(fields=['board', 'position'], name='column_board_position_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='group',
+            index=models.Index(fields=['board', 'position'], name='group_board_position_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='item',
+            index=models.Index(fields=['group', 'position'], name='item_group_position_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='item',
+            index=models.Index(fields=['board', 'group', 'position'], name='item_board_group_pos_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='itemupdate',
+            index=models.Index(fields=['item', '-created_at'], name='itemupdate_item_created_idx'),
+        ),
+    ]
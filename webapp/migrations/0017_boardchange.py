@@ -0,0 +1,31 @@
+# Generated by Django 5.2.18 on 2026-10-19 16:12
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('webapp', '0016_composite_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BoardChange',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('seq', models.PositiveIntegerField()),
+                ('kind', models.CharField(choices=[('item', 'Item'), ('group', 'Group'), ('column', 'Column'), ('board', 'Board')], max_length=10)),
+                ('action', models.CharField(choices=[('insert', 'Insert'), ('update', 'Update'), ('delete', 'Delete'), ('reload', 'Reload')], max_length=10)),
+                ('object_id', models.BigIntegerField()),
+                ('data', models.JSONField(blank=True, default=dict)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('board', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='changes', to='webapp.board')),
+            ],
+            options={
+                'ordering': ['seq', 'id'],
+                'indexes': [models.Index(fields=['board', 'seq'], name='boardchange_board_seq_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-19 16:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('webapp', '0017_boardchange'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='boardchange',
+            index=models.Index(fields=['created_at'], name='boardchange_created_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-19 16:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('webapp', '0018_boardchange_created_idx'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='boardchange',
+            name='kind',
+            field=models.CharField(choices=[('item', 'Item'), ('group', 'Group'), ('column', 'Column'), ('rule', 'Automation rule'), ('board', 'Board')], max_length=10),
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 5.2.18 on 2026-10-19 16:48
+
+from django.db import migrations, models
+
+
+def backfill_like_counts(apps, schema_editor):
+    """Counts existing likes; updates nobody liked keep the default of 0."""
+    ItemUpdate = apps.get_model('webapp', 'ItemUpdate')
+    Like = ItemUpdate.liked_by.through
+    counts = (
+        Like.objects.filter(itemupdate_id=models.OuterRef('pk'))
+        .values('itemupdate_id').annotate(n=models.Count('id')).values('n')
+    )
+    ItemUpdate.objects.filter(pk__in=Like.objects.values('itemupdate_id')).update(
+        like_count=models.Subquery(counts)
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('webapp', '0019_boardchange_rule_kind'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='itemupdate',
+            name='like_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_like_counts, migrations.RunPython.noop),
+    ]
@@ -1,7 +1,43 @@
-from django.db import models
+from django.db import connections, models, transaction
+from django.db.models import F
+from django.db.models.sql import UpdateQuery
 from django.conf import settings
 from core.models import Organization
 
+
+def _can_return_from_update(connection):
+    if connection.vendor == 'postgresql':
+        return True
+    return connection.vendor == 'sqlite' and connection.Database.sqlite_version_info >= (3, 35)
+
+
+def update_returning(queryset, field, **values):
+    """
+    queryset.update(**values) that returns the new value of `field` for each updated row,
+    read in the same statement (UPDATE ... RETURNING) where the database supports it.
+    Elsewhere the rows are locked, updated by pk and read back in one transaction.
+    """
+    connection = connections[queryset.db]
+    if not _can_return_from_update(connection):
+        with transaction.atomic(using=queryset.db):
+            pks = list(queryset.select_for_update().values_list('pk', flat=True))
+            rows = queryset.model._base_manager.using(queryset.db).filter(pk__in=pks)
+            rows.update(**values)
+            return list(rows.values_list(field, flat=True))
+
+    query = queryset.query.chain(UpdateQuery)
+    query.add_update_values(values)
+    compiler = query.get_compiler(queryset.db)
+    compiler.pre_sql_setup()
+    sql, params = compiler.as_sql()
+    if not sql:
+        return []
+    column = queryset.model._meta.get_field(field).column
+    with connection.cursor() as cursor:
+        cursor.execute(f"{sql} RETURNING {connection.ops.quote_name(column)}", params)
+        return [row[0] for row in cursor.fetchall()]
+
+
 class Workspace(models.Model):
     name = models.CharField(max_length=255)
     organization = models.ForeignKey(Organization, on_delete=models.CASCADE, related_name='workspaces')
@@ -31,10 +67,74 @@ class Board(models.Model):
     privacy = models.CharField(max_length=20, choices=PRIVACY_CHOICES, default='team')
     created_by = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True)
     created_at = models.DateTimeField(auto_now_add=True)
+    # Bumped on every item/group/column change. Used to key derived data (Gantt schedule, etc.)
+    version = models.PositiveIntegerField(default=0)
     
     def __str__(self):
         return self.name
 
+    @classmethod
+    def bump_version(cls, board_id, changes=None):
+        """
+        Atomically increments the board's version stamp and logs `changes` (a list of
+        (kind, action, object_id, data) tuples) as BoardChange rows with seq = the new version.
+        Without changes a 'board reload' entry is logged, so every version has log entries.
+        Returns the new version, or None if the board no longer exists.
+        """
+        # No savepoint: a failure here fails the caller's transaction anyway
+        with transaction.atomic(savepoint=False):
+            versions = update_returning(cls.objects.filter(pk=board_id), 'version', version=F('version') + 1)
+            if not versions:
+                return None
+            version = versions[0]
+            BoardChange.objects.bulk_create([
+                BoardChange(board_id=board_id, seq=version, kind=kind, action=action, object_id=object_id, data=data or {})
+                for kind, action, object_id, data in (changes or [('board', 'reload', board_id, None)])
+            ])
+            from .changes import notify
+            transaction.on_commit(lambda: notify(board_id, version))
+            return version
+
+
+class BoardChange(models.Model):
+    """
+    One entry of a board's change log (see webapp.changes). `seq` is the board version the
+    change produced; a bulk operation that bumps the version once logs all its rows under one seq.
+    """
+    KIND_CHOICES = (
+        ('item', 'Item'),
+        ('group', 'Group'),
+        ('column', 'Column'),
+        ('rule', 'Automation rule'),
+        ('board', 'Board'),
+    )
+    ACTION_CHOICES = (
+        ('insert', 'Insert'),
+        ('update', 'Update'),
+        ('delete', 'Delete'),
+        ('reload', 'Reload'),
+    )
+
+    board = models.ForeignKey(Board, on_delete=models.CASCADE, related_name='changes')
+    seq = models.PositiveIntegerField()
+    kind = models.CharField(max_length=10, choices=KIND_CHOICES)
+    action = models.CharField(max_length=10, choices=ACTION_CHOICES)
+    object_id = models.BigIntegerField()
+    data = models.JSONField(default=dict, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ['seq', 'id']
+        indexes = [
+            # Changes since a sequence number
+            models.Index(fields=['board', 'seq'], name='boardchange_board_seq_idx'),
+            # Compaction of old entries
+            models.Index(fields=['created_at'], name='boardchange_created_idx'),
+        ]
+
+    def as_dict(self):
+        return {'seq': self.seq, 'kind': self.kind, 'action': self.action, 'id': self.object_id, 'data': self.data}
+
 class Group(models.Model):
     """
     A group of items within a board (e.g. 'This Week', 'Next Week').
@@ -46,6 +146,10 @@ class Group(models.Model):
     
     class Meta:
         ordering = ['position']
+        indexes = [
+            # board.groups.all() (ordered)
+            models.Index(fields=['board', 'position'], name='group_board_position_idx'),
+        ]
 
     def __str__(self):
         return self.title
@@ -97,6 +201,10 @@ class Column(models.Model):
 
     class Meta:
         ordering = ['position']
+        indexes = [
+            # board.columns.all() (ordered)
+            models.Index(fields=['board', 'position'], name='column_board_position_idx'),
+        ]
 
     def __str__(self):
         return self.title
@@ -106,6 +214,10 @@ class Item(models.Model):
     A single row/task.
     """
     group = models.ForeignKey(Group, on_delete=models.CASCADE, related_name='items')
+    # Denormalized from group -> board -> workspace -> organization so board/tenant scoped
+    # queries hit a single table. Kept in sync by save() and webapp.signals.
+    board = models.ForeignKey(Board, on_delete=models.CASCADE, related_name='items')
+    organization = models.ForeignKey(Organization, on_delete=models.CASCADE, related_name='items')
     # Subitems support: Parent item
     parent = models.ForeignKey('self', on_delete=models.CASCADE, null=True, blank=True, related_name='subitems')
     
@@ -118,13 +230,62 @@ class Item(models.Model):
     values = models.JSONField(default=dict, blank=True)
     
     position = models.PositiveIntegerField(default=0)
+    # Incremented on every write; lets clients send an optimistic version check (see webapp.patching)
+    version = models.PositiveIntegerField(default=0)
 
     class Meta:
         ordering = ['position']
+        indexes = [
+            # group.items.all() / board prefetch (ordered by position)
+            models.Index(fields=['group', 'position'], name='item_group_position_idx'),
+            # board-wide reads (export, gantt, kanban) and bulk ops filtered by board
+            models.Index(fields=['board', 'group', 'position'], name='item_board_group_pos_idx'),
+        ]
 
     def __str__(self):
         return self.name
 
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get('update_fields')
+        loaded = getattr(self, '_loaded_state', None) or {}
+        if self.board_id is None or self.group_id != loaded.get('group_id', self.group_id):
+            self.board_id, self.organization_id = self.scope_for_group(self.group_id)
+            if update_fields is not None:
+                update_fields = set(update_fields) | {'board', 'organization'}
+        if update_fields is not None:
+            kwargs['update_fields'] = update_fields = set(update_fields) | {'version'}
+        super().save(*args, **kwargs)
+
+    def _do_update(self, base_qs, using, pk_val, values, update_fields, forced_update):
+        # Claim the next version in the UPDATE itself: concurrent writers queue on the row
+        # lock instead of both writing the same version + 1, and RETURNING hands ours back
+        fields = {field.attname: value for field, _, value in values if field.attname != 'version'}
+        versions = update_returning(base_qs.filter(pk=pk_val), 'version', version=F('version') + 1, **fields)
+        if not versions:
+            return False
+        self.version = versions[0]
+        return True
+
+    @staticmethod
+    def scope_for_group(group_id):
+        """
+        Returns (board_id, organization_id) for a group.
+        """
+        return Group.objects.filter(pk=group_id).values_list(
+            'board_id', 'board__workspace__organization_id'
+        ).get()
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Snapshot of the loaded state so save hooks can tell what changed
+        # without re-reading the row.
+        instance._loaded_state = {
+            'group_id': instance.__dict__.get('group_id'),
+            'values': dict(instance.__dict__['values']) if 'values' in instance.__dict__ else None,
+        }
+        return instance
+
 class ItemAttachment(models.Model):
     """
     Files attached to an item, often linked to a File column.
@@ -149,9 +310,15 @@ class ItemUpdate(models.Model):
     
     # Optional: Liked by functionality for 'Monday' feel
     liked_by = models.ManyToManyField(settings.AUTH_USER_MODEL, related_name='liked_updates', blank=True)
+    # Denormalized len(liked_by), kept in step by webapp.updates
+    like_count = models.PositiveIntegerField(default=0)
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            # item.updates.all() in the side panel
+            models.Index(fields=['item', '-created_at'], name='itemupdate_item_created_idx'),
+        ]
 
     def __str__(self):
         return f"Update by {self.user} on {self.item}"
@@ -0,0 +1,131 @@
+"""
+Partial writes to Item.values.
+
+A cell edit becomes a single `UPDATE ... SET values = json_set(values, key, value)`,
+so concurrent edits to different columns no longer overwrite each other and only
+the touched keys (plus version/updated_at) are written.
+"""
+import json
+
+from django.db import connection, models, transaction
+from django.db.models import F, Func
+from django.db.utils import NotSupportedError
+from django.utils import timezone
+
+from .models import Item, update_returning
+from .signals import item_values_patched
+
+
+class VersionConflict(Exception):
+    """Raised when an optimistic version check fails (the item was changed by someone else)."""
+
+    def __init__(self, item_id, expected_version):
+        self.item_id = item_id
+        self.expected_version = expected_version
+        super().__init__(f"Item {item_id} is no longer at version {expected_version}")
+
+
+class JSONSet(Func):
+    """
+    Sets one top-level key of a JSON column in place.
+    Nest calls to set several keys in the same UPDATE: JSONSet(JSONSet(F('values'), a, 1), b, 2).
+    """
+    output_field = models.JSONField()
+
+    def __init__(self, expression, key, value):
+        self.key = str(key)
+        self.value_json = json.dumps(value)
+        super().__init__(expression)
+
+    def _lhs(self, compiler):
+        return compiler.compile(self.source_expressions[0])
+
+    def as_sql(self, compiler, connection, **extra_context):
+        raise NotSupportedError(f"JSONSet is not supported on {connection.vendor}")
+
+    def as_sqlite(self, compiler, connection, **extra_context):
+        lhs, params = self._lhs(compiler)
+        path = '$."%s"' % self.key.replace('\\', '\\\\').replace('"', '\\"')
+        return f"JSON_SET({lhs}, %s, JSON(%s))", (*params, path, self.value_json)
+
+    def as_mysql(self, compiler, connection, **extra_context):
+        lhs, params = self._lhs(compiler)
+        path = '$."%s"' % self.key.replace('\\', '\\\\').replace('"', '\\"')
+        return f"JSON_SET({lhs}, %s, CAST(%s AS JSON))", (*params, path, self.value_json)
+
+    def as_postgresql(self, compiler, connection, **extra_context):
+        lhs, params = self._lhs(compiler)
+        return f"JSONB_SET({lhs}, ARRAY[%s]::text[], %s::jsonb, true)", (*params, self.key, self.value_json)
+
+
+SUPPORTED_VENDORS = ('sqlite', 'postgresql', 'mysql')
+
+
+def set_value_keys(queryset, changes, returning=None, **fields):
+    """
+    Writes `changes` ({key: value}) into the `values` of every item in the queryset, and
+    sets `fields`, leaving all other keys alone. Returns the number of rows updated, or
+    with `returning`, the new value of that field for each updated row (update_returning).
+    """
+    if connection.vendor in SUPPORTED_VENDORS:
+        expression = F('values')
+        for key, value in changes.items():
+            expression = JSONSet(expression, key, value)
+        if returning:
+            return update_returning(queryset, returning, values=expression, **fields)
+        return queryset.update(values=expression, **fields)
+
+    # No in-place JSON update: lock the rows and read-modify-write instead
+    returned = []
+    with transaction.atomic():
+        rows = list(queryset.select_for_update().values_list('pk', 'values'))
+        for pk, current in rows:
+            current.update(changes)
+            row = Item.objects.filter(pk=pk)
+            if returning:
+                returned += update_returning(row, returning, values=current, **fields)
+            else:
+                row.update(values=current, **fields)
+    return returned if returning else len(rows)
+
+
+def patch_item_values(item, changes, expected_version=None, columns=None, automation_update=False):
+    """
+    Writes `changes` ({key: value}) into item.values with one UPDATE and bumps the item's
+    version and updated_at. The in-memory item is updated to match.
+
+    expected_version: if given, the write only applies when the row is still at that version;
+        otherwise VersionConflict is raised and nothing is written. Without it, a deleted
+        row raises Item.DoesNotExist.
+    columns: the board's columns, passed through to signal receivers to save a query.
+    automation_update: set by automation actions so the change does not re-trigger automations.
+
+    Sends `item_values_patched` (model signals do not fire for UPDATE queries).
+    """
+    changes = {str(k): v for k, v in changes.items()}
+    if not changes:
+        return item
+
+    now = timezone.now()
+    queryset = Item.objects.filter(pk=item.pk)
+    if expected_version is not None:
+        queryset = queryset.filter(version=expected_version)
+
+    # The new version is read back in the same statement: after a concurrent edit it is
+    # not our in-memory version + 1
+    versions = set_value_keys(queryset, changes, returning='version', version=F('version') + 1, updated_at=now)
+    if not versions:
+        if expected_version is None:
+            raise Item.DoesNotExist(f"Item {item.pk} no longer exists")
+        raise VersionConflict(item.pk, expected_version)
+
+    old_values = dict(item.values)
+    item.values.update(changes)
+    item.version = versions[0]
+    item.updated_at = now
+
+    item_values_patched.send(
+        sender=Item, instance=item, old_values=old_values, changed_keys=list(changes),
+        columns=columns, automation_update=automation_update,
+    )
+    return item
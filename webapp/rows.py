@@ -0,0 +1,71 @@
+"""
+Cached item row fragments for the board table.
+
+Rendering item_row_final.html runs the per-type cell branching for every column, which
+dominates a large board render. Each rendered row is cached under the item's version and
+a hash of everything else the row shows (column schema, member list, group colour,
+creator), so unchanged rows are reused across requests and users. Rows contain nothing
+user-specific; a board render fetches all keys with one get_many() and renders only the
+misses.
+"""
+import hashlib
+import json
+
+from django.core.cache import cache
+from django.template.loader import get_template
+from django.utils.safestring import mark_safe
+
+from core import metrics
+
+from .cells import column_specs, row_context
+
+ROW_TEMPLATE = 'webapp/partials/item_row_final.html'
+CACHE_TIMEOUT = 24 * 60 * 60
+# Bump when the row markup changes so rows cached by an older deploy are not reused
+TEMPLATE_REVISION = 2
+
+
+def schema_key(columns, users):
+    """Short hash of the column schema and member list shared by all rows of a board."""
+    schema = [
+        [[c.id, c.type, c.title, c.position, c.settings] for c in columns],
+        [[m.user_id, m.user.username] for m in users],
+    ]
+    return hashlib.md5(json.dumps(schema, sort_keys=True, default=str).encode()).hexdigest()[:16]
+
+
+def _row_key(item, schema):
+    creator = item.created_by.username if item.created_by_id else ''
+    return f"row{TEMPLATE_REVISION}:{item.id}:{item.version}:{schema}:{item.group.color}:{creator}"
+
+
+def render_rows(items, columns, users):
+    """
+    Returns {str(item.id): html} for the items, rendering and caching only rows whose
+    key is not cached yet.
+    """
+    if not items:
+        return {}
+    columns = list(columns)
+    users = list(users)
+    schema = schema_key(columns, users)
+    keys = {item.id: _row_key(item, schema) for item in items}
+    cached = cache.get_many(list(keys.values()))
+
+    rows, fresh = {}, {}
+    template = specs = None
+    for item in items:
+        html = cached.get(keys[item.id])
+        if html is None:
+            if template is None:
+                template = get_template(ROW_TEMPLATE)
+                specs = column_specs(columns)
+            html = template.render(row_context(item, specs, users))
+            fresh[keys[item.id]] = html
+        rows[str(item.id)] = mark_safe(html)
+
+    metrics.CACHE_REQUESTS.inc(len(items) - len(fresh), cache='item_row', result='hit')
+    metrics.CACHE_REQUESTS.inc(len(fresh), cache='item_row', result='miss')
+    if fresh:
+        cache.set_many(fresh, CACHE_TIMEOUT)
+    return rows
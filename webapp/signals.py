@@ -0,0 +1,163 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.db.models import F, QuerySet
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver, Signal
+
+from core.models import Organization
+from core.tracing import traced
+from .models import Board, Group, Column, Item, Workspace
+from . import gantt, loaders
+from .changes import item_payload, group_payload, column_payload
+
+# Sent by webapp.patching after a partial UPDATE of Item.values (post_save does not fire).
+# kwargs: instance, old_values, changed_keys, columns, automation_update
+item_values_patched = Signal()
+
+# Board ids touched inside a batched_board_changes() block (None when not batching)
+_batched_boards = ContextVar('batched_boards', default=None)
+# Change-log entries deferred inside that block, per board id
+_batched_changes = ContextVar('batched_changes', default=None)
+
+
+@contextmanager
+def batched_board_changes():
+    """
+    Defers per-item version bumps while a bulk write runs (e.g. a multi-item delete,
+    which still sends post_delete per row) and bumps each touched board once at the end.
+    Callers add the ids of boards they write to into the yielded set.
+    """
+    touched = set()
+    pending = {}
+    token = _batched_boards.set(touched)
+    changes_token = _batched_changes.set(pending)
+    try:
+        yield touched
+    finally:
+        _batched_boards.reset(token)
+        _batched_changes.reset(changes_token)
+        for board_id in touched:
+            Board.bump_version(board_id, pending.get(board_id))
+
+
+def _group_board_id(group_id):
+    group = loaders.groups().load(group_id)
+    return group.board_id if group else None
+
+
+def _origin_model(origin):
+    return origin.model if isinstance(origin, QuerySet) else type(origin)
+
+
+def _board_going_away(origin):
+    """True when a delete cascades from the board (or its workspace/organization)."""
+    return _origin_model(origin) in (Board, Workspace, Organization)
+
+
+def _change_action(created, signal):
+    if signal is post_delete:
+        return 'delete'
+    return 'insert' if created else 'update'
+
+
+def _bump_for_item(board_id, item_id, item=None, action='update'):
+    """
+    Bumps the board version, logs the item change and carries the cached Gantt
+    schedule forward for one item.
+    """
+    change = ('item', action, item_id, item_payload(item) if item is not None and action != 'delete' else None)
+    touched = _batched_boards.get()
+    if touched is not None:
+        touched.add(board_id)
+        _batched_changes.get().setdefault(board_id, []).append(change)
+        return
+    new_version = Board.bump_version(board_id, [change])
+    if new_version is not None:
+        gantt.apply_item_change(board_id, new_version - 1, new_version, item_id, item)
+
+
+@receiver(post_save, sender=Item)
+@traced('signal.post_save.board_version')
+def item_saved(sender, instance, created, **kwargs):
+    board_id = loaders.item_board_id(instance)
+    loaded = getattr(instance, '_loaded_state', None) or {}
+    old_group_id = loaded.get('group_id')
+
+    # Moved to another board: drop it from the old board's derived data
+    if old_group_id and old_group_id != instance.group_id:
+        old_board_id = _group_board_id(old_group_id)
+        if old_board_id and old_board_id != board_id:
+            _bump_for_item(old_board_id, instance.id, action='delete')
+
+    _bump_for_item(board_id, instance.id, instance, action='insert' if created else 'update')
+    instance._loaded_state = {'group_id': instance.group_id, 'values': dict(instance.values)}
+
+
+@receiver(item_values_patched, sender=Item)
+@traced('signal.item_values_patched.board_version')
+def item_patched(sender, instance, **kwargs):
+    _bump_for_item(loaders.item_board_id(instance), instance.id, instance)
+    instance._loaded_state = {'group_id': instance.group_id, 'values': dict(instance.values)}
+
+
+@receiver(post_delete, sender=Item)
+def item_deleted(sender, instance, origin=None, **kwargs):
+    # A group delete logs one group deletion (group_changed), which stands for its items
+    if _board_going_away(origin) or _origin_model(origin) is Group:
+        return
+    _bump_for_item(instance.board_id, instance.id, action='delete')
+
+
+@receiver(post_save, sender=Group)
+@receiver(post_delete, sender=Group)
+def group_changed(sender, instance, signal, created=False, origin=None, **kwargs):
+    if signal is post_delete and _board_going_away(origin):
+        return
+    action = _change_action(created, signal)
+    change = ('group', action, instance.id, group_payload(instance) if action != 'delete' else None)
+    new_version = Board.bump_version(instance.board_id, [change])
+    # A deleted group took its items with it, so the cached schedule is stale then
+    if new_version is not None and action != 'delete':
+        gantt.carry_forward(instance.board_id, new_version - 1, new_version)
+
+
+@receiver(post_save, sender=Group)
+def sync_group_item_scope(sender, instance, created, **kwargs):
+    """
+    Keeps Item.board / Item.organization in step if a group is moved to another board.
+    The moved items' versions are bumped so cached rows (webapp.rows) are rendered again.
+    """
+    if created:
+        return
+    stale = Item.objects.filter(group=instance).exclude(board_id=instance.board_id)
+    if stale.exists():
+        organization_id = Board.objects.filter(pk=instance.board_id).values_list(
+            'workspace__organization_id', flat=True
+        ).first()
+        stale.update(board_id=instance.board_id, organization_id=organization_id, version=F('version') + 1)
+
+
+@receiver(post_save, sender=Board)
+def sync_board_item_scope(sender, instance, created, **kwargs):
+    """
+    Keeps Item.organization in step if a board is moved to another organization's workspace.
+    """
+    if created:
+        return
+    organization_id = instance.workspace.organization_id
+    Item.objects.filter(board=instance).exclude(organization_id=organization_id).update(
+        organization_id=organization_id
+    )
+
+
+@receiver(post_save, sender=Column)
+@receiver(post_delete, sender=Column)
+def column_changed(sender, instance, signal, created=False, origin=None, **kwargs):
+    if signal is post_delete and _board_going_away(origin):
+        return
+    # Column schema changes invalidate derived data, no carry-forward
+    action = _change_action(created, signal)
+    Board.bump_version(instance.board_id, [
+        ('column', action, instance.id, column_payload(instance) if action != 'delete' else None)
+    ])
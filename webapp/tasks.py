@@ -0,0 +1,57 @@
+from celery import shared_task
+
+
+@shared_task
+def export_board_task(board_id, user_id, fmt='csv'):
+    """
+    Background export for large boards.
+    Stores a compressed file under a random token (see webapp.export.save_export) and
+    notifies the user with a link to the access-checked download view.
+    """
+    import gzip
+    import tempfile
+    from django.urls import reverse
+    from core.models import Notification
+    from .models import Board
+    from .export import iter_csv, write_xlsx, export_filename, save_export
+
+    try:
+        board = Board.objects.select_related('workspace').get(id=board_id)
+    except Board.DoesNotExist:
+        return "Resource Missing"
+
+    with tempfile.TemporaryFile() as tmp:
+        if fmt == 'xlsx':
+            # XLSX is already a deflated zip archive
+            write_xlsx(board, tmp)
+            name = export_filename(board, 'xlsx')
+        else:
+            with gzip.GzipFile(fileobj=tmp, mode='wb') as gz:
+                for line in iter_csv(board):
+                    gz.write(line.encode('utf-8'))
+            name = export_filename(board, 'csv') + '.gz'
+        tmp.seek(0)
+        token = save_export(board, name, tmp)
+
+    link = reverse('download_export', args=[board.id, token])
+    Notification.objects.create(
+        user_id=user_id,
+        title="Export ready",
+        message=f'Your export of "{board.name}" is ready to download.',
+        link=link
+    )
+    return link
+
+
+@shared_task
+def purge_exports():
+    """Deletes background exports older than EXPORT_RETENTION_HOURS."""
+    from .export import purge_exports
+    return purge_exports()
+
+
+@shared_task
+def compact_board_changes():
+    """Trims the board change log; clients further behind get a snapshot instead."""
+    from .changes import compact
+    return compact()
@@ -0,0 +1,91 @@
+from unittest import mock
+
+from django.test import TestCase
+from django.urls import reverse
+
+from core.models import Membership, Organization, User
+from . import api
+from .models import Board, Column, Group, Item, ItemUpdate, Workspace
+
+
+class ReadApiTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username='api', email='api@example.com', password='pw')
+        org = Organization.objects.create(name='Org', owner=self.user)
+        Membership.objects.create(user=self.user, organization=org, role='admin')
+        workspace = Workspace.objects.create(name='WS', organization=org)
+        self.board = Board.objects.create(name='API', workspace=workspace, created_by=self.user)
+        self.status = Column.objects.create(board=self.board, title='Status', type='status', position=0)
+        self.notes = Column.objects.create(board=self.board, title='Notes', type='text', position=1)
+        self.groups = [Group.objects.create(board=self.board, title=f'G{g}', position=g) for g in range(2)]
+        self.items = [
+            Item.objects.create(group=self.groups[i % 2], name=f'Task {i}', position=i, created_by=self.user,
+                                values={str(self.status.id): 'Done', str(self.notes.id): f'note {i}'})
+            for i in range(5)
+        ]
+        self.client.force_login(self.user)
+
+    def _get(self, name, arg, **params):
+        response = self.client.get(reverse(name, args=[arg]), params)
+        self.assertEqual(response['Content-Type'], 'application/json')
+        return response
+
+    def test_sparse_fieldset_down_to_a_column(self):
+        data = self._get('api_board_items', self.board.id, fields=f'name,{self.status.id}').json()
+        self.assertEqual(data['results'][0], {
+            'id': self.items[0].id, 'name': 'Task 0', 'values': {str(self.status.id): 'Done'},
+        })
+        self.assertIsNone(data['next'])
+
+    def test_cursor_walks_all_items_in_constant_queries(self):
+        seen, cursor = [], None
+        while True:
+            params = {'fields': 'name', 'limit': 2}
+            if cursor:
+                params['cursor'] = cursor
+            # session, user, board (the creator needs no membership check), columns, page
+            with self.assertNumQueries(5):
+                data = self._get('api_board_items', self.board.id, **params).json()
+            seen += [row['id'] for row in data['results']]
+            cursor = data['next']
+            if not cursor:
+                break
+        self.assertEqual(seen, [item.id for item in self.items])
+
+    def test_group_filter(self):
+        data = self._get('api_board_items', self.board.id, group=self.groups[1].id, fields='group_id').json()
+        self.assertEqual({row['group_id'] for row in data['results']}, {self.groups[1].id})
+        self.assertEqual(len(data['results']), 2)
+
+    def test_board_and_groups(self):
+        data = self._get('api_board', self.board.id, fields='name,columns').json()
+        self.assertEqual(set(data), {'id', 'name', 'columns'})
+        self.assertEqual([c['title'] for c in data['columns']], ['Status', 'Notes'])
+        groups = self._get('api_board_groups', self.board.id, fields='title').json()['results']
+        self.assertEqual(groups, [{'id': g.id, 'title': g.title} for g in self.groups])
+
+    def test_updates_newest_first(self):
+        item = self.items[0]
+        updates = [ItemUpdate.objects.create(item=item, user=self.user, body=f'Update {i}') for i in range(3)]
+        data = self._get('api_item_updates', item.id, fields='user,body', limit=2).json()
+        self.assertEqual(data['results'], [
+            {'id': updates[2].id, 'user': 'api', 'body': 'Update 2'},
+            {'id': updates[1].id, 'user': 'api', 'body': 'Update 1'},
+        ])
+        rest = self._get('api_item_updates', item.id, cursor=data['next']).json()
+        self.assertEqual([row['id'] for row in rest['results']], [updates[0].id])
+        self.assertIn('created_at', rest['results'][0])
+
+    def test_errors(self):
+        self.assertEqual(self._get('api_board_items', self.board.id, fields='secret').status_code, 400)
+        self.assertEqual(self._get('api_board_items', self.board.id, cursor='!!').status_code, 400)
+        self.assertEqual(self._get('api_board_items', self.board.id, limit=0).status_code, 400)
+        outsider = User.objects.create_user(username='out', email='out@example.com', password='pw')
+        self.client.force_login(outsider)
+        self.assertEqual(self._get('api_board', self.board.id).status_code, 403)
+        self.assertEqual(self._get('api_item_updates', self.items[0].id).status_code, 403)
+
+    def test_stdlib_encoder_matches_orjson_shape(self):
+        with mock.patch.object(api, 'orjson', None):
+            data = self._get('api_board', self.board.id, fields='created_at').json()
+        self.assertEqual(data['created_at'], self.board.created_at.isoformat())
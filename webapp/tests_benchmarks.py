@@ -0,0 +1,65 @@
+import json
+import os
+import tempfile
+from io import StringIO
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+
+from .benchmarks import compare, percentile, pick_target
+from .datagen import TenantGenerator
+from .models import Item
+
+
+class BenchmarkHelpersTest(TestCase):
+    def test_percentile(self):
+        samples = list(range(1, 101))
+        self.assertEqual(percentile(samples, 50), 50)
+        self.assertEqual(percentile(samples, 95), 95)
+        self.assertEqual(percentile(samples, 99), 99)
+        self.assertIsNone(percentile([], 50))
+
+    def test_compare_flags_regressions(self):
+        baseline = {'results': {'board_detail': {'p50_ms': 10.0, 'p95_ms': 20.0, 'queries': 9}}}
+        current = {'results': {'board_detail': {'p50_ms': 10.5, 'p95_ms': 30.0, 'queries': 10}}}
+
+        flagged = {(name, metric) for name, metric, *_, regressed in compare(current, baseline) if regressed}
+
+        self.assertEqual(flagged, {('board_detail', 'p95_ms'), ('board_detail', 'queries')})
+
+
+class RunBenchmarksCommandTest(TestCase):
+    def setUp(self):
+        TenantGenerator(users=2, workspaces=1, boards=1, groups=2, items=30, seed=3).run()
+        self.output = os.path.join(tempfile.mkdtemp(), 'bench.json')
+
+    def test_writes_results_and_leaves_data_untouched(self):
+        board, user = pick_target()
+        before = list(Item.objects.filter(board=board).order_by('id').values_list('group_id', 'values'))
+
+        call_command('run_benchmarks', iterations=2, warmup=0, output=self.output, stdout=StringIO())
+
+        with open(self.output) as fh:
+            results = json.load(fh)['results']
+        self.assertEqual(set(results), {
+            'board_detail', 'kanban_view', 'calendar_view', 'my_work_view', 'global_search',
+            'update_status', 'update_item_order', 'automation_status_change',
+        })
+        self.assertTrue(all(r['status'] == 200 for r in results.values()), results)
+        self.assertGreater(results['board_detail']['queries'], 0)
+        after = list(Item.objects.filter(board=board).order_by('id').values_list('group_id', 'values'))
+        self.assertEqual(before, after)
+
+    def test_fail_on_regression(self):
+        call_command('run_benchmarks', iterations=1, warmup=0, only=['global_search'],
+                     output=self.output, stdout=StringIO())
+        with open(self.output) as fh:
+            baseline = json.load(fh)
+        baseline['results']['global_search']['queries'] = 0
+        with open(self.output, 'w') as fh:
+            json.dump(baseline, fh)
+
+        with self.assertRaises(CommandError):
+            call_command('run_benchmarks', iterations=1, warmup=0, only=['global_search'],
+                         baseline=self.output, fail_on_regression=True, stdout=StringIO())
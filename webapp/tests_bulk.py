@@ -0,0 +1,97 @@
+import json
+from unittest import mock
+
+from django.test import TestCase
+from django.urls import reverse
+
+from .models import Item, Group, Board, Workspace, Column
+from automation.models import AutomationRule, AutomationLog
+from core.models import Organization, User, Membership
+
+
+class BulkItemsTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username='bulk', email='bulk@example.com', password='pw')
+        self.org = Organization.objects.create(name='Org', owner=self.user)
+        Membership.objects.create(user=self.user, organization=self.org, role='admin')
+        self.workspace = Workspace.objects.create(name='WS', organization=self.org)
+        self.board = Board.objects.create(name='Bulk', workspace=self.workspace, created_by=self.user)
+        self.todo = Group.objects.create(board=self.board, title='Todo', position=0)
+        self.done = Group.objects.create(board=self.board, title='Done', position=1)
+        self.status = Column.objects.create(board=self.board, title='Status', type='status',
+                                            settings={'choices': ['Todo', 'Done']})
+        self.items = [Item.objects.create(group=self.todo, name=f'Item {i}', position=i) for i in range(50)]
+        self.url = reverse('bulk_items', args=[self.board.id])
+        self.client.force_login(self.user)
+
+    def _post(self, payload):
+        return self.client.post(self.url, json.dumps(payload), content_type='application/json')
+
+    def test_status_update_is_a_handful_of_queries(self):
+        ids = [i.id for i in self.items]
+        # session, user, board, columns, items, bulk UPDATE + version read-back, version bump
+        # + change log (+ savepoint for the bulk write), rule lookup
+        with self.assertNumQueries(12):
+            response = self._post({'action': 'update', 'item_ids': ids, 'changes': {self.status.id: 'Done'}})
+
+        self.assertEqual(response.json()['count'], 50)
+        statuses = {i.values.get(str(self.status.id)) for i in Item.objects.all()}
+        self.assertEqual(statuses, {'Done'})
+
+    def test_status_update_fires_batched_automations(self):
+        rule = AutomationRule.objects.create(
+            board=self.board, name='Done', trigger_type='status_change',
+            trigger_config={'column_id': self.status.id, 'value': 'Done'},
+            action_type='send_notification', action_config={},
+        )
+        ids = [i.id for i in self.items[:5]]
+        self._post({'action': 'update', 'item_ids': ids, 'changes': {self.status.id: 'Done'}})
+
+        self.assertEqual(AutomationLog.objects.filter(rule=rule, status='success').count(), 5)
+
+    def test_update_writes_only_the_changed_keys_and_recomputes_formulas(self):
+        hours = Column.objects.create(board=self.board, title='Hours', type='numbers', position=1)
+        double = Column.objects.create(board=self.board, title='Double', type='formula', position=2)
+        item = self.items[0]
+        Item.objects.filter(pk=item.pk).update(values={str(double.id): '={Hours} * 2'}, version=7)
+
+        # Another writer's key, written after the bulk request was built, survives
+        stale = [Item.objects.get(pk=item.pk)]
+        Item.objects.filter(pk=item.pk).update(values={str(double.id): '={Hours} * 2', 'note': 'keep'})
+        with mock.patch('webapp.bulk._load_items', lambda board, ids: stale):
+            self._post({'action': 'update', 'item_ids': [item.id], 'changes': {hours.id: 5}})
+
+        item.refresh_from_db()
+        self.assertEqual(item.values['note'], 'keep')
+        self.assertEqual(item.values[str(hours.id)], 5)
+        self.assertEqual(item.values[f'{double.id}_result'], 10)
+        self.assertEqual(item.version, 8)
+
+    def test_move_bumps_versions_in_sql(self):
+        item = self.items[0]
+        stale = Item.objects.get(pk=item.pk)
+        Item.objects.filter(pk=item.pk).update(version=4)
+        stale.name = 'Renamed'
+        stale.save()
+        self.assertEqual(stale.version, 5)
+
+        self._post({'action': 'move', 'item_ids': [item.id], 'group_id': self.done.id})
+        item.refresh_from_db()
+        self.assertEqual(item.version, 6)
+
+    def test_move_and_delete(self):
+        ids = [i.id for i in self.items[:3]]
+        self._post({'action': 'move', 'item_ids': ids, 'group_id': self.done.id})
+        self.assertEqual(self.done.items.count(), 3)
+
+        self._post({'action': 'delete', 'item_ids': ids})
+        self.assertEqual(Item.objects.filter(id__in=ids).count(), 0)
+
+    def test_items_from_other_boards_are_ignored(self):
+        other = Board.objects.create(name='Other', workspace=self.workspace, created_by=self.user)
+        stranger = Item.objects.create(group=Group.objects.create(board=other, title='G'), name='Keep me')
+
+        response = self._post({'action': 'delete', 'item_ids': [stranger.id]})
+
+        self.assertEqual(response.json()['count'], 0)
+        self.assertTrue(Item.objects.filter(id=stranger.id).exists())
@@ -0,0 +1,231 @@
+import asyncio
+import json
+
+from asgiref.sync import sync_to_async
+from datetime import timedelta
+
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from core.models import Membership, Organization, User
+from .bulk import bulk_delete, bulk_update_values
+from .changes import changes_since, compact, stream
+from .models import Board, BoardChange, Column, Group, Item, Workspace
+
+
+def _events(chunks):
+    return [json.loads(chunk.split('data: ', 1)[1]) for chunk in chunks if 'event: change' in chunk]
+
+
+class ChangeLogTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username='feed', email='feed@example.com', password='pw')
+        org = Organization.objects.create(name='Org', owner=self.user)
+        Membership.objects.create(user=self.user, organization=org, role='admin')
+        self.workspace = Workspace.objects.create(name='WS', organization=org)
+        self.board = Board.objects.create(name='Feed', workspace=self.workspace, created_by=self.user)
+        self.status = Column.objects.create(board=self.board, title='Status', type='status', position=0)
+        self.group = Group.objects.create(board=self.board, title='G', position=0)
+
+    def _log(self, since=0):
+        return list(BoardChange.objects.filter(board=self.board, seq__gt=since).values_list('kind', 'action', 'object_id'))
+
+    def test_item_group_and_column_changes_are_logged_with_board_version(self):
+        item = Item.objects.create(group=self.group, name='Task', position=0, created_by=self.user)
+        item_id = item.id
+        item.name = 'Renamed'
+        item.save()
+        item.delete()
+
+        self.board.refresh_from_db()
+        self.assertEqual(self._log(), [
+            ('column', 'insert', self.status.id), ('group', 'insert', self.group.id),
+            ('item', 'insert', item_id), ('item', 'update', item_id), ('item', 'delete', item_id),
+        ])
+        last = BoardChange.objects.filter(board=self.board).last()
+        self.assertEqual(last.seq, self.board.version)
+        update = BoardChange.objects.get(board=self.board, action='update')
+        self.assertEqual(update.data['name'], 'Renamed')
+
+    def test_bulk_operations_share_one_seq(self):
+        items = [Item.objects.create(group=self.group, name=f'T{i}', position=i, created_by=self.user) for i in range(3)]
+        self.board.refresh_from_db()
+        before = self.board.version
+
+        bulk_update_values(self.board, [i.id for i in items], {self.status.id: 'Done'})
+        bulk_delete(self.board, [i.id for i in items])
+
+        changes = list(BoardChange.objects.filter(board=self.board, seq__gt=before).values_list('seq', 'action'))
+        self.assertEqual(changes, [(before + 1, 'update')] * 3 + [(before + 2, 'delete')] * 3)
+
+    def test_deleting_group_logs_one_change(self):
+        for i in range(50):
+            Item.objects.create(group=self.group, name=f'T{i}', position=i, created_by=self.user)
+        self.board.refresh_from_db()
+        before = self.board.version
+        group_id = self.group.id
+
+        self.group.delete()
+
+        self.board.refresh_from_db()
+        self.assertEqual(self.board.version, before + 1)
+        self.assertEqual(self._log(before), [('group', 'delete', group_id)])
+
+    def test_pages_never_split_a_seq(self):
+        items = [Item.objects.create(group=self.group, name=f'T{i}', position=i, created_by=self.user) for i in range(6)]
+        self.board.refresh_from_db()
+        before = self.board.version
+        bulk_update_values(self.board, [i.id for i in items], {self.status.id: 'Done'})
+        Item.objects.filter(pk=items[0].pk).first().save()
+
+        # The bulk seq alone is over the limit: returned whole
+        changes, more = changes_since(self.board.id, before, limit=4)
+        self.assertEqual([c['seq'] for c in changes], [before + 1] * 6)
+        self.assertTrue(more)
+        changes, more = changes_since(self.board.id, before + 1, limit=4)
+        self.assertEqual([c['seq'] for c in changes], [before + 2])
+        self.assertFalse(more)
+
+        # A page that reaches into the bulk seq stops before it
+        changes, more = changes_since(self.board.id, before - 1, limit=4)
+        self.assertEqual([c['seq'] for c in changes], [before])
+        self.assertTrue(more)
+
+    def test_deleting_board_cascades_cleanly(self):
+        Item.objects.create(group=self.group, name='Task', position=0, created_by=self.user)
+        self.board.delete()
+        self.assertFalse(BoardChange.objects.exists())
+
+
+class DeltaSyncTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username='feed', email='feed@example.com', password='pw')
+        org = Organization.objects.create(name='Org', owner=self.user)
+        Membership.objects.create(user=self.user, organization=org, role='admin')
+        workspace = Workspace.objects.create(name='WS', organization=org)
+        self.board = Board.objects.create(name='Feed', workspace=workspace, created_by=self.user)
+        self.group = Group.objects.create(board=self.board, title='G', position=0)
+        self.item = Item.objects.create(group=self.group, name='Kept', position=0, created_by=self.user)
+        self.client.force_login(self.user)
+
+    def _since(self, since):
+        return self.client.get(reverse('board_changes', args=[self.board.id]), {'since': since}).json()
+
+    def test_returns_squashed_changes_since_seq(self):
+        self.board.refresh_from_db()
+        since = self.board.version
+        self.item.name = 'Renamed'
+        self.item.save()
+        self.item.name = 'Renamed again'
+        self.item.save()
+        temp = Item.objects.create(group=self.group, name='Temp', position=1, created_by=self.user)
+        temp.delete()
+        added = Item.objects.create(group=self.group, name='New', position=2, created_by=self.user)
+        added.name = 'New and edited'
+        added.save()
+
+        data = self._since(since)
+        self.board.refresh_from_db()
+        self.assertEqual(data['version'], self.board.version)
+        self.assertNotIn('snapshot', data)
+        self.assertEqual(
+            [(c['action'], c['id'], c['data']['name']) for c in data['changes']],
+            [('update', self.item.id, 'Renamed again'), ('insert', added.id, 'New and edited')],
+        )
+
+    def test_up_to_date_client_gets_nothing(self):
+        self.board.refresh_from_db()
+        self.assertEqual(self._since(self.board.version), {'version': self.board.version, 'changes': []})
+
+    def test_falls_back_to_snapshot_after_compaction(self):
+        self.board.refresh_from_db()
+        BoardChange.objects.update(created_at=timezone.now() - timedelta(days=30))
+        self.assertEqual(compact(), 2)
+
+        data = self._since(0)
+        self.assertNotIn('changes', data)
+        self.assertEqual([g['id'] for g in data['snapshot']['groups']], [self.group.id])
+        self.assertEqual([(i['id'], i['name']) for i in data['snapshot']['items']], [(self.item.id, 'Kept')])
+
+        # Entries written after compaction still serve clients that saw the compacted range
+        since = self.board.version
+        self.item.name = 'Later'
+        self.item.save()
+        self.assertEqual(self._since(since)['changes'][0]['data']['name'], 'Later')
+
+    def test_validates_since_and_access(self):
+        self.assertEqual(self.client.get(reverse('board_changes', args=[self.board.id])).status_code, 400)
+        outsider = User.objects.create_user(username='out', email='out@example.com', password='pw')
+        self.client.force_login(outsider)
+        response = self.client.get(reverse('board_changes', args=[self.board.id]), {'since': 0})
+        self.assertEqual(response.status_code, 403)
+
+
+class ChangeStreamTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username='feed', email='feed@example.com', password='pw')
+        org = Organization.objects.create(name='Org', owner=self.user)
+        Membership.objects.create(user=self.user, organization=org, role='admin')
+        workspace = Workspace.objects.create(name='WS', organization=org)
+        self.board = Board.objects.create(name='Feed', workspace=workspace, created_by=self.user)
+        self.group = Group.objects.create(board=self.board, title='G', position=0)
+        self.board.refresh_from_db()
+
+    def _create_item(self, name):
+        # on_commit callbacks (notify) do not run inside a test transaction unless captured
+        with self.captureOnCommitCallbacks(execute=True):
+            return Item.objects.create(group=self.group, name=name, position=0, created_by=self.user)
+
+    async def test_stream_replays_then_wakes_on_commit(self):
+        since = self.board.version
+        first = await sync_to_async(self._create_item)('Before')
+        feed = stream(self.board.id, since, poll_interval=30, max_age=60)
+        try:
+            chunks = [await feed.__anext__() for _ in range(2)]
+            self.assertTrue(chunks[0].startswith('retry:'))
+            self.assertEqual(_events(chunks)[0]['id'], first.id)
+
+            pending = asyncio.ensure_future(feed.__anext__())
+            await asyncio.sleep(0.05)
+            second = await sync_to_async(self._create_item)('After')
+            # Far sooner than the 30 s poll interval: the commit woke the stream
+            chunk = await asyncio.wait_for(pending, timeout=5)
+            self.assertEqual(_events([chunk])[0]['id'], second.id)
+            self.assertIn(f"id: {self.board.version + 2}\n", chunk)
+        finally:
+            await feed.aclose()
+
+    async def test_endpoint(self):
+        await sync_to_async(self.async_client.force_login)(self.user)
+        since = self.board.version
+        await sync_to_async(self._create_item)('Task')
+
+        response = await self.async_client.get(reverse('board_changes_stream', args=[self.board.id]), {'since': since})
+        self.assertEqual(response['Content-Type'], 'text/event-stream')
+        content = response.streaming_content
+        chunks = [await content.__anext__() for _ in range(2)]
+        await content.aclose()
+        self.assertEqual(_events([c.decode() for c in chunks])[0]['data']['name'], 'Task')
+
+    async def test_reconnect_resumes_from_last_event_id(self):
+        await sync_to_async(self.async_client.force_login)(self.user)
+        page_load = self.board.version
+        await sync_to_async(self._create_item)('Seen')
+        await sync_to_async(self._create_item)('Missed')
+
+        # The browser reconnects with the page's original ?since= and the last id it got
+        response = await self.async_client.get(
+            reverse('board_changes_stream', args=[self.board.id]), {'since': page_load},
+            headers={'Last-Event-ID': str(page_load + 1)},
+        )
+        content = response.streaming_content
+        chunks = [await content.__anext__() for _ in range(2)]
+        await content.aclose()
+        self.assertEqual([e['data']['name'] for e in _events([c.decode() for c in chunks])], ['Missed'])
+
+    async def test_endpoint_requires_access(self):
+        outsider = await sync_to_async(User.objects.create_user)(username='out', email='out@example.com', password='pw')
+        await sync_to_async(self.async_client.force_login)(outsider)
+        response = await self.async_client.get(reverse('board_changes_stream', args=[self.board.id]))
+        self.assertEqual(response.status_code, 403)
@@ -0,0 +1,94 @@
+from django.test import TestCase
+from django.urls import reverse
+
+from automation.models import AutomationRule
+from core.models import Membership, Organization, User
+from .models import Board, Column, Group, Item, ItemUpdate, Workspace
+
+
+class ConditionalGetTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username='etag', email='etag@example.com', password='pw')
+        org = Organization.objects.create(name='Org', owner=self.user)
+        Membership.objects.create(user=self.user, organization=org, role='admin')
+        workspace = Workspace.objects.create(name='WS', organization=org)
+        self.board = Board.objects.create(name='Cached', workspace=workspace, created_by=self.user)
+        Column.objects.create(board=self.board, title='Status', type='status', position=0)
+        Column.objects.create(board=self.board, title='Due', type='date', position=1)
+        self.group = Group.objects.create(board=self.board, title='G', position=0)
+        self.item = Item.objects.create(group=self.group, name='Task', position=0, created_by=self.user)
+        self.client.force_login(self.user)
+
+    def _revalidate(self, url):
+        # The first response sets the CSRF cookie, which is part of the validator
+        self.client.get(url)
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('no-cache', response['Cache-Control'])
+        return response['ETag']
+
+    def test_board_views_answer_304_after_one_lookup(self):
+        for name in ('board_detail', 'board_kanban', 'board_calendar'):
+            url = reverse(name, args=[self.board.id])
+            etag = self._revalidate(url)
+            # session, user, board version
+            with self.assertNumQueries(3):
+                response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+            self.assertEqual(response.status_code, 304, name)
+
+    def test_item_group_column_and_rule_changes_invalidate(self):
+        url = reverse('board_detail', args=[self.board.id])
+        changes = [
+            lambda: Item.objects.create(group=self.group, name='New', position=1, created_by=self.user),
+            lambda: Group.objects.filter(pk=self.group.pk).first().save(),
+            lambda: Column.objects.create(board=self.board, title='Notes', type='text', position=2),
+            lambda: AutomationRule.objects.create(board=self.board, name='Rule', trigger_type='item_created',
+                                                  action_type='send_notification'),
+        ]
+        for change in changes:
+            etag = self._revalidate(url)
+            change()
+            self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_etag_is_per_user(self):
+        url = reverse('board_detail', args=[self.board.id])
+        etag = self._revalidate(url)
+        other = User.objects.create_user(username='other', email='other@example.com', password='pw')
+        Membership.objects.create(user=other, organization=self.board.workspace.organization, role='member')
+        self.client.force_login(other)
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_member_changes_invalidate(self):
+        url = reverse('board_detail', args=[self.board.id])
+        org = self.board.workspace.organization
+        etag = self._revalidate(url)
+        newcomer = User.objects.create_user(username='newcomer', email='new@example.com', password='pw')
+        membership = Membership.objects.create(user=newcomer, organization=org, role='member')
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+        etag = self._revalidate(url)
+        membership.delete()
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_revoked_access_gets_403_not_304(self):
+        viewer = User.objects.create_user(username='viewer', email='viewer@example.com', password='pw')
+        membership = Membership.objects.create(
+            user=viewer, organization=self.board.workspace.organization, role='member')
+        self.client.force_login(viewer)
+        for name in ('board_detail', 'board_kanban', 'board_calendar'):
+            url = reverse(name, args=[self.board.id])
+            etag = self._revalidate(url)
+            Membership.objects.filter(pk=membership.pk).delete()
+            self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 403, name)
+            membership.save(force_insert=True)
+
+    def test_item_details_revalidate_on_new_update(self):
+        url = reverse('get_item_details', args=[self.item.id])
+        etag = self._revalidate(url)
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+        ItemUpdate.objects.create(item=self.item, user=self.user, body='Looks good')
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_missing_board_is_still_404(self):
+        self.assertEqual(self.client.get(reverse('board_detail', args=[9999])).status_code, 404)
@@ -0,0 +1,48 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from .datagen import TenantGenerator, board_weights
+from .models import Item, ItemUpdate, Board, Column
+from automation.models import AutomationRule
+
+
+class TenantGeneratorTest(TestCase):
+    def _generate(self, **kwargs):
+        options = dict(users=3, workspaces=2, boards=2, groups=2, items=200, batch_size=50, seed=7)
+        options.update(kwargs)
+        return TenantGenerator(**options).run()
+
+    def test_counts_and_column_coverage(self):
+        summary = self._generate()
+        boards = Board.objects.filter(workspace__organization_id=summary['organization'])
+
+        self.assertEqual(boards.count(), 4)
+        self.assertEqual(Item.objects.filter(organization_id=summary['organization'], parent__isnull=True).count(), 200)
+        self.assertEqual(Item.objects.filter(parent__isnull=False).count(), summary['subitems'])
+        self.assertEqual(ItemUpdate.objects.count(), summary['updates'])
+        self.assertEqual(AutomationRule.objects.filter(board__in=boards).count(), 12)
+        expected_types = {t for t, _ in Column.COLUMN_TYPES}
+        self.assertEqual(set(Column.objects.filter(board=boards[0]).values_list('type', flat=True)), expected_types)
+
+    def test_same_seed_same_data(self):
+        first = self._generate(name='First')
+        second = self._generate(name='Second')
+
+        def names(org_id):
+            return list(Item.objects.filter(organization_id=org_id).order_by('id').values_list('name', flat=True))
+
+        self.assertEqual(names(first['organization']), names(second['organization']))
+        with self.assertRaises(ValueError):
+            self._generate(name='First')
+
+    def test_skewed_distribution(self):
+        weights = board_weights(10, 'skewed')
+        self.assertAlmostEqual(sum(weights), 1.0)
+        self.assertGreater(weights[0], 5 * weights[-1])
+
+    def test_command(self):
+        out = StringIO()
+        call_command('generate_tenant', items=50, users=2, workspaces=1, boards=2, groups=2, stdout=out)
+        self.assertIn('50 items', out.getvalue())
@@ -0,0 +1,101 @@
+import csv
+import gzip
+import io
+import os
+import shutil
+import tempfile
+import time
+import zipfile
+
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from .export import export_storage, purge_exports
+from .models import Item, Group, Board, Workspace, Column
+from core.models import Notification, Organization, User, Membership
+
+
+class BoardExportTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='exporter', email='export@example.com', password='pw', first_name='Ada', last_name='Lovelace'
+        )
+        self.org = Organization.objects.create(name='Org', owner=self.user)
+        Membership.objects.create(user=self.user, organization=self.org, role='admin')
+        self.workspace = Workspace.objects.create(name='WS', organization=self.org)
+        self.board = Board.objects.create(name='Export Me', workspace=self.workspace, created_by=self.user)
+        self.group = Group.objects.create(board=self.board, title='Backlog')
+        self.person = Column.objects.create(board=self.board, title='Owner', type='person', position=0)
+        self.formula = Column.objects.create(board=self.board, title='Total', type='formula', position=1)
+        Item.objects.create(group=self.group, name='Write docs', values={
+            str(self.person.id): 'exporter',
+            str(self.formula.id): '=2+2',
+            f'{self.formula.id}_result': 4,
+        })
+        self.client.force_login(self.user)
+
+    def test_csv_export_streams_resolved_values(self):
+        response = self.client.get(reverse('export_board', args=[self.board.id]))
+        body = b''.join(response.streaming_content).decode('utf-8')
+        rows = list(csv.reader(io.StringIO(body)))
+
+        self.assertEqual(rows[0], ['Group', 'Name', 'Owner', 'Total'])
+        self.assertEqual(rows[1], ['Backlog', 'Write docs', 'Ada Lovelace', '4'])
+
+    def test_xlsx_export_is_valid_workbook(self):
+        response = self.client.get(reverse('export_board', args=[self.board.id]), {'format': 'xlsx'})
+        archive = zipfile.ZipFile(io.BytesIO(b''.join(response.streaming_content)))
+
+        sheet = archive.read('xl/worksheets/sheet1.xml').decode('utf-8')
+        self.assertIn('Ada Lovelace', sheet)
+        self.assertIn('[Content_Types].xml', archive.namelist())
+
+
+class BackgroundExportTest(TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.root, True)
+        override = override_settings(EXPORT_ROOT=self.root)
+        override.enable()
+        self.addCleanup(override.disable)
+
+        self.user = User.objects.create_user(username='bg', email='bg@example.com', password='pw')
+        org = Organization.objects.create(name='Org', owner=self.user)
+        Membership.objects.create(user=self.user, organization=org, role='admin')
+        workspace = Workspace.objects.create(name='WS', organization=org)
+        self.board = Board.objects.create(name='Private', workspace=workspace, created_by=self.user)
+        Item.objects.create(group=Group.objects.create(board=self.board, title='G'), name='Secret plan')
+        self.client.force_login(self.user)
+
+    def _export(self):
+        response = self.client.get(reverse('export_board', args=[self.board.id]), {'background': 1})
+        self.assertEqual(response.status_code, 202)
+        return Notification.objects.get(user=self.user, title='Export ready').link
+
+    def test_link_is_tokenized_and_access_checked(self):
+        link = self._export()
+        self.assertNotIn('/media/', link)
+        body = gzip.decompress(b''.join(self.client.get(link).streaming_content)).decode()
+        self.assertIn('Secret plan', body)
+
+        outsider = User.objects.create_user(username='out', email='out@example.com', password='pw')
+        self.client.force_login(outsider)
+        self.assertEqual(self.client.get(link).status_code, 403)
+
+        self.client.force_login(self.user)
+        guessed = reverse('download_export', args=[self.board.id, 'not-the-token'])
+        self.assertEqual(self.client.get(guessed).status_code, 404)
+
+    def test_expired_exports_are_purged(self):
+        link = self._export()
+        self.assertEqual(purge_exports(), 0)
+
+        storage = export_storage()
+        for board_dir in storage.listdir('')[0]:
+            for token in storage.listdir(board_dir)[0]:
+                for name in storage.listdir(f'{board_dir}/{token}')[1]:
+                    old = time.time() - 2 * 24 * 60 * 60
+                    os.utime(storage.path(f'{board_dir}/{token}/{name}'), (old, old))
+
+        self.assertEqual(purge_exports(), 1)
+        self.assertEqual(self.client.get(link).status_code, 404)
@@ -0,0 +1,117 @@
+import json
+from datetime import date
+
+from django.core.cache import cache
+from django.db import transaction
+from django.test import TestCase
+from django.urls import reverse
+
+from .gantt import compute_schedule, get_gantt_data
+from .models import Item, Group, Board, Workspace, Column
+from core.models import Organization, User, Membership
+
+
+def _node(item_id, start, end, deps=()):
+    return {
+        'id': item_id, 'name': str(item_id), 'group_id': 1, 'position': item_id,
+        'start': date.fromisoformat(start).toordinal() if start else None,
+        'end': date.fromisoformat(end).toordinal() if end else None,
+        'deps': list(deps),
+    }
+
+
+class ComputeScheduleTest(TestCase):
+    def test_critical_path_and_slack(self):
+        # 1 -> 2 -> 4 is the long chain, 3 has two days of slack
+        nodes = {
+            1: _node(1, '2025-01-01', '2025-01-03'),
+            2: _node(2, '2025-01-04', '2025-01-08', deps=[1]),
+            3: _node(3, '2025-01-04', '2025-01-06', deps=[1]),
+            4: _node(4, '2025-01-09', '2025-01-10', deps=[2, 3]),
+        }
+        schedule, critical_path = compute_schedule(nodes)
+
+        self.assertEqual(critical_path, [1, 2, 4])
+        self.assertEqual(schedule[3]['slack'], 2)
+        self.assertFalse(schedule[3]['critical'])
+
+    def test_predecessor_pushes_successor(self):
+        nodes = {
+            1: _node(1, '2025-01-01', '2025-01-05'),
+            2: _node(2, '2025-01-03', '2025-01-04', deps=[1]),
+        }
+        schedule, _ = compute_schedule(nodes)
+        self.assertEqual(schedule[2]['es'], date(2025, 1, 6).toordinal())
+
+    def test_cycle_is_flagged(self):
+        nodes = {
+            1: _node(1, '2025-01-01', '2025-01-02', deps=[2]),
+            2: _node(2, '2025-01-03', '2025-01-04', deps=[1]),
+            3: _node(3, None, None),
+        }
+        schedule, critical_path = compute_schedule(nodes)
+        self.assertTrue(schedule[1]['cycle'])
+        self.assertNotIn(3, schedule)
+        self.assertEqual(critical_path, [])
+
+
+class GanttDataTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username='gantt', email='gantt@example.com', password='pw')
+        self.org = Organization.objects.create(name='Org', owner=self.user)
+        Membership.objects.create(user=self.user, organization=self.org, role='admin')
+        self.workspace = Workspace.objects.create(name='WS', organization=self.org)
+        self.board = Board.objects.create(name='Plan', workspace=self.workspace, created_by=self.user)
+        self.group = Group.objects.create(board=self.board, title='Phase 1')
+        self.timeline = Column.objects.create(board=self.board, title='Timeline', type='timeline')
+        self.deps = Column.objects.create(board=self.board, title='Depends on', type='dependency')
+        self.first = Item.objects.create(group=self.group, name='Design', values={
+            str(self.timeline.id): {'start': '2025-02-01', 'end': '2025-02-03'},
+        })
+        self.second = Item.objects.create(group=self.group, name='Build', values={
+            str(self.timeline.id): {'start': '2025-02-04', 'end': '2025-02-10'},
+            str(self.deps.id): {'ids': [self.first.id], 'names': ['Design']},
+        })
+        self.client.force_login(self.user)
+
+    def test_endpoint_streams_schedule(self):
+        response = self.client.get(reverse('board_gantt_data', args=[self.board.id]))
+        data = json.loads(b''.join(response.streaming_content))
+
+        self.assertEqual(data['critical_path'], [self.first.id, self.second.id])
+        self.assertEqual([i['name'] for i in data['items']], ['Design', 'Build'])
+        self.assertEqual(data['items'][1]['deps'], [self.first.id])
+
+    def test_single_item_change_is_applied_without_rebuild(self):
+        self.board.refresh_from_db()
+        with self.captureOnCommitCallbacks(execute=True):
+            get_gantt_data(self.board)
+
+        self.first.values[str(self.timeline.id)] = {'start': '2025-02-01', 'end': '2025-02-06'}
+        with self.captureOnCommitCallbacks(execute=True):
+            self.first.save()
+        self.board.refresh_from_db()
+
+        with self.assertNumQueries(0):
+            entry = get_gantt_data(self.board)
+        expected = date(2025, 2, 7).toordinal()
+        self.assertEqual(entry['schedule'][self.second.id]['es'], expected)
+
+    def test_rolled_back_change_is_not_cached(self):
+        self.board.refresh_from_db()
+        with self.captureOnCommitCallbacks(execute=True):
+            get_gantt_data(self.board)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            with self.assertRaises(RuntimeError):
+                with transaction.atomic():
+                    self.first.name = 'Rolled back'
+                    self.first.save()
+                    raise RuntimeError
+            # Reuses the version number the rolled-back save had claimed
+            Column.objects.create(board=self.board, title='Notes', type='text')
+
+        self.board.refresh_from_db()
+        entry = get_gantt_data(self.board)
+        self.assertEqual(entry['graph']['nodes'][self.first.id]['name'], 'Design')
@@ -0,0 +1,58 @@
+import io
+
+from django.test import TestCase
+
+from .importer import BoardImporter
+from .models import Item, Group, Board, Workspace, Column
+from automation.models import AutomationRule, AutomationLog
+from core.models import Organization, User, Membership
+
+
+class BoardImportTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='importer', email='import@example.com', password='pw', first_name='Grace', last_name='Hopper'
+        )
+        self.org = Organization.objects.create(name='Org', owner=self.user)
+        Membership.objects.create(user=self.user, organization=self.org, role='admin')
+        self.workspace = Workspace.objects.create(name='WS', organization=self.org)
+        self.board = Board.objects.create(name='Import', workspace=self.workspace, created_by=self.user)
+        self.group = Group.objects.create(board=self.board, title='Backlog')
+        self.status = Column.objects.create(board=self.board, title='Status', type='status',
+                                            settings={'choices': ['Todo', 'Done']})
+        self.person = Column.objects.create(board=self.board, title='Owner', type='person')
+        self.estimate = Column.objects.create(board=self.board, title='Estimate', type='number')
+        self.total = Column.objects.create(board=self.board, title='Total', type='formula')
+
+    def _csv(self, rows):
+        return io.StringIO('Name,Group,Owner,Estimate,Total,Unknown\n' + '\n'.join(rows) + '\n')
+
+    def test_rows_are_mapped_and_formulas_computed(self):
+        result = BoardImporter(self.board, user=self.user).run(self._csv([
+            'Task A,Backlog,Grace Hopper,3,={Estimate} * 2,x',
+            'Task B,Later,importer,5,,y',
+            ',Backlog,,,,',
+        ]))
+
+        self.assertEqual(result['created'], 2)
+        self.assertEqual(result['skipped'], 1)
+        self.assertEqual(result['unmapped_headers'], ['Unknown'])
+
+        task_a = Item.objects.get(name='Task A')
+        self.assertEqual(task_a.values[str(self.person.id)], 'importer')
+        self.assertEqual(task_a.values[str(self.status.id)], 'Todo')
+        self.assertEqual(task_a.values[f'{self.total.id}_result'], 6.0)
+        self.assertEqual(Item.objects.get(name='Task B').group.title, 'Later')
+
+    def test_item_created_automations_run_once_per_item_in_bulk(self):
+        rule = AutomationRule.objects.create(
+            board=self.board, name='Welcome', trigger_type='item_created',
+            action_type='send_notification', action_config={'user_id': self.user.id},
+        )
+        rows = [f'Task {i},Backlog,,1,,' for i in range(30)]
+
+        result = BoardImporter(self.board, batch_size=10).run(self._csv(rows))
+
+        self.assertEqual(result['created'], 30)
+        self.assertEqual(result['automations'], 30)
+        self.assertEqual(AutomationLog.objects.filter(rule=rule).count(), 30)
@@ -0,0 +1,109 @@
+from django.db import connection
+from django.test import TestCase
+from django.test.signals import template_rendered
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from core.models import Membership, Organization, User
+from .models import Board, Column, Group, Item, Workspace
+from .rows import ROW_TEMPLATE
+
+HTMX = {'HTTP_HX_REQUEST': 'true'}
+
+
+class StructuralPartialTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username='parts', email='parts@example.com', password='pw')
+        org = Organization.objects.create(name='Org', owner=self.user)
+        Membership.objects.create(user=self.user, organization=org, role='admin')
+        workspace = Workspace.objects.create(name='WS', organization=org)
+        self.board = Board.objects.create(name='Parts', workspace=workspace, created_by=self.user)
+        Column.objects.create(board=self.board, title='Status', type='status', position=0)
+        self.groups = [Group.objects.create(board=self.board, title=f'G{g}', position=g) for g in range(2)]
+        self.items = [
+            Item.objects.create(group=self.groups[i % 2], name=f'Task {i}', position=i, created_by=self.user)
+            for i in range(6)
+        ]
+        self.client.force_login(self.user)
+
+    def _add_column(self):
+        rendered = []
+
+        def on_render(sender, template, context, **kwargs):
+            rendered.append(template.name)
+
+        template_rendered.connect(on_render)
+        try:
+            with CaptureQueriesContext(connection) as ctx:
+                response = self.client.post(reverse('add_column', args=[self.board.id]),
+                                            {'type': 'text', 'title': 'Notes'}, **HTMX)
+        finally:
+            template_rendered.disconnect(on_render)
+        self.assertEqual(response.status_code, 200)
+        return response, rendered, len(ctx)
+
+    def test_add_column_returns_only_the_new_cells(self):
+        response, rendered, _ = self._add_column()
+        column = Column.objects.get(board=self.board, title='Notes')
+
+        self.assertNotIn(ROW_TEMPLATE, rendered)
+        self.assertContains(response, 'hx-swap-oob="beforebegin:.column-add-anchor"', count=1)
+        self.assertContains(response, f'data-column-id="{column.id}"', count=1)
+        for item in self.items:
+            self.assertContains(response, f'hx-swap-oob="beforebegin:#item-{item.id}-actions"', count=1)
+            self.assertContains(response, reverse('update_status', args=[item.id, column.id]))
+
+    def test_add_column_queries_do_not_grow_with_items(self):
+        *_, before = self._add_column()
+        for i in range(20):
+            Item.objects.create(group=self.groups[0], name=f'More {i}', position=10 + i, created_by=self.user)
+        *_, after = self._add_column()
+        self.assertEqual(before, after)
+
+    def test_rows_and_headers_carry_swap_anchors(self):
+        page = b''.join(self.client.get(reverse('board_detail', args=[self.board.id])).streaming_content).decode()
+        self.assertEqual(page.count('class="column-add-anchor'), 2)
+        self.assertEqual(page.count('class="column-footer-anchor"'), 2)
+        self.assertIn(f'id="item-{self.items[0].id}-actions"', page)
+        self.assertIn(f'id="group-{self.groups[0].id}"', page)
+
+    def test_add_group_returns_the_group_section(self):
+        response = self.client.post(reverse('add_group', args=[self.board.id]), {'title': 'Later'}, **HTMX)
+        group = Group.objects.get(board=self.board, title='Later')
+        self.assertEqual(group.position, 2)
+        self.assertContains(response, f'id="group-{group.id}"')
+        self.assertContains(response, f'id="group-{group.id}-items"')
+        self.assertNotContains(response, 'board-empty-state')
+
+    def test_first_group_removes_empty_state(self):
+        Group.objects.filter(board=self.board).delete()
+        response = self.client.post(reverse('add_group', args=[self.board.id]), {'title': 'First'}, **HTMX)
+        self.assertContains(response, 'id="board-empty-state" hx-swap-oob="delete"')
+
+    def test_delete_item_updates_group_count(self):
+        response = self.client.post(reverse('delete_item', args=[self.board.id, self.items[0].id]), **HTMX)
+        self.assertContains(response, f'id="group-{self.groups[0].id}-count" hx-swap-oob="true"')
+        self.assertContains(response, '2 items')
+
+    def test_cell_edit_row_keeps_the_actions_anchor(self):
+        item = self.items[0]
+        status = self.board.columns.get(type='status')
+        response = self.client.post(reverse('update_status', args=[item.id, status.id]),
+                                    {'action_value': 'Done'}, **HTMX)
+        self.assertContains(response, f'id="item-{item.id}-actions"')
+        self.assertNotContains(response, 'animation-delay')
+
+    def test_delete_group_restores_empty_state_after_the_last_group(self):
+        response = self.client.post(reverse('delete_group', args=[self.board.id, self.groups[0].id]), **HTMX)
+        self.assertNotContains(response, 'board-empty-state')
+
+        response = self.client.post(reverse('delete_group', args=[self.board.id, self.groups[1].id]), **HTMX)
+        self.assertContains(response, 'hx-swap-oob="beforebegin:#add-group"')
+        self.assertContains(response, 'id="board-empty-state"')
+
+    def test_plain_posts_still_redirect(self):
+        board_url = reverse('board_detail', args=[self.board.id])
+        self.assertRedirects(self.client.post(reverse('add_column', args=[self.board.id]), {'type': 'text'}),
+                             board_url, fetch_redirect_response=False)
+        self.assertRedirects(self.client.post(reverse('add_group', args=[self.board.id]), {'title': 'X'}),
+                             board_url, fetch_redirect_response=False)
@@ -0,0 +1,84 @@
+from django.test import TestCase
+from django.urls import reverse
+
+from .models import Item, Group, Board, Workspace, Column
+from .patching import patch_item_values, VersionConflict
+from automation.models import AutomationRule, AutomationLog
+from core.models import Organization, User, Membership
+
+
+class PatchItemValuesTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username='patch', email='patch@example.com', password='pw')
+        self.org = Organization.objects.create(name='Org', owner=self.user)
+        Membership.objects.create(user=self.user, organization=self.org, role='admin')
+        self.workspace = Workspace.objects.create(name='WS', organization=self.org)
+        self.board = Board.objects.create(name='Patch', workspace=self.workspace, created_by=self.user)
+        self.group = Group.objects.create(board=self.board, title='G')
+        self.status = Column.objects.create(board=self.board, title='Status', type='status',
+                                            settings={'choices': ['Todo', 'Done']})
+        self.notes = Column.objects.create(board=self.board, title='Notes', type='text')
+        self.item = Item.objects.create(group=self.group, name='Task', values={'keep': 'me'})
+
+    def test_concurrent_edits_to_different_keys_are_kept(self):
+        first = Item.objects.get(pk=self.item.pk)
+        second = Item.objects.get(pk=self.item.pk)
+
+        patch_item_values(first, {self.status.id: 'Done'})
+        patch_item_values(second, {self.notes.id: 'hello'})
+
+        self.item.refresh_from_db()
+        self.assertEqual(self.item.values, {'keep': 'me', str(self.status.id): 'Done', str(self.notes.id): 'hello'})
+
+    def test_version_is_read_back_after_a_concurrent_edit(self):
+        first = Item.objects.get(pk=self.item.pk)
+        second = Item.objects.get(pk=self.item.pk)
+
+        patch_item_values(first, {self.status.id: 'Done'})
+        patch_item_values(second, {self.notes.id: 'hello'})
+
+        self.item.refresh_from_db()
+        self.assertEqual(second.version, self.item.version)
+        self.assertEqual(first.version, self.item.version - 1)
+
+    def test_deleted_item(self):
+        stale = Item.objects.get(pk=self.item.pk)
+        Item.objects.filter(pk=self.item.pk).delete()
+        with self.assertRaises(Item.DoesNotExist):
+            patch_item_values(stale, {'a': 1})
+        with self.assertRaises(VersionConflict):
+            patch_item_values(stale, {'a': 1}, expected_version=stale.version)
+
+    def test_nested_values_are_stored_as_json(self):
+        patch_item_values(self.item, {'timeline': {'start': '2025-01-01', 'end': '2025-01-02'}})
+        self.item.refresh_from_db()
+        self.assertEqual(self.item.values['timeline'], {'start': '2025-01-01', 'end': '2025-01-02'})
+
+    def test_stale_version_is_rejected(self):
+        self.item.refresh_from_db()
+        version = self.item.version
+        patch_item_values(self.item, {'a': 1}, expected_version=version)
+
+        stale = Item.objects.get(pk=self.item.pk)
+        with self.assertRaises(VersionConflict):
+            patch_item_values(stale, {'b': 2}, expected_version=version)
+        self.item.refresh_from_db()
+        self.assertNotIn('b', self.item.values)
+
+    def test_update_status_view_patches_and_fires_automations(self):
+        rule = AutomationRule.objects.create(
+            board=self.board, name='Done', trigger_type='status_change',
+            trigger_config={'column_id': self.status.id, 'value': 'Done'},
+            action_type='create_update', action_config={'message': 'Finished'},
+        )
+        self.client.force_login(self.user)
+
+        response = self.client.post(
+            reverse('update_status', args=[self.item.id, self.status.id]), {'action_value': 'Done'}
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.item.refresh_from_db()
+        self.assertEqual(self.item.values[str(self.status.id)], 'Done')
+        self.assertEqual(self.item.values['keep'], 'me')
+        self.assertTrue(AutomationLog.objects.filter(rule=rule, status='success').exists())
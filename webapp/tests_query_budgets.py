@@ -0,0 +1,104 @@
+from datetime import date
+
+from django.conf import settings
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from .models import Item, ItemUpdate, Group, Board, Workspace, Column
+from automation.models import AutomationRule
+from core import stats
+from core.models import Organization, User, Membership, Notification
+from core.testing import QueryBudgetMixin
+
+
+class QueryBudgetTest(QueryBudgetMixin, TestCase):
+    """
+    Budgets are declared in settings.QUERY_BUDGETS and must hold regardless of how many
+    rows the page shows (the fixture has enough items/columns for an N+1 to blow them).
+    """
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='budget', email='budget@example.com', password='pw')
+        self.org = Organization.objects.create(name='Org', owner=self.user)
+        Membership.objects.create(user=self.user, organization=self.org, role='admin')
+        for i in range(3):
+            colleague = User.objects.create_user(username=f'colleague{i}', email=f'c{i}@example.com', password='pw')
+            Membership.objects.create(user=colleague, organization=self.org, role='member')
+        self.workspace = Workspace.objects.create(name='WS', organization=self.org)
+        self.board = Board.objects.create(name='Budget', workspace=self.workspace, created_by=self.user)
+        self.status = Column.objects.create(board=self.board, title='Status', type='status', position=0,
+                                            settings={'choices': ['Todo', 'Done']})
+        self.owner = Column.objects.create(board=self.board, title='Owner', type='person', position=1)
+        self.due = Column.objects.create(board=self.board, title='Due', type='date', position=2)
+        Column.objects.create(board=self.board, title='Notes', type='text', position=3)
+        today = date.today().isoformat()
+        for g in range(3):
+            group = Group.objects.create(board=self.board, title=f'Group {g}', position=g)
+            for i in range(8):
+                item = Item.objects.create(
+                    group=group, name=f'Task {g}-{i}', position=i, created_by=self.user,
+                    values={str(self.status.id): 'Todo', str(self.owner.id): 'budget', str(self.due.id): today},
+                )
+        self.item = item
+        for i in range(5):
+            ItemUpdate.objects.create(item=self.item, user=self.user, body=f'Update {i}')
+            Notification.objects.create(user=self.user, title=f'N{i}', message='...')
+        self.client.force_login(self.user)
+        # Buffered daily stats are written every DAILY_FLUSH_INTERVAL seconds, not per request
+        stats.flush_daily()
+
+    def test_board_views(self):
+        self.assertQueryBudget('board_detail', self.board.id)
+        self.assertQueryBudget('board_kanban', self.board.id)
+        self.assertQueryBudget('board_calendar', self.board.id)
+
+    def test_my_work(self):
+        response = self.assertQueryBudget('my_work')
+        self.assertEqual(len(response.context['buckets']['Today']), 24)
+
+    def test_item_edits(self):
+        self.assertQueryBudget('update_status', self.item.id, self.status.id, method='post',
+                               data={'action_value': 'Done'})
+        self.assertQueryBudget('add_item', self.item.group_id, method='post', data={'name': 'New'})
+
+    def test_board_views_as_a_member(self):
+        # Anyone but the board's creator costs check_board_access a membership lookup
+        self.client.force_login(User.objects.get(username='colleague0'))
+        self.assertQueryBudget('board_kanban', self.board.id)
+        self.assertQueryBudget('board_calendar', self.board.id)
+
+    def test_status_change_that_fires_a_rule(self):
+        AutomationRule.objects.create(
+            board=self.board, name='Done', trigger_type='status_change',
+            trigger_config={'column_id': self.status.id, 'value': 'Done'},
+            action_type='create_update', action_config={'message': 'Finished'},
+        )
+        self.assertQueryBudget('update_status', self.item.id, self.status.id, method='post',
+                               data={'action_value': 'Done'})
+        self.assertTrue(self.item.updates.filter(body__contains='Finished').exists())
+
+    def test_side_panel_search_and_notifications(self):
+        self.assertQueryBudget('get_item_details', self.item.id)
+        self.assertQueryBudget('global_search', data={'q': 'Task'})
+        self.assertQueryBudget('notifications')
+
+
+class QueryCountMiddlewareTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username='mw', email='mw@example.com', password='pw')
+        self.client.force_login(self.user)
+
+    @override_settings(DEBUG=True)
+    def test_debug_headers(self):
+        response = self.client.get(reverse('notifications'))
+
+        self.assertGreater(int(response['X-Query-Count']), 0)
+        self.assertIn('X-Query-Time-Ms', response)
+        self.assertEqual(response['X-Query-Budget'], str(settings.QUERY_BUDGETS['notifications']))
+
+    def test_production_logs_instead_of_headers(self):
+        with self.assertLogs('core.queries', level='INFO') as logs:
+            response = self.client.get(reverse('notifications'))
+
+        self.assertNotIn('X-Query-Count', response)
+        self.assertIn('view=notifications', logs.output[0])
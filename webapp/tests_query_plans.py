@@ -0,0 +1,94 @@
+import re
+from unittest import skipUnless
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from .models import Item, ItemUpdate, Group, Board, Workspace, Column
+from automation.models import AutomationRule, AutomationLog
+from core.models import Organization, User, Membership, Notification
+
+# Tables that grow with tenant data; a full scan of any of them on a hot path is a bug.
+HOT_TABLES = {
+    'webapp_item', 'webapp_group', 'webapp_column', 'webapp_itemupdate',
+    'automation_automationrule', 'automation_automationlog', 'core_notification',
+}
+FULL_SCAN = re.compile(r'^SCAN (\w+)(?: AS \w+)?$')
+
+
+@skipUnless(connection.vendor == 'sqlite', 'EXPLAIN QUERY PLAN output is SQLite specific')
+class HotQueryPlanTest(TestCase):
+    """
+    Runs EXPLAIN QUERY PLAN on every query issued by the hot views and fails if any
+    of them scans a tenant table instead of searching an index.
+    """
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='plans', email='plans@example.com', password='pw')
+        self.org = Organization.objects.create(name='Org', owner=self.user)
+        Membership.objects.create(user=self.user, organization=self.org, role='admin')
+        self.workspace = Workspace.objects.create(name='WS', organization=self.org)
+        self.board = Board.objects.create(name='Plans', workspace=self.workspace, created_by=self.user)
+        self.group = Group.objects.create(board=self.board, title='Todo', position=0)
+        self.status = Column.objects.create(board=self.board, title='Status', type='status',
+                                            settings={'choices': ['Todo', 'Done']})
+        Column.objects.create(board=self.board, title='Due', type='date', position=1)
+        self.item = Item.objects.create(group=self.group, name='Task', position=1)
+        ItemUpdate.objects.create(item=self.item, user=self.user, body='Hello')
+        rule = AutomationRule.objects.create(
+            board=self.board, name='Done', trigger_type='status_change',
+            trigger_config={'column_id': self.status.id, 'value': 'Done'},
+            action_type='send_notification', action_config={},
+        )
+        AutomationLog.objects.create(rule=rule, status='success')
+        Notification.objects.create(user=self.user, title='Hi', message='There')
+        self.client.force_login(self.user)
+
+    def _full_scans(self, sql):
+        with connection.cursor() as cursor:
+            cursor.execute('EXPLAIN QUERY PLAN ' + sql)
+            details = [row[-1] for row in cursor.fetchall()]
+        scans = []
+        for detail in details:
+            match = FULL_SCAN.match(detail)
+            if match and match.group(1) in HOT_TABLES:
+                scans.append(detail)
+        return scans
+
+    def assertNoFullScans(self, url):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200, url)
+
+        problems = []
+        for query in ctx.captured_queries:
+            sql = query['sql']
+            if not sql.lstrip().upper().startswith('SELECT'):
+                continue
+            scans = self._full_scans(sql)
+            if scans:
+                problems.append(f"{', '.join(scans)}\n    {sql}")
+        self.assertFalse(problems, f"Full table scans in {url}:\n" + '\n'.join(problems))
+
+    def test_board_views(self):
+        self.assertNoFullScans(reverse('board_detail', args=[self.board.id]))
+        self.assertNoFullScans(reverse('board_kanban', args=[self.board.id]))
+        self.assertNoFullScans(reverse('board_calendar', args=[self.board.id]))
+        self.assertNoFullScans(reverse('board_gantt_data', args=[self.board.id]))
+
+    def test_item_side_panel(self):
+        self.assertNoFullScans(reverse('get_item_details', args=[self.item.id]))
+
+    def test_notifications_and_automation_history(self):
+        self.assertNoFullScans(reverse('notifications'))
+        self.assertNoFullScans(reverse('run_history', args=[self.board.id]))
+
+    def test_automation_rule_lookup(self):
+        queryset = AutomationRule.objects.filter(board=self.board, trigger_type='status_change', is_active=True)
+        sql, params = queryset.query.sql_with_params()
+        with connection.cursor() as cursor:
+            cursor.execute('EXPLAIN QUERY PLAN ' + sql, params)
+            details = [row[-1] for row in cursor.fetchall()]
+        self.assertTrue(any('rule_board_trigger_idx' in d for d in details), details)
@@ -0,0 +1,112 @@
+from django.core.cache import cache
+from django.test import TestCase
+from django.test.signals import template_rendered
+from django.urls import reverse
+
+from core.models import Membership, Organization, User
+from .cells import build_cells, column_specs
+from .models import Board, Column, Group, Item, Workspace
+from .rows import ROW_TEMPLATE, render_rows
+
+
+class RowCacheTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username='rows', email='rows@example.com', password='pw')
+        org = Organization.objects.create(name='Org', owner=self.user)
+        Membership.objects.create(user=self.user, organization=org, role='admin')
+        workspace = Workspace.objects.create(name='WS', organization=org)
+        self.board = Board.objects.create(name='Rows', workspace=workspace, created_by=self.user)
+        self.status = Column.objects.create(board=self.board, title='Status', type='status', position=0)
+        group = Group.objects.create(board=self.board, title='G', position=0)
+        self.items = [
+            Item.objects.create(group=group, name=f'Task {i}', position=i, created_by=self.user)
+            for i in range(20)
+        ]
+        self.client.force_login(self.user)
+
+    def _render(self):
+        rendered = []
+
+        def on_render(sender, template, context, **kwargs):
+            if template.name == ROW_TEMPLATE:
+                rendered.append(context['item'].id)
+
+        template_rendered.connect(on_render)
+        try:
+            response = self.client.get(reverse('board_detail', args=[self.board.id]))
+            self.assertEqual(response.status_code, 200)
+            # Groups are rendered while the streamed page is consumed
+            page = b''.join(response.streaming_content).decode()
+        finally:
+            template_rendered.disconnect(on_render)
+        return page, rendered
+
+    def test_only_changed_rows_are_rendered_again(self):
+        _, rendered = self._render()
+        self.assertEqual(len(rendered), 20)
+
+        self.items[3].values = {str(self.status.id): 'Done'}
+        self.items[3].save()
+        page, rendered = self._render()
+
+        self.assertEqual(rendered, [self.items[3].id])
+        self.assertIn(f'id="item-{self.items[3].id}" data-version="{self.items[3].version}"', page)
+        self.assertEqual(page.count('<tr id="item-'), 20)
+
+    def test_schema_change_invalidates_rows(self):
+        self._render()
+        self.status.title = 'State'
+        self.status.save()
+
+        _, rendered = self._render()
+        self.assertEqual(len(rendered), 20)
+
+    def test_moved_rows_point_at_their_new_board(self):
+        other = Board.objects.create(name='Other', workspace=self.board.workspace, created_by=self.user)
+        item = self.items[0]
+
+        def render():
+            row = Item.objects.select_related('group', 'created_by').get(pk=item.pk)
+            return render_rows([row], [], [])[str(item.id)]
+
+        self.assertIn(reverse('delete_item', args=[self.board.id, item.id]), render())
+        group = item.group
+        group.board = other
+        group.save()
+        self.assertIn(reverse('delete_item', args=[other.id, item.id]), render())
+
+
+class CellTest(TestCase):
+    def setUp(self):
+        user = User.objects.create_user(username='cells', email='cells@example.com', password='pw')
+        org = Organization.objects.create(name='Org', owner=user)
+        workspace = Workspace.objects.create(name='WS', organization=org)
+        board = Board.objects.create(name='Cells', workspace=workspace, created_by=user)
+        self.columns = [
+            Column.objects.create(board=board, title='Status', type='status', position=0,
+                                  settings={'choices': ['Open', 'Closed']}),
+            Column.objects.create(board=board, title='Owner', type='person', position=1),
+            Column.objects.create(board=board, title='Done', type='checkbox', position=2),
+            Column.objects.create(board=board, title='Total', type='formula', position=3),
+        ]
+        group = Group.objects.create(board=board, title='G', position=0)
+        status, person, checkbox, formula = (str(c.id) for c in self.columns)
+        self.item = Item.objects.create(group=group, name='Task', position=0, created_by=user, values={
+            status: 'Open', person: 'alice', checkbox: 'true', formula: '=1+1', f'{formula}_result': 2,
+        })
+
+    def test_cells_are_resolved_in_column_order(self):
+        specs = column_specs(self.columns)
+        with self.assertNumQueries(0):
+            cells = build_cells(self.item, specs)
+
+        self.assertEqual([cell.column.id for cell in cells], [c.id for c in self.columns])
+        status, person, checkbox, formula = cells
+        self.assertEqual(status.value, 'Open')
+        self.assertEqual(status.column.choices, ['Open', 'Closed'])
+        self.assertEqual(status.update_url, reverse('update_status', args=[self.item.id, self.columns[0].id]))
+        self.assertEqual(person.display, 'AL')
+        self.assertTrue(checkbox.checked)
+        self.assertEqual(formula.result, 2)
+        self.assertFalse(hasattr(status, '__dict__'))
@@ -0,0 +1,48 @@
+from django.test import TestCase
+from django.urls import reverse
+
+from .models import Item, Group, Board, Workspace
+from core.models import Organization, User, Membership
+
+
+class ItemScopeTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username='scope', email='scope@example.com', password='pw')
+        self.org = Organization.objects.create(name='Org', owner=self.user)
+        Membership.objects.create(user=self.user, organization=self.org, role='admin')
+        self.workspace = Workspace.objects.create(name='WS', organization=self.org)
+        self.board = Board.objects.create(name='Main', workspace=self.workspace, created_by=self.user)
+        self.group = Group.objects.create(board=self.board, title='Todo', position=0)
+
+    def test_create_fills_board_and_organization(self):
+        item = Item.objects.create(group=self.group, name='Task')
+
+        self.assertEqual(item.board_id, self.board.id)
+        self.assertEqual(item.organization_id, self.org.id)
+
+    def test_moving_item_or_group_to_another_board_follows(self):
+        other = Board.objects.create(name='Other', workspace=self.workspace, created_by=self.user)
+        other_group = Group.objects.create(board=other, title='Elsewhere', position=0)
+        item = Item.objects.create(group=self.group, name='Task')
+
+        item = Item.objects.get(pk=item.pk)
+        item.group = other_group
+        item.save(update_fields=['group'])
+        self.assertEqual(Item.objects.get(pk=item.pk).board_id, other.id)
+
+        other_group.board = self.board
+        other_group.save()
+        self.assertEqual(Item.objects.get(pk=item.pk).board_id, self.board.id)
+
+    def test_global_search_is_limited_to_own_organizations(self):
+        stranger = User.objects.create_user(username='stranger', email='s@example.com', password='pw')
+        other_org = Organization.objects.create(name='Other', owner=stranger)
+        other_ws = Workspace.objects.create(name='WS2', organization=other_org)
+        other_board = Board.objects.create(name='Secret', workspace=other_ws, created_by=stranger)
+        Item.objects.create(group=Group.objects.create(board=other_board, title='G'), name='Launch plan B')
+        Item.objects.create(group=self.group, name='Launch plan A')
+
+        self.client.force_login(self.user)
+        response = self.client.get(reverse('global_search'), {'q': 'Launch'})
+
+        self.assertEqual([i.name for i in response.context['results']['items']], ['Launch plan A'])
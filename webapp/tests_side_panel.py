@@ -0,0 +1,131 @@
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from core.models import Membership, Organization, User
+from .models import Board, Group, Item, ItemUpdate, Workspace
+from .updates import PAGE_SIZE, page
+
+
+class SidePanelTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username='panel', email='panel@example.com', password='pw')
+        self.org = Organization.objects.create(name='Org', owner=self.user)
+        Membership.objects.create(user=self.user, organization=self.org, role='admin')
+        workspace = Workspace.objects.create(name='WS', organization=self.org)
+        self.board = Board.objects.create(name='Panel', workspace=workspace, created_by=self.user)
+        group = Group.objects.create(board=self.board, title='G', position=0)
+        self.item = Item.objects.create(group=group, name='Task', position=0, created_by=self.user)
+        self.client.force_login(self.user)
+
+    def _member(self, username):
+        user = User.objects.create_user(username=username, email=f'{username}@example.com', password='pw')
+        Membership.objects.create(user=user, organization=self.org, role='member')
+        return user
+
+    def _updates(self, count):
+        return [ItemUpdate.objects.create(item=self.item, user=self.user, body=f'Update {i}') for i in range(count)]
+
+    def test_panel_pages_newest_first_through_ties(self):
+        updates = self._updates(PAGE_SIZE + 5)
+        # Equal timestamps fall back to id order
+        ItemUpdate.objects.filter(pk__in=[u.pk for u in updates[:10]]).update(created_at=updates[0].created_at)
+
+        first, next_before = page(self.item, self.user)
+        self.assertEqual([u.pk for u in first], [u.pk for u in reversed(updates)][:PAGE_SIZE])
+        rest, last = page(self.item, self.user, before=next_before)
+        self.assertEqual([u.pk for u in rest], [u.pk for u in reversed(updates[:5])])
+        self.assertIsNone(last)
+
+        response = self.client.get(reverse('get_item_details', args=[self.item.id]))
+        self.assertEqual(response.content.decode().count('id="update-'), PAGE_SIZE)
+        self.assertContains(response, f'{reverse("item_updates", args=[self.item.id])}?before={next_before}')
+
+        response = self.client.get(reverse('item_updates', args=[self.item.id]), {'before': next_before})
+        self.assertEqual(response.content.decode().count('id="update-'), 5)
+        self.assertNotContains(response, 'Load older updates')
+
+    def test_unknown_or_invalid_anchor(self):
+        self._updates(3)
+        url = reverse('item_updates', args=[self.item.id])
+        self.assertEqual(self.client.get(url, {'before': 'x'}).status_code, 400)
+        self.assertNotContains(self.client.get(url, {'before': 999999}), 'id="update-')
+
+    def test_like_counts_follow_both_sides_of_the_relation(self):
+        update, other_update = self._updates(2)
+        alice, bob = self._member('alice'), self._member('bob')
+
+        response = self.client.post(reverse('toggle_update_like', args=[update.id]))
+        self.assertContains(response, 'aria-pressed="true"')
+        self.assertContains(response, 'Like · 1')
+
+        alice.liked_updates.add(update, other_update)
+        bob.liked_updates.add(update)
+        update.refresh_from_db()
+        self.assertEqual(update.like_count, 3)
+
+        alice.liked_updates.clear()
+        update.refresh_from_db()
+        other_update.refresh_from_db()
+        self.assertEqual((update.like_count, other_update.like_count), (2, 0))
+
+        response = self.client.post(reverse('toggle_update_like', args=[update.id]))
+        self.assertContains(response, 'aria-pressed="false"')
+        self.assertContains(response, 'Like · 1')
+
+        update.liked_by.clear()
+        update.refresh_from_db()
+        self.assertEqual(update.like_count, 0)
+
+    def test_liked_by_me_is_per_viewer(self):
+        update = self._updates(1)[0]
+        alice = self._member('alice')
+        update.liked_by.add(alice)
+
+        (mine,), _ = page(self.item, self.user)
+        (hers,), _ = page(self.item, alice)
+        self.assertEqual((mine.like_count, mine.liked_by_me), (1, False))
+        self.assertEqual((hers.like_count, hers.liked_by_me), (1, True))
+
+    def test_panel_queries_do_not_grow_with_updates_or_likes(self):
+        url = reverse('get_item_details', args=[self.item.id])
+        likers = [self._member(f'liker{i}') for i in range(3)]
+
+        def count_queries():
+            with CaptureQueriesContext(connection) as ctx:
+                self.assertEqual(self.client.get(url).status_code, 200)
+            return len(ctx.captured_queries)
+
+        for update in self._updates(2):
+            update.liked_by.add(*likers)
+        few = count_queries()
+        for update in self._updates(PAGE_SIZE * 2):
+            update.liked_by.add(*likers)
+        self.assertEqual(count_queries(), few)
+
+    def test_likes_invalidate_the_panel_etag(self):
+        update = self._updates(1)[0]
+        url = reverse('get_item_details', args=[self.item.id])
+        self.client.get(url)
+        etag = self.client.get(url)['ETag']
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+        update.liked_by.add(self._member('alice'))
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        etag = response['ETag']
+
+        # Swapping one like for another keeps the count but not the viewer's own state
+        update.liked_by.clear()
+        update.liked_by.add(self.user)
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_outsiders_cannot_like_or_page(self):
+        update = self._updates(1)[0]
+        outsider = User.objects.create_user(username='out', email='out@example.com', password='pw')
+        self.client.force_login(outsider)
+        self.assertEqual(self.client.post(reverse('toggle_update_like', args=[update.id])).status_code, 403)
+        response = self.client.get(reverse('item_updates', args=[self.item.id]), {'before': update.id})
+        self.assertEqual(response.status_code, 403)
+        self.assertEqual(update.liked_by.count(), 0)
@@ -0,0 +1,76 @@
+"""
+The item side panel's update feed.
+
+Updates are shown newest first, PAGE_SIZE at a time; older pages are keyset paginated on
+(created_at, id) with ?before=<update id>, which walks itemupdate_item_created_idx
+however far back the reader scrolls. Each page is one query: authors come with
+select_related and whether the viewer liked an update is an EXISTS annotation.
+
+Like counts are denormalized onto ItemUpdate.like_count. The m2m_changed receiver below
+recounts the affected updates whenever liked_by changes (from either side of the
+relation), so the count never drifts from the join table.
+"""
+from django.db.models import Count, Exists, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
+from django.db.models.signals import m2m_changed
+from django.dispatch import receiver
+
+from .models import ItemUpdate
+
+PAGE_SIZE = 20
+
+Like = ItemUpdate.liked_by.through
+
+
+def refresh_like_counts(update_ids):
+    counts = (
+        Like.objects.filter(itemupdate_id=OuterRef('pk'))
+        .order_by().values('itemupdate_id').annotate(n=Count('id')).values('n')
+    )
+    ItemUpdate.objects.filter(pk__in=update_ids).update(like_count=Coalesce(Subquery(counts), 0))
+
+
+def for_viewer(queryset, user):
+    """Updates with their authors and a `liked_by_me` flag for `user`."""
+    return queryset.select_related('user').annotate(
+        liked_by_me=Exists(Like.objects.filter(itemupdate_id=OuterRef('pk'), user_id=user.pk))
+    )
+
+
+def page(item, user, before=None, size=PAGE_SIZE):
+    """
+    (updates, next_before): up to `size` of the item's updates, newest first, older than
+    update `before` when given; next_before is the ?before= of the following page, or None.
+    """
+    queryset = item.updates.order_by('-created_at', '-id')
+    if before is not None:
+        # The anchor is read in the same query; an unknown id matches nothing
+        anchor = Subquery(item.updates.filter(pk=before).values('created_at')[:1])
+        queryset = queryset.filter(Q(created_at__lt=anchor) | Q(created_at=anchor, id__lt=before))
+    updates = list(for_viewer(queryset, user)[:size + 1])
+    if len(updates) > size:
+        updates = updates[:size]
+        return updates, updates[-1].pk
+    return updates, None
+
+
+def toggle_like(update, user):
+    """Likes or unlikes `update` for `user`; returns True when it is now liked."""
+    if update.liked_by.filter(pk=user.pk).exists():
+        update.liked_by.remove(user)
+        return False
+    update.liked_by.add(user)
+    return True
+
+
+@receiver(m2m_changed, sender=Like)
+def _likes_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    if action == 'pre_clear':
+        # Once cleared, a user no longer knows which updates they had liked
+        instance._cleared_like_ids = (
+            list(instance.liked_updates.values_list('pk', flat=True)) if reverse else [instance.pk]
+        )
+    elif action == 'post_clear':
+        refresh_like_counts(instance.__dict__.pop('_cleared_like_ids', []))
+    elif action in ('post_add', 'post_remove') and pk_set:
+        refresh_like_counts(pk_set if reverse else [instance.pk])
@@ -1,5 +1,5 @@
 from django.urls import path
-from . import views, views_dashboard
+from . import views, views_api, views_dashboard
 
 urlpatterns = [
     path('', views.dashboard, name='dashboard'),
@@ -11,17 +11,33 @@ urlpatterns = [
     path('group/<int:group_id>/add_item/', views.add_item, name='add_item'),
     path('item/<int:item_id>/update/<int:col_id>/', views.update_status, name='update_status'),
     path('board/<int:board_id>/kanban/', views.kanban_view, name='board_kanban'),
+    path('board/<int:board_id>/export/', views.export_board, name='export_board'),
+    path('board/<int:board_id>/export/<slug:token>/', views.download_export, name='download_export'),
+    path('board/<int:board_id>/import/', views.import_items, name='import_items'),
     path('board/<int:board_id>/calendar/', views.calendar_view, name='board_calendar'),
     path('board/<int:board_id>/gantt/', views.gantt_view, name='board_gantt'),
+    path('api/board/<int:board_id>/gantt/', views.gantt_data, name='board_gantt_data'),
     path('search/', views.global_search, name='global_search'),
     path('api/update-order/', views.update_item_order, name='update_item_order'),
+    path('api/board/<int:board_id>/items/bulk/', views.bulk_items, name='bulk_items'),
     path('item/<int:item_id>/details/', views.get_item_details, name='get_item_details'),
     path('item/<int:item_id>/update/post/', views.post_item_update, name='post_item_update'),
+    path('item/<int:item_id>/updates/', views.item_updates, name='item_updates'),
+    path('update/<int:update_id>/like/', views.toggle_update_like, name='toggle_update_like'),
     path('board/<int:board_id>/add_column/', views.add_column, name='add_column'),
     path('board/<int:board_id>/add_group/', views.add_group, name='add_group'),
     path('board/<int:board_id>/group/<int:group_id>/delete/', views.delete_group, name='delete_group'),
     path('board/group/update_title/', views.update_group_title, name='update_group_title'),
     path('board/<int:board_id>/item/<int:item_id>/delete/', views.delete_item, name='delete_item'),
+    path('board/<int:board_id>/item/<int:item_id>/row/', views.item_row, name='item_row'),
+    path('api/board/<int:board_id>/changes/', views.board_changes, name='board_changes'),
+    path('board/<int:board_id>/changes/stream/', views.board_changes_stream, name='board_changes_stream'),
+
+    # Read API (webapp.api)
+    path('api/v1/boards/<int:board_id>/', views_api.board_api, name='api_board'),
+    path('api/v1/boards/<int:board_id>/groups/', views_api.groups_api, name='api_board_groups'),
+    path('api/v1/boards/<int:board_id>/items/', views_api.items_api, name='api_board_items'),
+    path('api/v1/items/<int:item_id>/updates/', views_api.item_updates_api, name='api_item_updates'),
     
     # User Dashboards
     path('dashboards/', views_dashboard.dashboard_list, name='user_dashboard_list'),
@@ -1,8 +1,10 @@
 from django.shortcuts import render, get_object_or_404, redirect
-from django.http import JsonResponse, HttpResponse
-from django.views.decorators.http import require_POST
+from django.http import JsonResponse, HttpResponse, StreamingHttpResponse
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import condition, require_POST
 from django.contrib.auth.decorators import login_required
 from .models import Workspace, Board, Group, Item, Column
+from . import loaders
 
 def get_status_options(column):
     """
@@ -14,6 +16,57 @@ def get_status_options(column):
     # Default status options if not configured in column
     return ['Not Started', 'In Progress', 'Done', 'On Hold']
 
+def _etag(request, *parts):
+    """
+    Per-user validator for conditional GETs. Mixes in the CSRF cookie so a cached page
+    never outlives the token its forms carry, and salts the hash so it reveals nothing.
+    """
+    from django.utils.crypto import salted_hmac
+    if parts[-1] is None:
+        return None  # Missing object: let the view answer 404
+    value = ':'.join(str(p) for p in (request.user.pk, request.COOKIES.get('csrftoken', '')) + parts)
+    return salted_hmac('webapp.views.etag', value).hexdigest()[:24]
+
+
+def board_etag(request, board_id):
+    """
+    Board pages change when Board.version does or when the organization's member list
+    (the person pickers) does. The same query checks access the way check_board_access
+    does: viewers without it get no validator, so the view runs and answers 403, not 304.
+    """
+    from django.db.models import Count, Exists, Max, OuterRef, Subquery
+    from core.models import Membership
+    members = Membership.objects.filter(organization_id=OuterRef('workspace__organization_id')).order_by()
+    row = Board.objects.filter(pk=board_id).values_list('version', 'created_by_id').annotate(
+        member_count=Subquery(members.values('organization_id').annotate(n=Count('id')).values('n')),
+        last_member=Subquery(members.values('organization_id').annotate(n=Max('id')).values('n')),
+        is_member=Exists(members.filter(user_id=request.user.pk)),
+    ).first()
+    if row is None:
+        return _etag(request, 'board', board_id, None)
+    version, creator_id, member_count, last_member, is_member = row
+    if not (request.user.is_superuser or creator_id == request.user.pk or is_member):
+        return None
+    return _etag(request, 'board', board_id, f"{version}-{member_count}-{last_member}")
+
+
+def item_details_etag(request, item_id):
+    """
+    The side panel shows the item, its group colour (board version), its updates, their
+    like counts and which of them the viewer liked.
+    """
+    from django.db.models import Count, Max, OuterRef, Subquery, Sum
+    from .models import ItemUpdate
+    my_likes = ItemUpdate.liked_by.through.objects.filter(
+        itemupdate__item_id=OuterRef('pk'), user_id=request.user.pk
+    ).order_by().values('user_id').annotate(n=Count('id')).values('n')
+    row = next(iter(Item.objects.filter(pk=item_id).values_list('version', 'board__version').annotate(
+        last_update=Max('updates__id'), likes=Sum('updates__like_count'), updates=Count('updates'),
+        my_likes=Subquery(my_likes),
+    )), None)
+    return _etag(request, 'item', item_id, row and '-'.join(str(v) for v in row))
+
+
 # For simplicity in this demo, we might skip @login_required decorators 
 # if we want to test easily without auth, but for production code we add them.
 @login_required 
@@ -32,7 +85,9 @@ def dashboard(request):
     
     return render(request, 'webapp/dashboard.html', {'workspaces': workspaces})
 
-@login_required 
+@login_required
+@cache_control(private=True, no_cache=True)
+@condition(etag_func=board_etag)
 def board_detail(request, board_id):
     """
     Renders the board detail view with its groups and items.
@@ -102,7 +157,7 @@ def board_detail(request, board_id):
         # If we have JSON field filters (person or column values), filter in Python
         if filter_person or filter_kwargs:
             filtered_item_ids = []
-            for item in items_queryset.filter(group__board_id=board_id):
+            for item in items_queryset.filter(board_id=board_id):
                 include = True
                 
                 # Check person filter
@@ -141,12 +196,47 @@ def board_detail(request, board_id):
 
     context['columns'] = board.columns.all()
     
-    # Get Organization Users for "Person" column
-    # Assuming board -> workspace -> organization
-    org = board.workspace.organization
-    context['users'] = org.memberships.select_related('user').all()
-    
-    return render(request, 'webapp/board_detail.html', context)
+    # Get Organization Users for "Person" column (shared with the access check)
+    context['users'] = loaders.memberships().load(board.workspace.organization_id)
+
+    response = StreamingHttpResponse(_board_page_chunks(request, context), content_type='text/html; charset=utf-8')
+    response['X-Accel-Buffering'] = 'no'  # Let proxies pass groups through as they render
+    return response
+
+
+def _board_page_chunks(request, context):
+    """
+    Streams the board page group by group: the page shell is rendered up front (so CSRF
+    and template errors surface before any byte is sent), then each group is rendered
+    and sent on its own, with its rows from the fragment cache. Only one group's HTML
+    is held in memory at a time. All database queries run before the first chunk, so
+    they are still counted by QueryCountMiddleware.
+    """
+    from django.middleware.csrf import get_token
+    from django.template.loader import get_template, render_to_string
+    from django.utils.safestring import mark_safe
+    from .rows import render_rows
+
+    marker = '<!--board-groups-->'
+    page = render_to_string('webapp/board_detail.html', dict(context, board_groups=mark_safe(marker)), request)
+    head, tail = page.split(marker, 1)
+
+    group_template = get_template('webapp/partials/board_group.html')
+    board = context['board']
+    columns = list(context['columns'])
+    users = list(context['users'])
+    groups = list(board.groups.all())
+    # Plain context: running the context processors again for every group would cost queries
+    shared = {'board': board, 'columns': columns, 'csrf_token': get_token(request)}
+
+    def chunks():
+        yield head
+        for index, group in enumerate(groups):
+            rows = render_rows(list(group.items.all()), columns, users)
+            yield group_template.render(dict(shared, group=group, group_index=index, rows=rows))
+        yield tail
+
+    return chunks()
 
 def check_board_access(user, board):
     """
@@ -161,12 +251,12 @@ def check_board_access(user, board):
     #     return True
         
     # Allow board creator
-    if board.created_by == user:
+    if board.created_by_id == user.id:
         return True
         
-    if board.workspace.organization.memberships.filter(user=user).exists():
-        return True
-    return False
+    # The organization's memberships are batched per request (person pickers reuse them)
+    memberships = loaders.memberships().load(board.workspace.organization_id)
+    return any(m.user_id == user.id for m in memberships)
 
 
 @require_POST
@@ -174,9 +264,10 @@ def add_item(request, group_id):
     """
     HTMX: Adds an item to a group and returns the row HTML.
     """
-    group = get_object_or_404(Group, id=group_id)
+    group = get_object_or_404(Group.objects.select_related('board__workspace__organization'), id=group_id)
+    users = loaders.memberships().load(group.board.workspace.organization_id)
     
-    if not verify_edit_permission(request.user, group.board):
+    if not verify_edit_permission(request.user, group.board, memberships=users):
         return JsonResponse({'error': 'Permission Denied'}, status=403)
         
     name = request.POST.get('name', '').strip()
@@ -185,11 +276,13 @@ def add_item(request, group_id):
         return HttpResponseBadRequest("Name is required")
     
     # Calculate position
-    last_pos = group.items.last().position if group.items.exists() else 0
+    from django.db.models import Max
+    last_pos = group.items.aggregate(last=Max('position'))['last'] or 0
     
     # Determine defaults
+    columns = loaders.board_columns().load(group.board_id)
     default_values = {}
-    for col in group.board.columns.all():
+    for col in columns:
         if col.type == 'status':
             choices = col.settings.get('choices', [])
             if choices:
@@ -201,21 +294,23 @@ def add_item(request, group_id):
     
     item = Item.objects.create(
         group=group, 
+        board=group.board,
+        organization_id=group.board.workspace.organization_id,
         name=name, 
         position=last_pos + 1,
         created_by=request.user if request.user.is_authenticated else None,
         values=default_values
     )
     
-    columns = group.board.columns.all().order_by('position')
-    users = group.board.workspace.organization.memberships.select_related('user').all()
-    
-    return render(request, 'webapp/partials/item_row_final.html', {'item': item, 'columns': columns, 'users': users})
+    from .cells import column_specs, row_context
+    return render(request, 'webapp/partials/item_row_final.html', row_context(item, column_specs(columns), users))
 
-def verify_edit_permission(user, board):
+def verify_edit_permission(user, board, memberships=None):
     """
     Checks if user is Admin or Member (Permissions to edit).
     Viewers cannot edit.
+    Pass the organization's already-loaded `memberships`; otherwise they come from the
+    request's membership loader (webapp.loaders).
     """
     # Allow superusers
     if user.is_superuser:
@@ -226,10 +321,12 @@ def verify_edit_permission(user, board):
     #     return True
         
     # Allow board creator
-    if board.created_by == user:
+    if board.created_by_id == user.id:
         return True
 
-    membership = board.workspace.organization.memberships.filter(user=user).first()
+    if memberships is None:
+        memberships = loaders.memberships().load(board.workspace.organization_id)
+    membership = next((m for m in memberships if m.user_id == user.id), None)
     if membership and membership.role in ['admin', 'member']:
         return True
     return False
@@ -239,24 +336,34 @@ def update_status(request, item_id, col_id):
     """
     Cycles status on click. HTMX. Now 100% DYNAMIC!
     """
-    item = get_object_or_404(Item, id=item_id)
+    item = get_object_or_404(
+        Item.objects.select_related('group__board__workspace__organization', 'created_by'),
+        id=item_id
+    )
+    board = item.group.board
+    # Loaded once: used for the permission check and the person picker in the row
+    users = loaders.memberships().load(board.workspace.organization_id)
     
     # Permission Check
-    if not verify_edit_permission(request.user, item.group.board):
+    if not verify_edit_permission(request.user, board, memberships=users):
         return JsonResponse({'error': 'Permission Denied'}, status=403)
         
     # Handle Special Fields (Name)
     if col_id == 0 or str(col_id) == "0":
         field = request.POST.get('field')
         if field == 'name':
-             item.name = requested_val
-             item.save()
+             item.name = request.POST.get('action_value', item.name).strip()[:255] or item.name
+             item.save(update_fields=['name', 'updated_at'])
              # Return immediately
-             columns = item.group.board.columns.all()
-             users = item.group.board.workspace.organization.memberships.select_related('user').all()
-             return render(request, 'webapp/partials/item_row_final.html', {'item': item, 'columns': columns, 'users': users})
+             from .cells import column_specs, row_context
+             return render(request, 'webapp/partials/item_row_final.html',
+                           row_context(item, column_specs(loaders.board_columns().load(board.id)), users))
 
-    column = get_object_or_404(Column, id=col_id)
+    columns = loaders.board_columns().load(board.id)
+    column = next((c for c in columns if c.id == col_id), None)
+    if column is None:
+        from django.http import Http404
+        raise Http404("Column not found on this board.")
     
     # Get dynamic status options from column
     status_options = get_status_options(column)
@@ -266,7 +373,7 @@ def update_status(request, item_id, col_id):
     
     import json
     if requested_val:
-        if column.type in ['dependency', 'connect_boards']:
+        if column.type in ['dependency', 'connect_boards', 'timeline']:
             try:
                 new_val = json.loads(requested_val)
             except json.JSONDecodeError:
@@ -283,33 +390,39 @@ def update_status(request, item_id, col_id):
         except (ValueError, IndexError):
             new_val = status_options[0] if status_options else current_val
     
-    item.values[str(col_id)] = new_val
-    item.save()
-    
-    # --- AUTOMATION TRIGGER ---
-    # Handled by signals (automation.signals.execute_automation_actions)
-    # --------------------------
-
     # --- FORMULA CALCULATION ---
-    # When any value changes, re-evaluate all formulas on this item
+    # When any value changes, re-evaluate all formulas on this item (in memory, same write)
+    from .formula_service import FormulaEngine
+    new_values = dict(item.values)
+    new_values[str(col_id)] = new_val
     try:
-        from .formula_service import FormulaEngine
-        formula_cols = item.group.board.columns.filter(type='formula')
-        for f_col in formula_cols:
-            expression = item.values.get(str(f_col.id), "")
-            if expression and isinstance(expression, str) and expression.startswith("="):
-                 result = FormulaEngine.evaluate(expression[1:], item)
-                 item.values[str(f_col.id) + '_result'] = result
-        item.save()
+        FormulaEngine.recompute(new_values, columns)
     except Exception as e:
-         print(f"Formula Error: {e}")
-    # ---------------------------
+        print(f"Formula Error: {e}")
+    changes = {k: v for k, v in new_values.items() if k not in item.values or item.values[k] != v}
+    changes[str(col_id)] = new_val
+
+    # Single partial UPDATE of the changed keys. Clients may send 'version' for an optimistic check.
+    # Automations are triggered by webapp.signals.item_values_patched receivers.
+    from .patching import patch_item_values, VersionConflict
+    expected_version = request.POST.get('version')
+    try:
+        patch_item_values(
+            item, changes,
+            expected_version=int(expected_version) if expected_version and expected_version.isdigit() else None,
+            columns=columns,
+        )
+    except VersionConflict:
+        return JsonResponse({'error': 'This item was changed by someone else. Please reload.'}, status=409)
+    except Item.DoesNotExist:
+        return JsonResponse({'error': 'This item was deleted. Please reload.'}, status=404)
     
-    columns = item.group.board.columns.all()
-    users = item.group.board.workspace.organization.memberships.select_related('user').all()
-    return render(request, 'webapp/partials/item_row.html', {'item': item, 'columns': columns, 'users': users})
+    from .cells import column_specs, row_context
+    return render(request, 'webapp/partials/item_row_final.html', row_context(item, column_specs(columns), users))
 
 @login_required
+@cache_control(private=True, no_cache=True)
+@condition(etag_func=board_etag)
 def kanban_view(request, board_id):
     """
     Renders the Kanban board view. Now 100% DYNAMIC!
@@ -326,8 +439,8 @@ def kanban_view(request, board_id):
     if not check_board_access(request.user, board):
         raise PermissionDenied("You do not have access to this board's workspace.")
     
-    # 1. Identify the 'Status' column to group by
-    status_column = board.columns.filter(type='status').first()
+    # 1. Identify the 'Status' column to group by (from the prefetched columns)
+    status_column = min((c for c in board.columns.all() if c.type == 'status'), key=lambda c: c.id, default=None)
     
     # Default statuses if no column found (fallback)
     kanban_columns = {}
@@ -342,7 +455,7 @@ def kanban_view(request, board_id):
         # 2. Distribute Items into Buckets
         # Optimized query with select_related
         items = Item.objects.filter(
-            group__board=board
+            board=board
         ).select_related(
             'group',
             'created_by'
@@ -375,27 +488,26 @@ def update_item_order(request):
     new_group_id = data.get('newGroupId')
 
     item = get_object_or_404(Item, id=item_id)
+    board = loaders.item_board(item)
     
     # Permission Check
-    if not verify_edit_permission(request.user, item.group.board):
+    if not verify_edit_permission(request.user, board):
         return JsonResponse({'error': 'Permission Denied'}, status=403)
 
     # 1. Handle Status Change
     if new_status:
-        status_column = item.group.board.columns.filter(type='status').first()
+        status_column = next((c for c in loaders.board_columns().load(board.id) if c.type == 'status'), None)
         if status_column:
-            item.values[str(status_column.id)] = new_status
-            item.save()
+            from .patching import patch_item_values
+            patch_item_values(item, {str(status_column.id): new_status})
 
     # 2. Handle Reordering (Position / Group Change)
     if new_position is not None:
         # If group changed
         if new_group_id:
-            try:
-                new_group = Group.objects.get(id=new_group_id)
+            new_group = loaders.groups().load(int(new_group_id))
+            if new_group is not None:
                 item.group = new_group
-            except Group.DoesNotExist:
-                pass
         
         # Update position
         # In a real app, we would shift other items' positions. 
@@ -403,7 +515,8 @@ def update_item_order(request):
         # A robust way is to use a library like django-ordered-model.
         # Here we just update the specific item's position.
         item.position = int(new_position)
-        item.save()
+        # Leaves `values` alone: the status above went in as a partial update
+        item.save(update_fields=['group', 'position', 'updated_at'])
 
     return JsonResponse({'status': 'success'})
 
@@ -426,6 +539,29 @@ def gantt_view(request, board_id):
     })
 
 @login_required
+def gantt_data(request, board_id):
+    """
+    Streams Gantt rows (timeline range, dependencies, early/late dates, slack, critical flag)
+    from the schedule cached for the board's current version.
+    """
+    from django.core.exceptions import PermissionDenied
+    from .gantt import get_gantt_data, iter_gantt_json
+
+    board = get_object_or_404(
+        Board.objects.select_related('workspace', 'workspace__organization'),
+        id=board_id
+    )
+
+    if not check_board_access(request.user, board):
+        raise PermissionDenied("You do not have access to this board's workspace.")
+
+    entry = get_gantt_data(board)
+    groups = list(board.groups.values('id', 'title', 'color', 'position'))
+    return StreamingHttpResponse(iter_gantt_json(board, entry, groups), content_type='application/json')
+
+@login_required
+@cache_control(private=True, no_cache=True)
+@condition(etag_func=board_etag)
 def calendar_view(request, board_id):
     """
     Renders items on a calendar.
@@ -445,14 +581,14 @@ def calendar_view(request, board_id):
     
     import json
     
-    # 1. Find Date Column
-    date_col = board.columns.filter(type='date').first()
+    # 1. Find Date Column (from the prefetched columns)
+    date_col = min((c for c in board.columns.all() if c.type == 'date'), key=lambda c: c.id, default=None)
     
     events = []
     if date_col:
         # 2. Get all Items with that date value - optimized query
         items = Item.objects.filter(
-            group__board=board
+            board=board
         ).select_related('group').only('id', 'name', 'values', 'group__color')
         
         col_id_str = str(date_col.id)
@@ -486,10 +622,21 @@ def my_work_view(request):
     # Note: For strict "My Work", usually it's just assigned items, but we'll include created for now if no assignee logic exists fully yet.
     # To make it robust, we'll focus on items where 'Assigned To' column == user.username
     
-    person_cols = Column.objects.filter(type='person')
+    org_ids = list(request.user.memberships.values_list('organization_id', flat=True))
+    person_cols = list(Column.objects.filter(
+        type='person', board__workspace__organization_id__in=org_ids
+    ))
     candidate_items = Item.objects.filter(
-        group__board__columns__in=person_cols
-    ).select_related('group', 'group__board').distinct()
+        organization_id__in=org_ids,
+        board_id__in={col.board_id for col in person_cols},
+    ).select_related('group', 'group__board')
+    
+    # First status/date column per board, looked up once instead of per item
+    first_cols = {}
+    for col in Column.objects.filter(
+        board_id__in={col.board_id for col in person_cols}, type__in=['status', 'date']
+    ).order_by('position', 'id'):
+        first_cols.setdefault((col.board_id, col.type), col)
     
     my_items = []
     username = request.user.username
@@ -498,7 +645,7 @@ def my_work_view(request):
         # Check if user is assigned
         is_assigned = False
         for col in person_cols:
-            if item.group.board_id == col.board_id: # Optimization check
+            if item.board_id == col.board_id: # Optimization check
                 val = item.values.get(str(col.id))
                 if val == username:
                     is_assigned = True
@@ -525,14 +672,14 @@ def my_work_view(request):
         # Check Status first - if Done, maybe hide or put in "Done" bucket?
         # monday.com usually hides "Done" from standard view or puts at bottom.
         # Let's check status.
-        status_col = item.group.board.columns.filter(type='status').first()
+        status_col = first_cols.get((item.board_id, 'status'))
         status_val = item.values.get(str(status_col.id)) if status_col else None
         
         if status_val == 'Done':
             continue # specific Requirement: "Work to do"
             
         # Find Date Column
-        date_col = item.group.board.columns.filter(type='date').first()
+        date_col = first_cols.get((item.board_id, 'date'))
         if not date_col:
             buckets['No_Date'].append(item)
             continue
@@ -595,8 +742,9 @@ def global_search(request):
         
         # Search Items
         # Filter items where user has access to the board
+        org_ids = request.user.memberships.values_list('organization_id', flat=True)
         results['items'] = Item.objects.filter(
-            group__board__workspace__organization__memberships__user=request.user,
+            organization_id__in=org_ids,
             name__icontains=query
         ).select_related('group', 'group__board')[:50]
         
@@ -656,6 +804,13 @@ def create_board(request, workspace_id):
         if not name:
             messages.error(request, 'Board name is required.')
             return render(request, 'webapp/create_board.html', {'workspace': workspace})
+
+        from core.usage import check_limit, PlanLimitExceeded
+        try:
+            check_limit(workspace.organization_id, 'boards')
+        except PlanLimitExceeded as e:
+            messages.error(request, f"{e}. Upgrade your plan to create more boards.")
+            return render(request, 'webapp/create_board.html', {'workspace': workspace})
         
         # Create board
         board = Board.objects.create(
@@ -721,14 +876,56 @@ def create_board(request, workspace_id):
     return render(request, 'webapp/create_board.html', {'workspace': workspace})
 
 @login_required
+@cache_control(private=True, no_cache=True)
+@condition(etag_func=item_details_etag)
 def get_item_details(request, item_id):
     """
     Returns the Side Panel HTML for an item.
     """
-    item = get_object_or_404(Item, id=item_id)
-    updates = item.updates.all()
-    # If using HTMX to just load the content
-    return render(request, 'webapp/partials/side_panel.html', {'item': item, 'updates': updates})
+    from .updates import page
+    item = get_object_or_404(Item.objects.select_related('group'), id=item_id)
+    # Newest page only; "Load older" fetches the rest from item_updates
+    updates, next_before = page(item, request.user)
+    return render(request, 'webapp/partials/side_panel.html', {
+        'item': item, 'updates': updates, 'next_before': next_before,
+    })
+
+@login_required
+def item_updates(request, item_id):
+    """
+    HTMX: the page of an item's updates older than ?before=<update id>, for the side
+    panel's "Load older" button.
+    """
+    from .updates import page
+    item = get_object_or_404(Item.objects.select_related('board__workspace'), id=item_id)
+    if not check_board_access(request.user, item.board):
+        return JsonResponse({'error': 'Permission Denied'}, status=403)
+
+    before = request.GET.get('before', '')
+    if not before.isdigit():
+        from django.http import HttpResponseBadRequest
+        return HttpResponseBadRequest("before must be an update id")
+
+    updates, next_before = page(item, request.user, before=int(before))
+    return render(request, 'webapp/partials/update_page.html', {
+        'item': item, 'updates': updates, 'next_before': next_before,
+    })
+
+@require_POST
+@login_required
+def toggle_update_like(request, update_id):
+    """
+    HTMX: likes or unlikes an update and returns its card with the new count.
+    """
+    from .models import ItemUpdate
+    from .updates import for_viewer, toggle_like
+    update = get_object_or_404(ItemUpdate.objects.select_related('item__board__workspace'), id=update_id)
+    if not check_board_access(request.user, update.item.board):
+        return JsonResponse({'error': 'Permission Denied'}, status=403)
+
+    toggle_like(update, request.user)
+    update = for_viewer(ItemUpdate.objects.filter(pk=update.pk), request.user).get()
+    return render(request, 'webapp/partials/update_card.html', {'update': update})
 
 @require_POST
 @login_required
@@ -754,7 +951,8 @@ def post_item_update(request, item_id):
 @login_required
 def add_group(request, board_id):
     """
-    Adds a new group to the board.
+    Adds a new group to the board. HTMX requests get the new group's section (and the
+    removal of the empty state) instead of a reload of the whole board.
     """
     board = get_object_or_404(Board, id=board_id)
     
@@ -765,21 +963,30 @@ def add_group(request, board_id):
     title = request.POST.get('title', 'New Group')
     
     # Calculate position
-    last_pos = board.groups.last().position if board.groups.exists() else 0
+    group_count = board.groups.count()
+    last_pos = board.groups.last().position if group_count else 0
     
-    Group.objects.create(
+    group = Group.objects.create(
         board=board,
         title=title,
         color='#579bfc', # Default blue
         position=last_pos + 1
     )
     
-    # Refresh page to show new group (simplest for now)
+    if request.headers.get('HX-Request'):
+        return render(request, 'webapp/partials/group_added.html', {
+            'board': board, 'group': group, 'group_index': group_count,
+            'columns': board.columns.all(), 'rows': {},
+        })
     return redirect('board_detail', board_id=board.id)
 
 @require_POST
 @login_required
 def delete_group(request, board_id, group_id):
+    """
+    Deletes a group and its items. HTMX requests remove the section client side and get
+    the empty state back when the board's last group is gone.
+    """
     board = get_object_or_404(Board, id=board_id)
     group = get_object_or_404(Group, id=group_id, board=board)
     
@@ -789,7 +996,9 @@ def delete_group(request, board_id, group_id):
         
     group.delete()
     if request.headers.get('HX-Request'):
-        return HttpResponse('')
+        return render(request, 'webapp/partials/group_deleted.html', {
+            'board': board, 'remaining': board.groups.exists(),
+        })
     return redirect('board_detail', board_id=board.id)
 
 @require_POST
@@ -797,15 +1006,19 @@ def delete_group(request, board_id, group_id):
 def delete_item(request, board_id, item_id):
     board = get_object_or_404(Board, id=board_id)
     # Ensure item belongs to board
-    item = get_object_or_404(Item, id=item_id, group__board=board)
+    item = get_object_or_404(Item.objects.select_related('group'), id=item_id, board=board)
     
     if not verify_edit_permission(request.user, board):
         from django.core.exceptions import PermissionDenied
         raise PermissionDenied("You do not have permission to delete items.")
         
+    group = item.group
     item.delete()
     if request.headers.get('HX-Request'):
-        return HttpResponse('')
+        # The row removes itself (hx-swap="delete"); only the group's item count changes
+        return render(request, 'webapp/partials/group_count.html', {
+            'group': group, 'count': group.items.count(), 'oob': True,
+        })
     return redirect('board_detail', board_id=board.id)
 
 @require_POST
@@ -841,13 +1054,220 @@ def add_column(request, board_id):
     elif col_type == 'priority':
         settings['choices'] = ['High', 'Medium', 'Low']
     
-    Column.objects.create(board=board, title=title, type=col_type, position=position, settings=settings)
-    return redirect('board_detail', board_id=board.id)
+    column = Column.objects.create(board=board, title=title, type=col_type, position=position, settings=settings)
+    if not request.headers.get('HX-Request'):
+        return redirect('board_detail', board_id=board.id)
+
+    # Out-of-band cells for the new column only: a header and footer cell per group and
+    # one cell per item, instead of re-rendering every row of the board.
+    from .cells import ColumnSpec, build_cells
+    spec = ColumnSpec(column)
+    items = Item.objects.filter(board=board).select_related('created_by').only(
+        'id', 'board_id', 'values', 'created_at', 'updated_at', 'created_by__username',
+    )
+    return render(request, 'webapp/partials/column_added.html', {
+        'column': column,
+        'cells': [(item, build_cells(item, [spec])[0]) for item in items],
+        'users': loaders.memberships().load(board.workspace.organization_id),
+    })
+
+
+@login_required
+def item_row(request, board_id, item_id):
+    """
+    One rendered item row, fetched by the board page when the change feed reports an edit.
+    """
+    board = get_object_or_404(Board.objects.select_related('workspace__organization'), id=board_id)
+    if not check_board_access(request.user, board):
+        from django.core.exceptions import PermissionDenied
+        raise PermissionDenied
+    item = get_object_or_404(Item.objects.select_related('group', 'created_by'), id=item_id, board=board)
+    columns = loaders.board_columns().load(board.id)
+    users = loaders.memberships().load(board.workspace.organization_id)
+    from .cells import column_specs, row_context
+    return render(request, 'webapp/partials/item_row_final.html', row_context(item, column_specs(columns), users))
+
+
+def _feed_board(request, board_id):
+    if not request.user.is_authenticated:
+        from django.core.exceptions import PermissionDenied
+        raise PermissionDenied
+    board = get_object_or_404(Board.objects.select_related('workspace__organization'), id=board_id)
+    if not check_board_access(request.user, board):
+        from django.core.exceptions import PermissionDenied
+        raise PermissionDenied
+    return board
+
+
+async def board_changes_stream(request, board_id):
+    """
+    Server-Sent Events feed of the board's change log (see webapp.changes). Resumes after
+    the Last-Event-ID header, else ?since=, otherwise starts at the board's current version.
+    The header wins: a reconnecting EventSource reuses its original URL, so ?since= is only
+    the page-load position while Last-Event-ID is the last event the client actually got.
+    Serve through ASGI so each open feed is a coroutine, not a worker thread.
+    """
+    from asgiref.sync import sync_to_async
+    from django.http import StreamingHttpResponse
+    from .changes import stream
+
+    board = await sync_to_async(_feed_board)(request, board_id)
+    since = request.headers.get('Last-Event-ID') or request.GET.get('since') or ''
+    since = int(since) if since.isdigit() else board.version
+
+    response = StreamingHttpResponse(stream(board.id, since), content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    response['X-Accel-Buffering'] = 'no'  # Disable proxy buffering (nginx)
+    return response
+
+
+@login_required
+def board_changes(request, board_id):
+    """
+    Delta sync: ?since=<seq> returns only the item, group and column changes after that
+    sequence number, or a full snapshot when the change log can no longer cover the gap.
+    """
+    from .changes import delta
+
+    board = get_object_or_404(Board.objects.select_related('workspace__organization'), id=board_id)
+    if not check_board_access(request.user, board):
+        return JsonResponse({'error': 'Permission Denied'}, status=403)
+    since = request.GET.get('since', '')
+    if not since.isdigit():
+        return JsonResponse({'error': 'since must be a sequence number'}, status=400)
+    return JsonResponse(delta(board, int(since)))
 
 
 @login_required
 def get_board_items(request, board_id):
     board = get_object_or_404(Board, id=board_id)
     # Return items for picking (Dependency / Connect logic)
-    items = Item.objects.filter(group__board=board).select_related('group').order_by('group__position', 'id')
+    items = Item.objects.filter(board=board).select_related('group').order_by('group__position', 'id')
     return render(request, 'webapp/partials/board_items_list.html', {'items': items})
+
+@login_required
+def export_board(request, board_id):
+    """
+    Exports the board as CSV or XLSX (?format=csv|xlsx).
+    Rows are streamed from a chunked query; ?background=1 hands the export to Celery
+    and notifies the user when the compressed file is ready.
+    """
+    from django.core.exceptions import PermissionDenied
+    from django.http import FileResponse
+    from .export import iter_csv, write_xlsx, export_filename, XLSX_CONTENT_TYPE
+
+    board = get_object_or_404(Board.objects.select_related('workspace'), id=board_id)
+    if not check_board_access(request.user, board):
+        raise PermissionDenied("You do not have access to this board's workspace.")
+
+    fmt = 'xlsx' if request.GET.get('format') == 'xlsx' else 'csv'
+
+    if request.GET.get('background'):
+        from .tasks import export_board_task
+        export_board_task.delay(board.id, request.user.id, fmt)
+        return JsonResponse({'status': 'queued'}, status=202)
+
+    if fmt == 'xlsx':
+        import tempfile
+        tmp = tempfile.TemporaryFile()
+        write_xlsx(board, tmp)
+        tmp.seek(0)
+        return FileResponse(tmp, as_attachment=True, filename=export_filename(board, 'xlsx'),
+                            content_type=XLSX_CONTENT_TYPE)
+
+    response = StreamingHttpResponse(iter_csv(board), content_type='text/csv')
+    response['Content-Disposition'] = f'attachment; filename="{export_filename(board, "csv")}"'
+    return response
+
+@login_required
+def download_export(request, board_id, token):
+    """
+    Serves a finished background export to users who can still see the board.
+    """
+    from django.core.exceptions import PermissionDenied
+    from django.http import FileResponse, Http404
+    from .export import open_export
+
+    board = get_object_or_404(Board.objects.select_related('workspace'), id=board_id)
+    if not check_board_access(request.user, board):
+        raise PermissionDenied("You do not have access to this board's workspace.")
+
+    export = open_export(board, token)
+    if export is None:
+        raise Http404("This export has expired.")
+    fileobj, filename = export
+    return FileResponse(fileobj, as_attachment=True, filename=filename)
+
+@require_POST
+@login_required
+def import_items(request, board_id):
+    """
+    Bulk-imports items from an uploaded CSV file ('file').
+    Optional 'group_id' sets the target group for rows without a Group column.
+    """
+    from django.contrib import messages
+    from django.core.exceptions import PermissionDenied
+    from .importer import BoardImporter
+
+    board = get_object_or_404(Board.objects.select_related('workspace'), id=board_id)
+    if not verify_edit_permission(request.user, board):
+        raise PermissionDenied("You do not have permission to import items.")
+
+    upload = request.FILES.get('file')
+    if not upload:
+        if request.headers.get('HX-Request'):
+            return JsonResponse({'error': 'A CSV file is required'}, status=400)
+        messages.error(request, 'Please choose a CSV file to import.')
+        return redirect('board_detail', board_id=board.id)
+
+    group = None
+    group_id = request.POST.get('group_id')
+    if group_id:
+        group = get_object_or_404(Group, id=group_id, board=board)
+
+    result = BoardImporter(board, user=request.user, group=group).run(upload.file)
+
+    if request.headers.get('HX-Request'):
+        return JsonResponse(result)
+    messages.success(request, f"Imported {result['created']} items.")
+    return redirect('board_detail', board_id=board.id)
+
+@require_POST
+@login_required
+def bulk_items(request, board_id):
+    """
+    Multi-select operations on a board's items.
+    Payload: {"action": "update" | "move" | "delete", "item_ids": [...],
+              "changes": {column_id: value}  (update), "group_id": id  (move)}
+    """
+    import json
+    from . import bulk
+
+    board = get_object_or_404(Board.objects.select_related('workspace'), id=board_id)
+    if not verify_edit_permission(request.user, board):
+        return JsonResponse({'error': 'Permission Denied'}, status=403)
+
+    try:
+        data = json.loads(request.body)
+    except json.JSONDecodeError:
+        return JsonResponse({'error': 'Invalid JSON'}, status=400)
+
+    action = data.get('action')
+    item_ids = [i for i in data.get('item_ids', []) if str(i).isdigit()]
+    if not item_ids:
+        return JsonResponse({'error': 'item_ids is required'}, status=400)
+
+    if action == 'update':
+        changes = data.get('changes')
+        if not isinstance(changes, dict) or not changes:
+            return JsonResponse({'error': 'changes is required'}, status=400)
+        count = bulk.bulk_update_values(board, item_ids, changes)
+    elif action == 'move':
+        group = get_object_or_404(Group, id=data.get('group_id'), board=board)
+        count = bulk.bulk_move(board, item_ids, group)
+    elif action == 'delete':
+        count = bulk.bulk_delete(board, item_ids)
+    else:
+        return JsonResponse({'error': f'Unknown action: {action}'}, status=400)
+
+    return JsonResponse({'status': 'success', 'count': count})
@@ -0,0 +1,57 @@
+"""
+Read-only JSON API for boards, groups, items and item updates (see webapp.api for
+?fields=, ?cursor= and ?limit=).
+"""
+from django.contrib.auth.decorators import login_required
+from django.shortcuts import get_object_or_404
+
+from .api import (
+    ApiError, BOARD_FIELDS, GROUP_FIELDS, board_data, group_rows, item_page, json_response, parse_fields,
+    update_page,
+)
+from .models import Board, Item
+from .views import check_board_access
+
+
+def _readable_board(request, board_id):
+    board = get_object_or_404(Board.objects.select_related('workspace__organization'), id=board_id)
+    if not check_board_access(request.user, board):
+        raise ApiError('Permission Denied', status=403)
+    return board
+
+
+@login_required
+def board_api(request, board_id):
+    try:
+        board = _readable_board(request, board_id)
+        return json_response(board_data(board, parse_fields(request.GET.get('fields'), BOARD_FIELDS)))
+    except ApiError as e:
+        return json_response({'error': str(e)}, status=e.status)
+
+
+@login_required
+def groups_api(request, board_id):
+    try:
+        board = _readable_board(request, board_id)
+        fields = parse_fields(request.GET.get('fields'), GROUP_FIELDS)
+        return json_response({'results': group_rows(board, fields)})
+    except ApiError as e:
+        return json_response({'error': str(e)}, status=e.status)
+
+
+@login_required
+def items_api(request, board_id):
+    try:
+        return json_response(item_page(_readable_board(request, board_id), request.GET))
+    except ApiError as e:
+        return json_response({'error': str(e)}, status=e.status)
+
+
+@login_required
+def item_updates_api(request, item_id):
+    item = get_object_or_404(Item, id=item_id)
+    try:
+        _readable_board(request, item.board_id)
+        return json_response(update_page(item, request.GET))
+    except ApiError as e:
+        return json_response({'error': str(e)}, status=e.status)